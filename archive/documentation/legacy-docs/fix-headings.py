@@ -1,28 +1,12 @@
 #!/usr/bin/env python3
-import re
+"""fix-headings: now the `fix-headings` ruleset of theme-codemod.py
 
-# Read the file
-with open('/root/APP-YK/frontend/src/pages/SubsidiaryDetail.js', 'r') as f:
-    content = f.read()
+Arguments are passed on, e.g. `fix-headings.py --check` or explicit paths.
+"""
 
-# Fix 1: Fix mb-X" style={{ color: "#FFFFFF" }} to mb-X" style={{ color: "#FFFFFF" }}
-# Pattern: mb" style={{ color: "#FFFFFF" }}-4
-content = re.sub(
-    r'mb"\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}-(\d+)',
-    r'mb-\2" style={{ color: "\1" }}',
-    content
-)
+import sys
 
-# Fix 2: Fix style={{...}} flex items-center"> to style={{...}} className includes flex
-# Pattern: style={{ color: "#FFFFFF" }} flex items-center">
-content = re.sub(
-    r'(className="[^"]*?)"?\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s+flex\s+items-center">',
-    r'\1 flex items-center" style={{ color: "\2" }}>',
-    content
-)
+from theme_codemod.cli import main
 
-# Write the file back
-with open('/root/APP-YK/frontend/src/pages/SubsidiaryDetail.js', 'w') as f:
-    f.write(content)
-
-print("Fixed heading issues in SubsidiaryDetail.js")
+if __name__ == "__main__":
+    sys.exit(main(['run', 'fix-headings', *sys.argv[1:]]))
@@ -1,34 +1,12 @@
 #!/usr/bin/env python3
-import re
+"""fix-subsidiary-detail: now the `fix-subsidiary-detail` ruleset of theme-codemod.py
 
-# Read the file
-with open('/root/APP-YK/frontend/src/pages/SubsidiaryDetail.js', 'r') as f:
-    content = f.read()
+Arguments are passed on, e.g. `fix-subsidiary-detail.py --check` or explicit paths.
+"""
 
-# Fix 1: Fix className with style embedded (e.g., className="block text-sm font-medium style={{ color: "#98989D" }} mb-1")
-# This should be: className="block text-sm font-medium mb-1" style={{ color: "#98989D" }}
-content = re.sub(
-    r'className="([^"]*?)\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
-    r'className="\1 \3" style={{ color: "\2" }}',
-    content
-)
+import sys
 
-# Fix 2: Fix className with only style (e.g., className="style={{ color: "#FFFFFF" }} flex items-center")
-content = re.sub(
-    r'className="style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
-    r'className="\2" style={{ color: "\1" }}',
-    content
-)
+from theme_codemod.cli import main
 
-# Fix 3: Fix any remaining malformed className with style
-content = re.sub(
-    r'className="([^"]*?)"\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s+(\w+)',
-    r'className="\1 \3" style={{ color: "\2" }}',
-    content
-)
-
-# Write the file back
-with open('/root/APP-YK/frontend/src/pages/SubsidiaryDetail.js', 'w') as f:
-    f.write(content)
-
-print("Fixed SubsidiaryDetail.js")
+if __name__ == "__main__":
+    sys.exit(main(['run', 'fix-subsidiary-detail', *sys.argv[1:]]))
@@ -1,26 +1,12 @@
 #!/usr/bin/env python3
-import re
+"""fix-subsidiary-edit: now the `fix-subsidiary-edit` ruleset of theme-codemod.py
 
-# Read the file
-with open('/root/APP-YK/frontend/src/pages/SubsidiaryEdit.js', 'r') as f:
-    content = f.read()
+Arguments are passed on, e.g. `fix-subsidiary-edit.py --check` or explicit paths.
+"""
 
-# Fix 1: className="style={{...}} other-classes" → className="other-classes" style={{...}}
-content = re.sub(
-    r'className="style=\{\{\s*backgroundColor:\s*"([^"]+)",\s*border:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
-    r'className="\3" style={{ backgroundColor: "\1", border: "\2" }}',
-    content
-)
+import sys
 
-# Fix 2: Fix any remaining embedded styles in className
-content = re.sub(
-    r'className="([^"]*?)\s*style=\{\{([^}]+)\}\}\s*([^"]*?)"',
-    r'className="\1 \3" style={{\2}}',
-    content
-)
+from theme_codemod.cli import main
 
-# Write the file back
-with open('/root/APP-YK/frontend/src/pages/SubsidiaryEdit.js', 'w') as f:
-    f.write(content)
-
-print("Fixed SubsidiaryEdit.js")
+if __name__ == "__main__":
+    sys.exit(main(['run', 'fix-subsidiary-edit', *sys.argv[1:]]))
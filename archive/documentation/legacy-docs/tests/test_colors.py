@@ -0,0 +1,77 @@
+"""Color classification and the CSS dark theme (run from legacy-docs: python3 -m pytest tests)"""
+
+import os
+
+import pytest
+
+from theme_codemod import palette, rulesets
+from theme_codemod.rules import apply_rules
+
+GRAYS = ['#ffffff', '#f9fafb', '#e5e7eb', '#cbd5e1', '#6b7280', '#374151', '#111827', '#38383a']
+TINTS = ['#f8d7da', '#f5c6cb', '#fee2e2', '#d1fae5', '#dbeafe', '#fef3c7', '#fef9c3', '#a7f3d0']
+
+
+@pytest.mark.parametrize('color', GRAYS)
+def test_grays_are_neutral(color):
+    assert palette.is_neutral(color)
+
+
+@pytest.mark.parametrize('color', TINTS + ['#0a84ff', '#dc2626'])
+def test_tints_and_accents_are_not_neutral(color):
+    assert not palette.is_neutral(color)
+
+
+def css_dark_theme(css):
+    rules = rulesets.load('css-dark-theme').rules_for('page.css')
+    return apply_rules(css, rules)[0]
+
+
+def test_status_tints_are_left_alone():
+    css = '.error-alert {\n  background: #f8d7da;\n  border: 2px solid #f5c6cb;\n}\n'
+    assert css_dark_theme(css) == css
+
+
+def test_grays_become_dark():
+    css = '.card {\n  background: #f9fafb;\n  border: 1px solid #e9ecef;\n  color: #111827;\n}\n'
+    assert css_dark_theme(css) == (
+        '.card {\n  background: #1C1C1E;\n  border: 1px solid #38383A;\n  color: #FFFFFF;\n}\n'
+    )
+
+
+def converted(*pairs):
+    colors = pytest.importorskip('theme_codemod.colors')
+    if colors.np is None:
+        pytest.skip("needs NumPy")
+    return colors.convert([h for _, h in pairs], [role for role, _ in pairs])
+
+
+@pytest.mark.parametrize('color', ['#fef9c3', '#fef08a', '#fef3c7', '#a7f3d0', '#bbf7d0', '#f8d7da', '#fee2e2'])
+def test_light_tint_backgrounds_become_dark_tints(color):
+    dark, = converted(('background', color))
+    assert dark not in palette.ACCENTS
+    lightness, a, b = palette.oklab(dark.lower())
+    assert lightness < 0.5 and (a * a + b * b) ** 0.5 > palette.TINT_CHROMA
+    # Same hue as the light tint, within a few degrees
+    _, a0, b0 = palette.oklab(color)
+    assert a * a0 + b * b0 > 0.99 * (a * a + b * b) ** 0.5 * (a0 * a0 + b0 * b0) ** 0.5
+
+
+def test_saturated_fills_still_become_accents():
+    assert converted(('background', '#ffc107'), ('background', '#059669')) == ['#FFD60A', '#30D158']
+
+
+def test_palette_colors_pass_through():
+    assert converted(('background', '#38383a'), ('border', '#2c2c2e'), ('text', '#98989d'),
+                     ('background', '#0a84ff')) == ['#38383A', '#2C2C2E', '#98989D', '#0A84FF']
+
+
+def test_white_surfaces_still_turn_dark():
+    assert converted(('background', '#ffffff'), ('border', '#ffffff')) == ['#2C2C2E', '#38383A']
+
+
+def test_write_table_is_atomic(tmp_path):
+    colors = pytest.importorskip('theme_codemod.colors')
+    path = tmp_path / 'color_table.json'
+    colors.write_table({'colors': {}}, str(path))
+    assert path.read_text() == '{\n "colors": {}\n}\n'
+    assert os.listdir(tmp_path) == ['color_table.json']
@@ -0,0 +1,50 @@
+"""Where the daemon's socket may live (run from legacy-docs: python3 -m pytest tests)"""
+
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from theme_codemod import daemon
+
+
+def test_private_dir_is_created_private(tmp_path):
+    path = str(tmp_path / 'run')
+    daemon.private_dir(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o700
+    daemon.private_dir(path)  # and accepted again
+
+
+def test_shared_dir_is_refused(tmp_path):
+    path = tmp_path / 'run'
+    path.mkdir(mode=0o777)
+    os.chmod(path, 0o777)
+    with pytest.raises(OSError):
+        daemon.private_dir(str(path))
+
+
+def test_existing_file_is_not_replaced(tmp_path):
+    path = tmp_path / 'daemon.sock'
+    path.write_text('not a socket')
+    with pytest.raises(OSError, match='not a socket'):
+        daemon.serve(str(path))
+    assert path.read_text() == 'not a socket'
+
+
+def test_socket_is_private(tmp_path):
+    path = str(tmp_path / 'daemon.sock')
+    thread = threading.Thread(target=daemon.serve, args=(path,), daemon=True)
+    thread.start()
+    for _ in range(200):
+        if os.path.exists(path):
+            break
+        time.sleep(0.01)
+    try:
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert daemon.request(path, {'op': 'ping'})['ok']
+    finally:
+        daemon.request(path, {'op': 'shutdown'})
+        thread.join(5)
+    assert not os.path.exists(path)
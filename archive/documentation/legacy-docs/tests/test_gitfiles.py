@@ -0,0 +1,69 @@
+"""read_index against git itself (run from legacy-docs: python3 -m pytest tests)"""
+
+import os
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from theme_codemod import gitfiles
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="needs git")
+
+
+def git(repo, *args):
+    return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, 'init', '-q')
+    # Shared prefixes exercise index v4 path compression
+    for name in ('src/pages/A.js', 'src/pages/AB.js', 'src/pages/Admin.js', 'src/pages/b/c.js',
+                 'src/components/Card.js', 'README.md', 'src/index.css'):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'// {name}\n')
+    os.symlink('A.js', tmp_path / 'src/pages/link.js')
+    git(tmp_path, 'add', '.')
+    return tmp_path
+
+
+def ls_files(repo):
+    """{path: blob id} of the stage 0 entries, as git lists them"""
+    entries = {}
+    for line in git(repo, 'ls-files', '-s', '-z').split(b'\0'):
+        if not line:
+            continue
+        info, name = line.split(b'\t', 1)
+        mode, blob, stage = info.split()
+        if stage == b'0' and mode in (b'100644', b'100755', b'120000'):
+            entries[os.fsdecode(name)] = blob.decode()
+    return entries
+
+
+def index_version(repo):
+    with open(repo / '.git' / 'index', 'rb') as f:
+        return struct.unpack('>4sI', f.read(8))[1]
+
+
+@pytest.mark.parametrize('version', [2, 3, 4])
+def test_read_index_matches_ls_files(repo, version):
+    if version == 3:
+        # Extended flags (intent-to-add) are what makes git write version 3
+        (repo / 'src/pages/New.js').write_text('// new\n')
+        git(repo, 'add', '-N', 'src/pages/New.js')
+    git(repo, 'update-index', '--index-version', str(version))
+    assert index_version(repo) == version
+
+    entries = gitfiles.read_index(repo / '.git' / 'index')
+    assert {name: entry[0] for name, entry in entries.items()} == ls_files(repo)
+    assert entries['src/pages/A.js'][1] == len('// src/pages/A.js\n')
+
+
+def test_read_staged(repo):
+    (repo / 'src/pages/A.js').write_text('// edited, not staged\n')
+    paths = [str(repo / 'src/pages/A.js'), str(repo / 'src/untracked.js')]
+    (repo / 'src/untracked.js').write_text('')
+    assert gitfiles.read_staged(paths) == {paths[0]: b'// src/pages/A.js\n'}
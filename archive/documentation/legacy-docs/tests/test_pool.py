@@ -0,0 +1,85 @@
+"""Time budgets in the worker pool and the quarantine list (run from legacy-docs: python3 -m pytest tests)"""
+
+import os
+import sys
+import time
+import types
+
+import pytest
+
+from theme_codemod import rulesets, runner
+from theme_codemod.quarantine import Quarantine
+from theme_codemod.rules import Literal, Transform
+
+
+def hang(content):
+    if 'HANG' in content:
+        time.sleep(30)
+    return content
+
+
+@pytest.fixture
+def ruleset(monkeypatch):
+    # Workers are forked and load the ruleset by name, so register it like a real one
+    if not hasattr(os, 'fork'):
+        pytest.skip("needs fork to hand the test ruleset to workers")
+    module = types.ModuleType('theme_codemod.rulesets._hang_test')
+    module.TARGETS = []
+    module.RULES = [
+        Literal('hang-test/bg', 'bg-white', 'bg-gray-900'),
+        Transform('hang-test/hang', hang),
+    ]
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setitem(rulesets.RULESETS, 'hang-test', '_hang_test')
+    return rulesets.load('hang-test')
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for name, text in [('A.jsx', '<div className="bg-white" />\n'),
+                       ('Hang.jsx', '<div className="bg-white" /> {/* HANG */}\n'),
+                       ('B.jsx', '<p className="bg-white" />\n')]:
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(str(path))
+    return paths
+
+
+def by_name(results):
+    return {os.path.basename(result.path): result for result in results}
+
+
+@pytest.mark.parametrize('budgets, diagnostic', [
+    ({'file_budget': 0.5}, "file ran over its 0.5s budget (in rule hang-test/hang)"),
+    ({'rule_budget': 0.5}, "rule hang-test/hang ran over its 0.5s budget"),
+])
+def test_budget_quarantines_the_file(ruleset, files, budgets, diagnostic):
+    begin = time.monotonic()
+    results = by_name(runner.run(ruleset, files, jobs=2, **budgets))
+    assert time.monotonic() - begin < 10
+    assert results['Hang.jsx'].quarantined == diagnostic
+    # The killed worker never wrote, the others carried on
+    assert 'bg-white' in open(files[1]).read()
+    for name in ('A.jsx', 'B.jsx'):
+        assert results[name].changed and not results[name].quarantined
+    assert 'bg-gray-900' in open(files[0]).read()
+
+
+def test_quarantined_file_is_skipped_until_edited(ruleset, files, tmp_path):
+    quarantine = Quarantine(str(tmp_path / 'quarantine.json'))
+    runner.run(ruleset, files[1:2], jobs=1, file_budget=0.5, quarantine=quarantine)
+    quarantine.save()
+
+    quarantine = Quarantine(str(tmp_path / 'quarantine.json'))
+    assert [spec for _, spec, _ in quarantine.items()] == ['hang-test']
+    begin = time.monotonic()
+    result, = runner.run(ruleset, files[1:2], jobs=1, file_budget=0.5, quarantine=quarantine)
+    assert time.monotonic() - begin < 0.5
+    assert result.quarantined.startswith("still quarantined: file ran over")
+
+    with open(files[1], 'w') as f:
+        f.write('<div className="bg-white" />\n')
+    assert quarantine.reason(files[1], 'hang-test') is None
+    result, = runner.run(ruleset, files[1:2], jobs=1, file_budget=0.5, quarantine=quarantine)
+    assert result.changed and not result.quarantined
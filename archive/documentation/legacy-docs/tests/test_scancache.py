@@ -0,0 +1,76 @@
+"""Scan pack persistence: reopen, torn writes, recency (run from legacy-docs: python3 -m pytest tests)"""
+
+import os
+
+from theme_codemod.jsx_scan import scan
+from theme_codemod.scancache import HEADER, RECORD, ScanCache, content_key
+
+
+def source(i):
+    return f'<div className="card-{i} p-{i}">\n  <input type="text" className="w-full" />\n</div>\n'
+
+
+def same_scan(result, content):
+    expected = scan(content)
+    return (result.tags == expected.tags and result.attrs == expected.attrs
+            and result.classes == expected.classes)
+
+
+def test_reopen_hits(tmp_path):
+    path = str(tmp_path / 'scan.pack')
+    with ScanCache(path) as cache:
+        for i in range(5):
+            cache.scan(source(i))
+    with ScanCache(path) as cache:
+        for i in range(5):
+            result = cache.get(source(i))
+            assert result is not None and same_scan(result, source(i))
+        assert cache.hits == 5
+
+
+def test_torn_tail_never_returns_wrong_data(tmp_path):
+    path = str(tmp_path / 'scan.pack')
+    with ScanCache(path) as cache:
+        cache.scan(source(0))
+        cache.scan(source(1))
+    # A crash in the middle of the last append
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 7)
+
+    with ScanCache(path) as cache:
+        assert cache.get(source(1)) is None
+        for i in range(2, 6):
+            cache.scan(source(i))
+    with ScanCache(path) as cache:
+        for i in (0, 2, 3, 4, 5):
+            result = cache.get(source(i))
+            assert result is not None and same_scan(result, source(i)), i
+        assert cache.hits == 5
+
+
+def test_corrupt_payload_is_a_miss(tmp_path):
+    path = str(tmp_path / 'scan.pack')
+    with ScanCache(path) as cache:
+        cache.scan(source(0))
+    with open(path, 'r+b') as f:
+        f.seek(len(HEADER) + RECORD.size + 12)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xff]))
+    with ScanCache(path) as cache:
+        assert cache.get(source(0)) is None
+        assert cache.misses == 1
+
+
+def test_recency_survives_reopen(tmp_path):
+    path = str(tmp_path / 'scan.pack')
+    with ScanCache(path) as cache:
+        for i in range(4):
+            cache.scan(source(i))
+    # Hits in separate runs must reorder the index the next run loads
+    with ScanCache(path) as cache:
+        cache.get(source(0))
+    with ScanCache(path) as cache:
+        cache.get(source(2))
+    with ScanCache(path) as cache:
+        assert list(cache.index) == [content_key(source(i)) for i in (1, 3, 0, 2)]
@@ -0,0 +1,49 @@
+"""Selector syntax and what it matches (run from legacy-docs: python3 -m pytest tests)"""
+
+import pytest
+
+from theme_codemod.selectors import SelectorError, compile_selector
+
+BAD = [
+    ('div >> input', "Misplaced '>'"),
+    ('div > > input', "Misplaced '>'"),
+    ('> input', "Misplaced '>'"),
+    ('div >', "Incomplete"),
+    (', input', "Misplaced ','"),
+    ('div, , input', "Misplaced ','"),
+    ('input,', "Incomplete"),
+    ('input:not(.a .b)', "no combinators"),
+    ('input:not(.a > .b)', "no combinators"),
+    ('input:not(.a', "Unclosed :not"),
+    ('input:not()', "Empty :not"),
+    ('input)', "Unbalanced"),
+    ('input ~ span', "Unexpected"),
+]
+
+JSX = '''<form>
+  <div className="row">
+    <label><span className="text-gray-700">Name</span></label>
+    <input className="w-full" />
+    <input className="w-full" style={dark} />
+  </div>
+  <span className="text-gray-700">Outside</span>
+</form>
+'''
+
+
+@pytest.mark.parametrize('source, message', BAD)
+def test_bad_selectors(source, message):
+    with pytest.raises(SelectorError, match=message):
+        compile_selector(source)
+
+
+@pytest.mark.parametrize('source, count', [
+    ('input.w-full:not([style])', 1),
+    ('input[style]', 1),
+    ('form span.text-gray-700', 2),
+    ('label > span.text-gray-700', 1),
+    ('form > span', 1),
+    ('div>input, label > span', 3),
+])
+def test_matches(source, count):
+    assert len(compile_selector(source).select(JSX)) == count
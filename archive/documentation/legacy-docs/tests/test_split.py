@@ -0,0 +1,28 @@
+"""Which rules may run on segments of a split file (run from legacy-docs: python3 -m pytest tests)"""
+
+import pytest
+
+from theme_codemod.rules import Literal, Rule, Transform
+from theme_codemod.split import local_prefix, matches_newline
+
+
+@pytest.mark.parametrize('pattern', [r'\S+', r'[\S]', r'className="[^"\n]*"', r'\w+=\d', r'(?m)^ *$'])
+def test_line_local_patterns(pattern):
+    assert not matches_newline(pattern)
+
+
+@pytest.mark.parametrize('pattern', [r'\s+', r'\n', r'[^>]*', r'[^\S]', r'\W', r'\D', r'(?s)<div.*?>'])
+def test_patterns_across_lines(pattern):
+    assert matches_newline(pattern)
+
+
+def test_local_prefix_stops_at_first_non_local_rule():
+    rules = [
+        Rule('a', r'bg-white', 'bg-gray-900'),
+        Literal('b', 'text-black', 'text-white'),
+        Transform('c', lambda content: (content, 0)),
+        Rule('d', r'border-gray-200', 'border-gray-700'),
+    ]
+    assert local_prefix(rules) == 2
+    assert local_prefix(rules[3:]) == 1
+    assert local_prefix(rules[2:]) == 0
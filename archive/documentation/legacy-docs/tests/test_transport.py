@@ -0,0 +1,67 @@
+"""Round trips through the pool's edit transport (run from legacy-docs: python3 -m pytest tests)"""
+
+import random
+
+import pytest
+
+from theme_codemod.transport import edited, line_edits, write_edits
+
+CASES = [
+    (b'', b''),
+    (b'', b'a\n'),
+    (b'a\n', b''),
+    (b'a\nb\nc\n', b'a\nB\nc\n'),
+    (b'a\nb\nc\n', b'a\nc\n'),
+    (b'a\nc\n', b'a\nb\nc\n'),
+    (b'x\n', b'y\nx\n'),
+    (b'x\n', b'x\ny\n'),
+    (b'no newline at end', b'no newline at the end'),
+    (b'a\r\nb\r\n', b'a\r\nbb\r\n'),
+    (b'same\nsame\nsame\n', b'same\nother\nsame\nsame\n'),
+    ('café <div>\n'.encode(), 'café <div style={{}}>\n'.encode()),
+]
+
+
+def roundtrip(tmp_path, old, new):
+    path = tmp_path / 'out'
+    edits = line_edits(old, new)
+    write_edits(path, old, len(old), edits)
+    return path.read_bytes(), edits
+
+
+@pytest.mark.parametrize('old, new', CASES)
+def test_write_edits_roundtrip(tmp_path, old, new):
+    written, edits = roundtrip(tmp_path, old, new)
+    assert written == new
+    assert edited(old, 0, len(old), edits) == new
+
+
+def test_unchanged_has_no_edits():
+    assert line_edits(b'a\nb\n', b'a\nb\n') == []
+
+
+def test_edits_are_trimmed():
+    assert line_edits(b'<input className="x" />\n', b'<input className="x" style={s} />\n') == [
+        (21, 0, b'style={s} ')
+    ]
+
+
+def test_base_offset():
+    old = b'header\nbody\n'
+    edits = line_edits(old[7:], b'BODY\n', base=7)
+    assert edited(old, 0, len(old), edits) == b'header\nBODY\n'
+
+
+def test_random_roundtrips(tmp_path):
+    rng = random.Random(1)
+    words = [b'a', b'b', b'<div>', b'</div>', b'x y', b'']
+    for _ in range(300):
+        old = [rng.choice(words) for _ in range(rng.randrange(12))]
+        new = [word for word in old if rng.random() > 0.2]
+        for _ in range(rng.randrange(3)):
+            new.insert(rng.randrange(len(new) + 1), rng.choice(words))
+        new = [word + b'!' if rng.random() < 0.2 else word for word in new]
+        old_bytes = b'\n'.join(old) + rng.choice([b'', b'\n'])
+        new_bytes = b'\n'.join(new) + rng.choice([b'', b'\n'])
+        written, _ = roundtrip(tmp_path, old_bytes, new_bytes)
+        assert written == new_bytes, (old_bytes, new_bytes)
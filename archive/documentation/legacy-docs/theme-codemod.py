@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Theme codemod CLI; the fix scripts in this folder are now shims that call it
+
+Examples:
+  python3 theme-codemod.py list
+  python3 theme-codemod.py run final-dark-cleanup
+  python3 theme-codemod.py run fix-react-styles frontend/src/pages/SubsidiaryDetail.js
+"""
+
+import sys
+
+from theme_codemod.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
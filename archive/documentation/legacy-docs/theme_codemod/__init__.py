@@ -0,0 +1,4 @@
+"""
+Theme codemod toolkit
+Shared engine behind the dark theme fix scripts in this folder
+"""
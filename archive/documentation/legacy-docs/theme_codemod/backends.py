@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Regex backends for theme codemod rules
+
+Every rule can run on stdlib `re`, the `regex` package or RE2 (`re2`)
+when they are installed. The backend for a rule is chosen by a small
+calibration benchmark and the choice is cached on disk, so later runs
+only pay a JSON read. Patterns that use features a backend lacks
+(lookarounds, backreferences) fall back to a backend that has them.
+"""
+
+import importlib
+import os
+import re
+import sys
+import time
+
+from .cachedir import cache_path, write_json
+
+CACHE_PATH = cache_path('backends.json')
+
+# Flags are passed as inline groups so every engine reads them the same way
+INLINE_FLAGS = (
+    (re.IGNORECASE, 'i'),
+    (re.MULTILINE, 'm'),
+    (re.DOTALL, 's'),
+)
+
+# RE2 is linear-time because it has no lookarounds and no backreferences
+LOOKAROUND = re.compile(r'\(\?<?[=!]')
+BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Synthetic JSX used for calibration, shaped like the pages we rewrite
+SAMPLE_SNIPPET = '''
+      <div className="bg-white rounded-lg shadow-sm border border-gray-200 mb-8">
+        <label className="block text-sm font-medium text-gray-700 mb-1">Nama</label>
+        <input
+          type="text"
+          value={formData.name}
+          onChange={(e) => handleChange('name', e.target.value)}
+          className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2"
+        />
+        <p className="text-gray-600" style={{ color: "#98989D" }}>Memuat data...</p>
+        <select className="w-full px-3 py-2 bg-white border rounded-lg" value={status}>
+          <option value="active">Aktif</option>
+        </select>
+      </div>
+'''
+SAMPLE_REPEAT = 64
+MEASURE_ROUNDS = 3
+
+_backends = None
+_calibration = None
+# Lookups in the calibration cache, for the run metrics
+calibration_stats = {'hits': 0, 'misses': 0}
+
+
+def inline_flags(pattern, flags=0):
+    """Prefix pattern with inline flag groups for the given re flags"""
+    letters = ''.join(letter for flag, letter in INLINE_FLAGS if flags & flag)
+    return f'(?{letters}){pattern}' if letters else pattern
+
+
+class Backend:
+    """Thin wrapper around one regex engine module"""
+
+    name = None
+    module_name = None
+
+    def __init__(self, origin=None):
+        self.origin = origin
+        self._module = None
+        self._compiled = {}
+
+    @property
+    def module(self):
+        # Importing `regex` alone costs ~10 ms, so engines are only loaded
+        # once a rule actually runs on them
+        if self._module is None:
+            self._module = importlib.import_module(self.module_name)
+        return self._module
+
+    @property
+    def version(self):
+        """Install fingerprint used to invalidate the calibration cache"""
+        if not self.origin:
+            return sys.version.split()[0]
+        try:
+            return f'{os.stat(self.origin).st_mtime_ns}'
+        except OSError:
+            return self.origin
+
+    def supports(self, pattern, flags=0):
+        """Return True if this engine can compile the pattern"""
+        try:
+            self.compile(pattern, flags)
+        except Exception:
+            return False
+        return True
+
+    def compile(self, pattern, flags=0):
+        key = (pattern, flags)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self.module.compile(inline_flags(pattern, flags))
+            self._compiled[key] = compiled
+        return compiled
+
+
+class StdlibBackend(Backend):
+    name = 're'
+    module_name = 're'
+
+
+class RegexBackend(Backend):
+    name = 'regex'
+    module_name = 'regex'
+
+
+class RE2Backend(Backend):
+    name = 're2'
+    module_name = 're2'
+
+    def supports(self, pattern, flags=0):
+        # Some re2 wrappers silently fall back to `re` for unsupported
+        # syntax, which would hide exponential backtracking behind "re2"
+        if LOOKAROUND.search(pattern) or BACKREFERENCE.search(pattern):
+            return False
+        return super().supports(pattern, flags)
+
+
+BACKEND_CLASSES = (StdlibBackend, RegexBackend, RE2Backend)
+
+
+def available_backends():
+    """Return installed backends, stdlib `re` always first"""
+    global _backends
+    if _backends is None:
+        import importlib.util
+
+        _backends = [StdlibBackend()]
+        for cls in BACKEND_CLASSES[1:]:
+            spec = importlib.util.find_spec(cls.module_name)
+            if spec is not None:
+                _backends.append(cls(spec.origin))
+    return _backends
+
+
+def get_backend(name):
+    for backend in available_backends():
+        if backend.name == name:
+            return backend
+    raise KeyError(f"Regex backend not installed: {name}")
+
+
+def _pattern_key(pattern, flags):
+    return f'{flags}:{pattern}'
+
+
+def _environment_key():
+    return ';'.join(f'{b.name}={b.version}' for b in available_backends())
+
+
+def _load_calibration():
+    global _calibration
+    if _calibration is None:
+        import json
+
+        _calibration = {'environment': _environment_key(), 'patterns': {}, 'dirty': False}
+        try:
+            with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('environment') == _calibration['environment']:
+                _calibration['patterns'] = cached.get('patterns', {})
+        except (OSError, ValueError):
+            pass
+    return _calibration
+
+
+def save_calibration():
+    """Write new calibration results back to the cache file"""
+    if _calibration is None or not _calibration['dirty']:
+        return
+    calibration = _calibration
+    try:
+        write_json(CACHE_PATH, {
+            'environment': calibration['environment'],
+            'patterns': calibration['patterns'],
+        }, indent=1, sort_keys=True)
+        calibration['dirty'] = False
+    except OSError as e:
+        print(f"⚠️  Could not save regex calibration: {e}", file=sys.stderr)
+
+
+def measure(backend, pattern, flags=0, sample=None):
+    """Return scan throughput of one backend on one pattern in MB/s"""
+    if sample is None:
+        sample = SAMPLE_SNIPPET * SAMPLE_REPEAT
+    compiled = backend.compile(pattern, flags)
+    size = len(sample.encode('utf-8'))
+    best = None
+    for _ in range(MEASURE_ROUNDS):
+        start = time.perf_counter()
+        for _ in compiled.finditer(sample):
+            pass
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return size / max(best, 1e-9) / 1e6
+
+
+def calibrate(pattern, flags=0):
+    """Benchmark every backend that supports the pattern and cache the winner"""
+    calibration = _load_calibration()
+    key = _pattern_key(pattern, flags)
+    entry = calibration['patterns'].get(key)
+    if entry is not None:
+        calibration_stats['hits'] += 1
+        return entry
+    calibration_stats['misses'] += 1
+
+    throughput = {}
+    for backend in available_backends():
+        if backend.supports(pattern, flags):
+            throughput[backend.name] = round(measure(backend, pattern, flags), 2)
+
+    entry = {
+        'backend': max(throughput, key=throughput.get) if throughput else 're',
+        'throughput': throughput,
+    }
+    calibration['patterns'][key] = entry
+    calibration['dirty'] = True
+    return entry
+
+
+def select_backend(pattern, flags=0, preferred=None):
+    """
+    Return the backend a rule should run on.
+
+    `preferred` forces a backend by name; it still falls back to the
+    calibrated choice when that engine cannot compile the pattern.
+    """
+    if preferred:
+        try:
+            backend = get_backend(preferred)
+        except KeyError:
+            backend = None
+        if backend is not None and backend.supports(pattern, flags):
+            return backend
+    if len(available_backends()) == 1:
+        return available_backends()[0]
+    return get_backend(calibrate(pattern, flags)['backend'])
+
+
+def throughput_report(rules):
+    """Return (rule_id, selected backend, {backend: MB/s}) rows for regex rules"""
+    rows = []
+    for rule in rules:
+        pattern = getattr(rule, 'pattern', None)
+        if pattern is None:
+            continue
+        entry = calibrate(pattern, rule.flags)
+        rows.append((rule.id, entry['backend'], entry['throughput']))
+    save_calibration()
+    return rows
+
+
+def print_throughput_report(rules):
+    print("⚡ Regex backend throughput (MB/s)")
+    print(f"   Installed: {', '.join(b.name for b in available_backends())}\n")
+    totals = {}
+    for rule_id, selected, throughput in throughput_report(rules):
+        cells = '  '.join(
+            f"{name}={speed:.1f}{'*' if name == selected else ''}"
+            for name, speed in sorted(throughput.items())
+        )
+        print(f"  {rule_id:<40} {cells}")
+        for name, speed in throughput.items():
+            totals.setdefault(name, []).append(speed)
+    print()
+    for name, speeds in sorted(totals.items()):
+        print(f"📊 {name}: mean {sum(speeds) / len(speeds):.1f} MB/s over {len(speeds)} rules")
+
+
+def main():
+    from .rulesets import all_rules
+
+    print_throughput_report(all_rules())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Where the persistent caches live and how they are replaced
+
+Every cache (scan.pack, backends.json, quarantine.json, clean.json) is a
+file in $XDG_CACHE_HOME/theme-codemod, ~/.cache/theme-codemod by default.
+They (and color_table.json) are rewritten through a temporary file
+named after the writing process and then renamed over the old one, so a
+pre-commit run and the daemon saving at the same time never write into
+the same temporary file.
+"""
+
+import os
+
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'theme-codemod',
+)
+
+
+def cache_path(name):
+    return os.path.join(CACHE_DIR, name)
+
+
+def temp_path(path):
+    """A temporary name next to path that no other process uses"""
+    return f'{path}.{os.getpid()}.tmp'
+
+
+def write_json(path, value, **options):
+    """Replace path with value as JSON, atomically"""
+    import json
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = temp_path(path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, **options)
+        f.write('\n')
+    os.replace(tmp_path, path)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+className canonicalization
+
+The cleanup scripts delete classes by replacing them with '', which
+leaves double spaces, className="" and duplicated tokens behind. This
+pass puts every className back into one canonical form:
+
+- plain strings ("...", '...', {"..."}): tokens deduplicated and sorted,
+  plain utilities first, then variants (hover:, md:, ...), each
+  alphabetically; order inside the attribute does not affect the cascade
+- template literals: whitespace collapsed and complete tokens
+  deduplicated, but never reordered across ${...} and a token glued to
+  an expression (bg-${color}-500) is left alone
+- empty attributes are removed together with the whitespace before them
+
+Identical class sets end up as identical strings, which is also what
+makes the built chunks smaller.
+"""
+
+import re
+
+from .jsx_scan import CLASS_ATTRS, JS_STRING, TEMPLATE_STOP, scan, skip_braces
+
+VARIANTS = re.compile(r'((?:[\w-]+:)*)(.*)', re.DOTALL)
+EMPTY_VALUES = ('""', "''", '{""}', "{''}", '{``}')
+CHUNK_CLASSNAME = re.compile(r'className:(?:"[^"\\]*"|`[^`\\$]*`)')
+
+
+def sort_key(token):
+    variants, base = VARIANTS.fullmatch(token).groups()
+    return (bool(variants), variants, base)
+
+
+def canonical_tokens(text):
+    """'b  a b hover:x' -> 'a b hover:x'"""
+    return ' '.join(sorted(dict.fromkeys(text.split()), key=sort_key))
+
+
+def canonical_template(template):
+    """Normalize the static parts of a template literal, `...` included"""
+    parts = []  # static text, ${...} expression, static text, ...
+    pos = 1
+    segment_start = 1
+    end = len(template) - 1
+    while pos < end:
+        match = TEMPLATE_STOP.search(template, pos, end)
+        if match is None:
+            break
+        if match.group(0) == '${':
+            close = skip_braces(template, match.start() + 1)
+            if close < 0 or close > end:
+                return template
+            parts.append(template[segment_start:match.start()])
+            parts.append(template[match.start():close])
+            pos = segment_start = close
+        elif match.group(0).startswith('\\'):
+            return template  # escapes: leave it to a human
+        else:
+            pos = match.end()
+    parts.append(template[segment_start:end])
+
+    seen = set()
+    last = len(parts) - 1
+    for i in range(0, len(parts), 2):
+        text = parts[i]
+        tokens = text.split()
+        # A token touching an expression is only part of a class name
+        glued_left = i > 0 and tokens and not text[:1].isspace()
+        glued_right = i < last and tokens and not text[-1:].isspace()
+        kept = []
+        for j, token in enumerate(tokens):
+            partial = (j == 0 and glued_left) or (j == len(tokens) - 1 and glued_right)
+            if partial or token not in seen:
+                kept.append(token)
+                if not partial:
+                    seen.add(token)
+        lead = ' ' if i > 0 and text[:1].isspace() else ''
+        trail = ' ' if i < last and text[-1:].isspace() else ''
+        if not kept:
+            # Only a part between two expressions still separates something
+            parts[i] = ' ' if 0 < i < last and (lead or trail) else ''
+        else:
+            parts[i] = lead + ' '.join(kept) + trail
+    return '`' + ''.join(parts) + '`'
+
+
+def canonical_value(value):
+    """Return the canonical form of one className value, '' to drop it, or None"""
+    if value in EMPTY_VALUES:
+        return ''
+    quote = value[:1]
+    if quote in '"\'' and value.endswith(quote) and len(value) >= 2:
+        tokens = canonical_tokens(value[1:-1])
+        return f'{quote}{tokens}{quote}' if tokens else ''
+    if quote != '{' or not value.endswith('}'):
+        return None
+    inner = value[1:-1].strip()
+    if JS_STRING.fullmatch(inner):
+        if '\\' in inner:
+            return None
+        tokens = canonical_tokens(inner[1:-1])
+        return f'{{{inner[0]}{tokens}{inner[0]}}}' if tokens else ''
+    if inner.startswith('`') and inner.endswith('`') and len(inner) >= 2:
+        template = canonical_template(inner)
+        if template in ('``', '` `'):
+            return ''
+        return '{' + template + '}'
+    return None
+
+
+def value_changes(content, result=None):
+    """Yield (name_start, value_start, value_end, new_value) per className to rewrite"""
+    result = result or scan(content)
+    attrs = result.attrs
+    for index, _, name, value_start, value_end in result.iter_attrs():
+        if name not in CLASS_ATTRS or value_end <= value_start:
+            continue
+        value = content[value_start:value_end]
+        new_value = canonical_value(value)
+        if new_value is not None and new_value != value:
+            yield attrs[index * 5 + 1], value_start, value_end, new_value
+
+
+def canonical_edits(content, result=None):
+    """
+    Return [(start, end, replacement)] for the className values of content.
+
+    Dropped attributes cover the whitespace before the name as well.
+    """
+    edits = []
+    for name_start, value_start, value_end, new_value in value_changes(content, result):
+        if new_value:
+            edits.append((value_start, value_end, new_value))
+            continue
+        start = name_start
+        while start > 0 and content[start - 1].isspace():
+            start -= 1
+        edits.append((start, value_end, ''))
+    return edits
+
+
+def apply_edits(content, edits):
+    out = []
+    pos = 0
+    for start, end, replacement in sorted(edits):
+        if start < pos:
+            continue  # overlapping (tag inside a prop): keep the outer edit
+        out.append(content[pos:start])
+        out.append(replacement)
+        pos = end
+    out.append(content[pos:])
+    return ''.join(out)
+
+
+def canonicalize(content):
+    edits = canonical_edits(content)
+    return apply_edits(content, edits) if edits else content
+
+
+def chunk_literal(value):
+    """How a className value shows up in a minified chunk: className:"..." """
+    if value.startswith('{'):
+        value = value[1:-1].strip()
+    if value[:1] in '"\'':
+        value = '"' + value[1:-1] + '"'
+    return 'className:' + value
+
+
+def chunk_savings(changes, chunks):
+    """
+    Estimate bytes saved in built JS chunks.
+
+    `changes` maps old className values to new ones ('' when dropped).
+    Minified React output keeps className:"..." props as written, so
+    every occurrence of an old value counts against its new one.
+    """
+    replacements = {}
+    for old, new in changes.items():
+        old_literal = chunk_literal(old)
+        replacements[old_literal] = chunk_literal(new) if new else ''
+    saved = 0
+    for chunk in chunks:
+        for match in CHUNK_CLASSNAME.finditer(chunk):
+            new = replacements.get(match.group(0))
+            if new is not None:
+                saved += len(match.group(0).encode('utf-8')) - len(new.encode('utf-8'))
+    return saved
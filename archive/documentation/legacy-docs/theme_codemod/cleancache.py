@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Git blobs a ruleset is known to leave unchanged
+
+In --staged and --since runs a file whose blob id (see gitfiles.py) was
+already found clean under the same ruleset is skipped without being
+read. Entries are keyed by the hash of this package's code and the
+color table, so editing a rule invalidates them all. The list lives
+next to the other caches as clean.json and keeps the newest MAX_ENTRIES.
+"""
+
+import hashlib
+import json
+import os
+
+from .cachedir import cache_path, write_json
+
+DEFAULT_PATH = cache_path('clean.json')
+
+MAX_ENTRIES = 50000
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def code_fingerprint():
+    """Hash of every source file of the package and the color table"""
+    digest = hashlib.sha1()
+    for dirpath, dirnames, filenames in os.walk(PACKAGE_DIR):
+        dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+        for filename in sorted(filenames):
+            if filename.endswith(('.py', '.json')):
+                path = os.path.join(dirpath, filename)
+                digest.update(os.path.relpath(path, PACKAGE_DIR).encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+class CleanCache:
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.fingerprint = code_fingerprint()
+        self.entries = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('fingerprint') == self.fingerprint:
+                self.entries = dict.fromkeys(stored['entries'])
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def is_clean(self, spec, blob):
+        if blob is None:
+            return False
+        if f'{spec}:{blob}' in self.entries:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, spec, blob):
+        key = f'{spec}:{blob}'
+        # Re-insert so the newest entries survive the trim in save()
+        self.entries.pop(key, None)
+        self.entries[key] = None
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        keys = list(self.entries)[-MAX_ENTRIES:]
+        write_json(self.path, {'fingerprint': self.fingerprint, 'entries': keys})
+        self.dirty = False
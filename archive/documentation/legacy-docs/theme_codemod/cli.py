@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+theme-codemod: one entry point for all dark theme rulesets
+
+Usage:
+  theme-codemod.py run <ruleset>[,<ruleset>...] [paths...] [--check] [--quiet] [--root DIR]
+                       [--metrics-prom FILE] [--metrics-json FILE]
+                       [--jobs N] [--file-budget SECONDS] [--rule-budget SECONDS]
+                       [--retry-quarantined] [--staged | --since REF]
+  theme-codemod.py list
+  theme-codemod.py quarantine [--clear]
+  theme-codemod.py backends
+  theme-codemod.py scan [paths...] [--no-cache] [--root DIR]
+  theme-codemod.py colors [paths...] [--write] [--root DIR]
+  theme-codemod.py contrast [paths...] [--min RATIO] [--no-cache] [--root DIR]
+  theme-codemod.py classnames [paths...] [--write] [--build DIR] [--root DIR]
+  theme-codemod.py query '<selector>' [paths...] [--count] [--no-cache] [--root DIR]
+  theme-codemod.py serve [--socket PATH] [--preload <ruleset>[,...]]
+  theme-codemod.py call '<json request>' [--socket PATH]
+
+Without paths a ruleset rewrites the files its legacy script targeted,
+relative to --root (default: frontend/src of this repository).
+--check writes nothing and exits 1 when a file would change, which is
+what the pre-commit hook uses:
+
+  THEME_CODEMOD_BACKEND=re python3 archive/documentation/legacy-docs/theme-codemod.py run \\
+      fix-triple-braces --check --quiet --staged frontend/src
+
+--staged runs on the files staged for commit and --since REF on those
+changed since the merge base of REF and HEAD (CI: --since origin/main),
+within the given paths or, without paths, the ruleset's targets (all of
+--root for rulesets without targets). Files whose git blob the ruleset
+already left unchanged are skipped unread (see cleancache.py). With
+--staged --check, a file whose working tree differs from the index is
+checked as staged, which is what gets committed. Without --check the
+working-tree files are rewritten, so a hook that fixes files has to
+stash unstaged changes first (the pre-commit framework does) and stage
+the result.
+
+--metrics-prom writes the run's metrics (files, bytes, per-rule time,
+cache hit rates, worker utilization) in Prometheus text format and
+--metrics-json appends them as one JSON line. THEME_CODEMOD_METRICS_DIR
+turns on both in that dir: theme-codemod-<ruleset>.prom (with -check for
+--check runs), which a textfile collector picks up next to the others,
+and one shared theme-codemod.jsonl.
+
+--jobs runs the files in worker processes. --file-budget and
+--rule-budget cap the time one file, or one rule on one file, may take;
+a worker over budget is killed and the file is skipped, reported and
+quarantined until it changes (`quarantine` lists them). Quarantined
+files count as errors. --retry-quarantined processes them anyway.
+With --jobs, files of THEME_CODEMOD_SPLIT_SIZE bytes or more
+(default 32768, 0 turns it off) are split at top-level declarations and
+their segments run in parallel (see split.py).
+
+`scan` runs the JSX scanner (tags, attributes, className tokens) through
+the persistent scan cache and reports totals and the cache hit rate.
+
+`colors` collects every color the tree uses, converts them in one batch
+to the HIG dark palette (needs NumPy) and prints the table; --write
+stores it as color_table.json for the rulesets.
+
+`contrast` resolves the text and background color of every styled
+element and lists those below WCAG AA (4.5:1, 3:1 for large text) as
+path:line:column; it exits 1 when there are any.
+
+`classnames` canonicalizes className values (see classnames.py) and
+reports the bytes saved per file and, when a production build exists
+(--build, default frontend/build/static/js), in the built JS chunks.
+It only reports unless --write is given.
+
+`query` lists the JSX elements a CSS-like selector matches (see
+selectors.py), e.g. `query 'input.w-full:not([style])'`, as
+path:line:column and the opening tag; --count prints only the totals.
+
+`serve` starts the resident daemon (see daemon.py for the protocol) and
+`call` sends it one request, mostly for scripting and debugging.
+
+Arguments are parsed by hand: argparse alone costs ~10 ms of startup,
+and this runs on every commit. For the same reason the hook pins the
+stdlib backend; importing `regex` costs more than it saves on a few files.
+"""
+
+import os
+import sys
+
+USAGE = __doc__.split('Usage:\n', 1)[1].split('\n\n', 1)[0]
+
+DEFAULT_ROOT = os.environ.get('THEME_CODEMOD_ROOT') or os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', 'frontend', 'src'
+))
+
+
+class UsageError(Exception):
+    pass
+
+
+def usage(message=None):
+    if message:
+        print(f"❌ {message}", file=sys.stderr)
+    print(f"Usage:\n{USAGE}", file=sys.stderr)
+    return 2
+
+
+def parse_options(args, flags, options):
+    """Split args into positionals, set of flags and dict of valued options"""
+    positionals, seen_flags, values = [], set(), {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in flags:
+            seen_flags.add(arg)
+        elif arg in options:
+            if i + 1 >= len(args):
+                raise UsageError(f"{arg} needs a value")
+            values[arg] = args[i + 1]
+            i += 1
+        elif arg.startswith('--') and '=' in arg and arg.split('=', 1)[0] in options:
+            key, value = arg.split('=', 1)
+            values[key] = value
+        elif arg.startswith('--'):
+            raise UsageError(f"Unknown option: {arg}")
+        else:
+            positionals.append(arg)
+        i += 1
+    return positionals, seen_flags, values
+
+
+def prom_filename(spec, check):
+    """One .prom file per ruleset and mode, so runs do not replace each other's"""
+    import re
+
+    name = re.sub(r'[^\w.-]+', '_', spec)
+    return f"theme-codemod-{name}{'-check' if check else ''}.prom"
+
+
+def cmd_run(args):
+    from . import rulesets
+    from .runner import run
+
+    positionals, flags, values = parse_options(
+        args, {'--check', '--quiet', '--retry-quarantined', '--staged'},
+        {'--root', '--metrics-prom', '--metrics-json', '--jobs', '--file-budget', '--rule-budget',
+         '--since'})
+    if not positionals:
+        return usage("Missing ruleset")
+    check = '--check' in flags
+    quiet = '--quiet' in flags
+    root = values.get('--root', DEFAULT_ROOT)
+    metrics_dir = os.environ.get('THEME_CODEMOD_METRICS_DIR')
+    prom_path = values.get('--metrics-prom') or (
+        metrics_dir and os.path.join(metrics_dir, prom_filename(positionals[0], check)))
+    json_path = values.get('--metrics-json') or (
+        metrics_dir and os.path.join(metrics_dir, 'theme-codemod.jsonl'))
+    try:
+        jobs = int(values.get('--jobs', 1))
+        file_budget = float(values.get('--file-budget', 0))
+        rule_budget = float(values.get('--rule-budget', 0))
+    except ValueError as e:
+        raise UsageError(f"Invalid number: {e}")
+    if jobs < 1 or file_budget < 0 or rule_budget < 0:
+        raise UsageError("--jobs must be at least 1 and budgets positive")
+    staged = '--staged' in flags
+    since = values.get('--since')
+    if staged and since:
+        raise UsageError("--staged and --since cannot be combined")
+
+    try:
+        ruleset = rulesets.load(positionals[0])
+    except KeyError as e:
+        return usage(f"Unknown ruleset: {e.args[0]}")
+
+    paths = positionals[1:]
+    if not paths:
+        paths = [os.path.join(root, target) for target in ruleset.targets]
+        if not paths:
+            if not (staged or since):
+                return usage(f"Ruleset {ruleset.spec} has no default targets, pass paths")
+            paths = [root]
+        missing = [p for p in paths if not os.path.exists(p)]
+        for path in missing:
+            print(f"⚠️  File not found: {os.path.relpath(path, root)}")
+        paths = [p for p in paths if p not in missing]
+
+    blobs = clean = sources = None
+    if staged or since:
+        from . import gitfiles
+        from .cleancache import CleanCache
+
+        scope = [os.path.realpath(path) for path in paths]
+        try:
+            changed = gitfiles.changed_files(
+                scope[0] if os.path.isdir(scope[0]) else os.path.dirname(scope[0]),
+                staged, since) if scope else []
+        except gitfiles.GitError as e:
+            print(f"❌ git: {e}", file=sys.stderr)
+            return 2
+        blobs = {
+            os.path.relpath(path): blob
+            for path, blob in changed
+            if path.endswith(ruleset.extensions)
+            and any(path == s or path.startswith(s + os.sep) for s in scope)
+        }
+        clean = CleanCache()
+        paths = [path for path, blob in blobs.items() if not clean.is_clean(ruleset.spec, blob)]
+        if staged and check:
+            # No blob id: the working tree may not hold what is staged
+            unmatched = [os.path.abspath(path) for path in paths if blobs[path] is None]
+            try:
+                staged_sources = gitfiles.read_staged(unmatched)
+            except gitfiles.GitError as e:
+                print(f"❌ git: {e}", file=sys.stderr)
+                return 2
+            sources = {os.path.relpath(path): data for path, data in staged_sources.items()}
+
+    def report(result):
+        if result.quarantined:
+            print(f"⏱️  Quarantined: {result.path}: {result.quarantined}")
+        elif result.error:
+            print(f"❌ Error: {result.path}: {result.error}")
+        elif result.changed:
+            verb = "Needs update" if check else "Updated"
+            print(f"{'⚠️ ' if check else '✅'} {verb}: {result.path} ({result.replacements} replacements)")
+        elif not quiet:
+            print(f"ℹ️  No changes needed: {result.path}")
+
+    collector = None
+    if prom_path or json_path:
+        from .metrics import RunMetrics
+        collector = RunMetrics('check' if check else 'run', ruleset.spec, jobs)
+
+        def on_result(result):
+            collector.add_result(result)
+            report(result)
+    else:
+        on_result = report
+
+    quarantine = None
+    if (file_budget or rule_budget) and '--retry-quarantined' not in flags:
+        from .quarantine import Quarantine
+        quarantine = Quarantine()
+
+    results = run(ruleset, paths, check=check, on_result=on_result, jobs=jobs,
+                  file_budget=file_budget, rule_budget=rule_budget, quarantine=quarantine,
+                  sources=sources)
+
+    changed = sum(1 for r in results if r.changed)
+    errors = sum(1 for r in results if r.error or r.quarantined)
+    if clean is not None:
+        for result in results:
+            blob = blobs.get(result.path)
+            if blob and not (result.changed or result.error or result.quarantined):
+                clean.add(ruleset.spec, blob)
+        try:
+            clean.save()
+        except OSError as e:
+            print(f"⚠️  Could not save clean blob cache: {e}", file=sys.stderr)
+    if quarantine is not None:
+        try:
+            quarantine.save()
+        except OSError as e:
+            print(f"⚠️  Could not save quarantine list: {e}", file=sys.stderr)
+    memo = sys.modules.get(f'{__package__}.memo')
+    if not quiet:
+        print(f"\n📊 {changed}/{len(results)} files {'need updating' if check else 'updated'}")
+        if clean is not None:
+            print(f"💾 {len(blobs)} changed files, {clean.hits} skipped as known clean")
+        if memo and memo.SHARED.hits + memo.SHARED.misses:
+            print(f"🧠 Replacement memo: {memo.SHARED.hits} hits, {memo.SHARED.misses} misses "
+                  f"({memo.SHARED.hit_rate:.0%})")
+
+    # Only a run that compiled a pattern has calibration to save
+    backends = sys.modules.get(f'{__package__}.backends')
+    if backends:
+        backends.save_calibration()
+
+    if collector is not None:
+        from . import metrics
+
+        if backends:
+            collector.add_cache('calibration', **backends.calibration_stats)
+        if clean is not None:
+            collector.add_cache('clean_blobs', clean.hits, clean.misses)
+        if memo:
+            collector.add_cache('replacement_memo', memo.SHARED.hits, memo.SHARED.misses)
+        collector.finish()
+        try:
+            if prom_path:
+                metrics.write_prometheus(collector, prom_path)
+            if json_path:
+                metrics.append_jsonl(collector, json_path)
+        except OSError as e:
+            print(f"⚠️  Could not write metrics: {e}", file=sys.stderr)
+
+    if errors:
+        return 2
+    return 1 if check and changed else 0
+
+
+def cmd_quarantine(args):
+    from .quarantine import Quarantine
+
+    _, flags, _ = parse_options(args, {'--clear'}, set())
+    quarantine = Quarantine()
+    entries = list(quarantine.items())
+    for path, spec, reason in entries:
+        print(f"⏱️  {path} [{spec}]: {reason}")
+    if '--clear' in flags:
+        quarantine.clear()
+        quarantine.save()
+        print(f"🧹 Cleared {len(entries)} quarantined files")
+    elif not entries:
+        print("ℹ️  No quarantined files")
+    return 0
+
+
+def cmd_list(args):
+    from .rulesets import RULESETS
+
+    for name in RULESETS:
+        print(name)
+    return 0
+
+
+def cmd_backends(args):
+    from . import backends, rulesets
+
+    backends.print_throughput_report(rulesets.all_rules())
+    return 0
+
+
+def cmd_scan(args):
+    import time
+
+    from .jsx_scan import scan
+    from .rulesets import DEFAULT_EXTENSIONS
+    from .runner import collect_files, read_source
+
+    positionals, flags, values = parse_options(args, {'--no-cache'}, {'--root'})
+    paths = positionals or [values.get('--root', DEFAULT_ROOT)]
+    cache = None
+    if '--no-cache' not in flags:
+        from .scancache import ScanCache
+        cache = ScanCache()
+
+    start = time.perf_counter()
+    files = tags = attrs = tokens = size = 0
+    for path in collect_files(paths, DEFAULT_EXTENSIONS):
+        try:
+            content = read_source(path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Error: {path}: {e}")
+            continue
+        result = cache.scan(content) if cache else scan(content)
+        files += 1
+        size += len(content)
+        tags += len(result.tags) // 4
+        attrs += len(result.attrs) // 5
+        tokens += len(result.classes) // 3
+    elapsed = time.perf_counter() - start
+
+    print(f"🔎 {files} files, {size / 1e6:.1f} M chars in {elapsed * 1000:.0f} ms")
+    print(f"   {tags} tags, {attrs} attributes, {tokens} className tokens")
+    if cache:
+        print(f"💾 Scan cache: {cache.hits} hits, {cache.misses} misses "
+              f"({cache.hit_rate:.0%}), {len(cache.index)} records in {cache.path}")
+        cache.close()
+    return 0
+
+
+def cmd_colors(args):
+    import time
+
+    from . import colors, palette
+    from .runner import collect_files, read_source
+
+    positionals, flags, values = parse_options(args, {'--write'}, {'--root'})
+    paths = positionals or [values.get('--root', DEFAULT_ROOT)]
+
+    def contents():
+        for path in collect_files(paths, ('.js', '.jsx', '.ts', '.tsx', '.css')):
+            try:
+                yield read_source(path)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"❌ Error: {path}: {e}")
+
+    found = colors.collect_colors(contents())
+    start = time.perf_counter()
+    try:
+        table = colors.build_table(found)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    for role in palette.ROLES:
+        print(f"\n{role}:")
+        for color, dark in table['colors'][role].items():
+            print(f"  {color} -> {dark}  ({found[role, color]}x)")
+    print(f"\n🎨 {len(found)} colors converted in {elapsed * 1000:.1f} ms")
+    if '--write' in flags:
+        colors.write_table(table)
+        print(f"💾 Wrote {palette.TABLE_PATH}")
+    return 0
+
+
+def cmd_contrast(args):
+    import time
+
+    from . import contrast
+    from .rulesets import DEFAULT_EXTENSIONS
+    from .runner import collect_files, read_source
+
+    positionals, flags, values = parse_options(args, {'--no-cache'}, {'--root', '--min'})
+    paths = positionals or [values.get('--root', DEFAULT_ROOT)]
+    try:
+        minimum = float(values.get('--min', contrast.AA_NORMAL))
+    except ValueError:
+        raise UsageError(f"--min needs a number, got {values['--min']}")
+    cache = None
+    if '--no-cache' not in flags:
+        from .scancache import ScanCache
+        cache = ScanCache()
+
+    files = 0
+
+    def sources():
+        nonlocal files
+        for path in collect_files(paths, DEFAULT_EXTENSIONS):
+            try:
+                content = read_source(path)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"❌ Error: {path}: {e}")
+                continue
+            files += 1
+            yield path, content
+
+    start = time.perf_counter()
+    try:
+        findings, checked = contrast.check(
+            sources(), minimum, min(minimum, contrast.AA_LARGE), cache=cache)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    finally:
+        if cache:
+            cache.close()
+    elapsed = time.perf_counter() - start
+
+    for finding in findings:
+        print(f"⚠️  {finding}")
+    print(f"\n📊 {len(findings)}/{checked} color pairs below contrast in {files} files "
+          f"({elapsed * 1000:.0f} ms)")
+    return 1 if findings else 0
+
+
+def cmd_classnames(args):
+    from . import classnames
+    from .rulesets import DEFAULT_EXTENSIONS
+    from .runner import collect_files, read_source, write_source
+    from .scancache import ScanCache
+
+    positionals, flags, values = parse_options(args, {'--write'}, {'--root', '--build'})
+    root = values.get('--root', DEFAULT_ROOT)
+    paths = positionals or [root]
+    build = values.get('--build') or os.path.normpath(os.path.join(root, '..', 'build', 'static', 'js'))
+
+    changes = {}
+    files = changed = saved = 0
+    with ScanCache() as cache:
+        for path in collect_files(paths, DEFAULT_EXTENSIONS):
+            try:
+                content = read_source(path)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"❌ Error: {path}: {e}")
+                continue
+            files += 1
+            result = cache.scan(content)
+            for _, start, end, new_value in classnames.value_changes(content, result):
+                changes[content[start:end]] = new_value
+            edits = classnames.canonical_edits(content, result)
+            if not edits:
+                continue
+            new_content = classnames.apply_edits(content, edits)
+            file_saved = len(content.encode('utf-8')) - len(new_content.encode('utf-8'))
+            changed += 1
+            saved += file_saved
+            print(f"{'✅' if '--write' in flags else 'ℹ️ '} {path}: {len(edits)} classNames, "
+                  f"{file_saved} bytes saved")
+            if '--write' in flags:
+                write_source(path, new_content)
+
+    print(f"\n📊 {changed}/{files} files, {len(changes)} distinct className values, "
+          f"{saved} bytes saved in source")
+    if os.path.isdir(build):
+        chunks = []
+        for name in sorted(os.listdir(build)):
+            if name.endswith('.js'):
+                with open(os.path.join(build, name), 'r', encoding='utf-8') as f:
+                    chunks.append(f.read())
+        chunk_saved = classnames.chunk_savings(changes, chunks)
+        print(f"📦 {chunk_saved} bytes saved across {len(chunks)} built chunks in {build}")
+    else:
+        print(f"📦 No build at {build}, run `npm run build` for the chunk estimate")
+    return 0
+
+
+def cmd_query(args):
+    import time
+
+    from .jsx_scan import scan
+    from .rulesets import DEFAULT_EXTENSIONS
+    from .runner import collect_files, read_source
+    from .selectors import SelectorError, compile_selector
+
+    positionals, flags, values = parse_options(args, {'--count', '--no-cache'}, {'--root'})
+    if not positionals:
+        raise UsageError("query needs a selector")
+    try:
+        selector = compile_selector(positionals[0])
+    except SelectorError as e:
+        raise UsageError(str(e))
+    paths = positionals[1:] or [values.get('--root', DEFAULT_ROOT)]
+    cache = None
+    if '--no-cache' not in flags:
+        from .scancache import ScanCache
+        cache = ScanCache()
+
+    start = time.perf_counter()
+    files = scanned = matched = 0
+    for path in collect_files(paths, DEFAULT_EXTENSIONS):
+        try:
+            content = read_source(path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Error: {path}: {e}")
+            continue
+        files += 1
+        if not selector.may_match(content):
+            continue
+        scanned += 1
+        result = cache.scan(content) if cache else scan(content)
+        for element in selector.select(content, result):
+            matched += 1
+            if '--count' not in flags:
+                line, column = element.position()
+                print(f"{path}:{line}:{column}: {' '.join(element.text.split())}")
+    elapsed = time.perf_counter() - start
+    if cache:
+        cache.close()
+
+    print(f"🔎 {matched} elements in {files} files ({scanned} scanned) in {elapsed * 1000:.0f} ms")
+    return 0 if matched else 1
+
+
+def cmd_serve(args):
+    from . import daemon
+
+    _, _, values = parse_options(args, set(), {'--socket', '--preload'})
+    preload = [spec for spec in values.get('--preload', '').split(',') if spec]
+    try:
+        daemon.serve(values.get('--socket'), preload)
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_call(args):
+    import json
+
+    from . import daemon
+
+    positionals, _, values = parse_options(args, set(), {'--socket'})
+    if len(positionals) != 1:
+        return usage("call takes exactly one JSON request")
+    try:
+        payload = json.loads(positionals[0])
+    except ValueError as e:
+        return usage(f"Invalid JSON: {e}")
+    try:
+        reply = daemon.request(values.get('--socket') or daemon.default_socket_path(), payload)
+    except OSError as e:
+        print(f"❌ Daemon not reachable: {e}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"❌ Invalid reply from daemon: {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(reply, indent=2))
+    return 0 if reply.get('ok') else 1
+
+
+COMMANDS = {
+    'run': cmd_run,
+    'list': cmd_list,
+    'quarantine': cmd_quarantine,
+    'backends': cmd_backends,
+    'scan': cmd_scan,
+    'colors': cmd_colors,
+    'contrast': cmd_contrast,
+    'classnames': cmd_classnames,
+    'query': cmd_query,
+    'serve': cmd_serve,
+    'call': cmd_call,
+}
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] in ('-h', '--help'):
+        return usage()
+    command = COMMANDS.get(args[0])
+    if command is None:
+        return usage(f"Unknown command: {args[0]}")
+    try:
+        return command(args[1:])
+    except UsageError as e:
+        return usage(str(e))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Light-to-dark color engine
+
+Collects every distinct color in the tree together with the role it is
+used in (background, text, border), converts them all in one NumPy
+batch through OKLab and snaps each result onto the Apple HIG dark
+palette:
+
+- neutrals get a new lightness from a per-role curve (white card
+  background -> #2C2C2E, gray-900 text -> #FFFFFF, gray-200 border ->
+  #38383A) and are matched to that role's neutrals by lightness
+- light pastel tints used as backgrounds or borders (the #f8d7da of an
+  error alert) keep their hue and get the role curve's lightness with at most
+  TINT_DARK_CHROMA chroma, so a pale red surface becomes a dark red one
+- other chromatic colors keep their hue and are matched to the nearest
+  system accent color by hue angle (blue-600 -> #0A84FF)
+- colors already on the palette are left as they are, so converting a
+  converted tree changes nothing
+
+The result is written to color_table.json, which the rulesets read
+through palette.load_table() without needing NumPy.
+"""
+
+import re
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # only `theme-codemod.py colors` needs it
+    np = None
+
+from . import palette
+from .cachedir import write_json
+
+# Lightness curves, OKLab L in -> L out, per role. Anchors are the L of
+# the Tailwind grays and HIG neutrals the legacy scripts paired by hand.
+CURVES = {
+    'background': (
+        (0.0, 0.227, 0.40, 0.75, 0.872, 0.928, 0.967, 0.985, 0.995, 1.0),
+        (0.227, 0.227, 0.40, 0.402, 0.402, 0.349, 0.227, 0.227, 0.294, 0.294),
+    ),
+    'text': (
+        (0.0, 0.30, 0.35, 0.60, 0.714, 0.80, 0.90),
+        (1.0, 1.0, 0.681, 0.681, 0.501, 0.681, 1.0),
+    ),
+    'border': (
+        (0.0, 0.341, 0.45, 0.75, 0.872, 0.90, 1.0),
+        (0.341, 0.341, 0.402, 0.402, 0.402, 0.341, 0.341),
+    ),
+}
+CHROMA_MIN = palette.CHROMA_MIN
+# Above this a light color is a fill (amber-400 #fbbf24 is 0.164), not a
+# pastel tint (green-300 #86efac is 0.136)
+TINT_CHROMA_MAX = 0.15
+# Chroma of the dark variant of a light tint: visible, never loud
+TINT_DARK_CHROMA = 0.05
+# Roles whose light tints stay tints; tinted text keeps reading as text
+TINTED_ROLES = ('background', 'border')
+
+HEX = re.compile(r'#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b')
+RGB = re.compile(r'rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*(?:1|1\.0+)\s*)?\)')
+DECLARATION = re.compile(r'([A-Za-z][\w-]*)\s*:\s*([^;}\n]*)')
+TAILWIND_CLASS = re.compile(
+    r'(?<![\w-])(' + '|'.join(palette.TAILWIND_ROLES) + r')-'
+    r'(white|black|[a-z]+-\d{2,3}|\[#[0-9a-fA-F]{3,6}\])(?![\w-])'
+)
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("The color engine needs NumPy: pip install numpy")
+
+
+def normalize_hex(value):
+    value = value.lower()
+    if len(value) == 4:
+        value = '#' + ''.join(c * 2 for c in value[1:])
+    return value
+
+
+def property_role(prop):
+    """Role of a CSS property or JSX style key, None if it is not a color slot"""
+    prop = prop.lower()
+    if 'background' in prop or prop.startswith('bg'):
+        return 'background'
+    if any(word in prop for word in ('border', 'outline', 'stroke', 'divide', 'ring')):
+        return 'border'
+    if prop.endswith('color') or prop == 'fill':
+        return 'text'
+    return None
+
+
+def collect_colors(contents):
+    """Count (role, '#rrggbb') pairs in contents, Tailwind color classes included"""
+    colors = Counter()
+    for content in contents:
+        for match in DECLARATION.finditer(content):
+            role = property_role(match.group(1))
+            if role is None:
+                continue
+            value = match.group(2)
+            for color in HEX.findall(value):
+                colors[role, normalize_hex(color)] += 1
+            for r, g, b in RGB.findall(value):
+                if max(int(r), int(g), int(b)) <= 255:
+                    colors[role, f'#{int(r):02x}{int(g):02x}{int(b):02x}'] += 1
+        for match in TAILWIND_CLASS.finditer(content):
+            prefix, name = match.groups()
+            if name.startswith('['):
+                color = normalize_hex(name[1:-1])
+            else:
+                color = palette.TAILWIND.get(name)
+                if color is None:
+                    continue
+            colors[palette.TAILWIND_ROLES[prefix], color] += 1
+    return colors
+
+
+def hex_to_rgb(hexes):
+    """(N,) '#rrggbb' strings -> (N, 3) float sRGB in 0..1"""
+    raw = bytes.fromhex(''.join(h[1:7] for h in hexes))
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3) / 255.0
+
+
+def rgb_to_hex(rgb):
+    values = np.clip(np.rint(rgb * 255), 0, 255).astype(np.uint8)
+    return ['#' + row.tobytes().hex().upper() for row in values]
+
+
+LMS_FROM_LINEAR = None
+LAB_FROM_LMS = None
+
+
+def _matrices():
+    global LMS_FROM_LINEAR, LAB_FROM_LMS
+    if LMS_FROM_LINEAR is None:
+        LMS_FROM_LINEAR = np.array(palette.LMS_FROM_LINEAR)
+        LAB_FROM_LMS = np.array(palette.LAB_FROM_LMS)
+    return LMS_FROM_LINEAR, LAB_FROM_LMS
+
+
+def srgb_to_oklab(rgb):
+    """(N, 3) sRGB in 0..1 -> (N, 3) OKLab"""
+    lms_from_linear, lab_from_lms = _matrices()
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return np.cbrt(linear @ lms_from_linear.T) @ lab_from_lms.T
+
+
+def oklab_to_srgb(lab):
+    """(N, 3) OKLab -> (N, 3) sRGB in 0..1, clipped to the gamut"""
+    lms_from_linear, lab_from_lms = _matrices()
+    linear = (lab @ np.linalg.inv(lab_from_lms).T) ** 3 @ np.linalg.inv(lms_from_linear).T
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+
+
+def convert(hexes, roles):
+    """
+    Batch-convert colors to their dark palette equivalents.
+
+    `hexes` are '#rrggbb' strings, `roles` the matching role names.
+    Returns the palette hex for each input, in order.
+    """
+    require_numpy()
+    if not len(hexes):
+        return []
+    lab = srgb_to_oklab(hex_to_rgb(hexes))
+    lightness = lab[:, 0]
+    chroma = np.hypot(lab[:, 1], lab[:, 2])
+    hue = np.arctan2(lab[:, 2], lab[:, 1])
+    role_index = np.array([palette.ROLES.index(role) for role in roles])
+
+    # Neutrals: role curve for L, then nearest role neutral by L
+    target = np.empty_like(lightness)
+    for i, role in enumerate(palette.ROLES):
+        mask = role_index == i
+        xp, fp = CURVES[role]
+        target[mask] = np.interp(lightness[mask], xp, fp)
+
+    result = np.empty(len(hexes), dtype=object)
+    for i, role in enumerate(palette.ROLES):
+        mask = role_index == i
+        if not mask.any():
+            continue
+        neutrals = list(palette.NEUTRALS[role])
+        neutral_l = srgb_to_oklab(hex_to_rgb([h.lower() for h in neutrals]))[:, 0]
+        nearest = np.abs(target[mask, None] - neutral_l[None, :]).argmin(axis=1)
+        result[mask] = np.array(neutrals, dtype=object)[nearest]
+
+    # Light tints of surfaces: same hue, dark, low chroma
+    light = lightness >= palette.TINT_LIGHTNESS
+    tinted_role = np.isin(role_index, [palette.ROLES.index(role) for role in TINTED_ROLES])
+    tint = light & tinted_role & (chroma > palette.TINT_CHROMA) & (chroma <= TINT_CHROMA_MAX)
+    if tint.any():
+        scale = np.minimum(chroma[tint], TINT_DARK_CHROMA) / chroma[tint]
+        dark = np.column_stack([target[tint], lab[tint, 1] * scale, lab[tint, 2] * scale])
+        result[tint] = np.array(rgb_to_hex(oklab_to_srgb(dark)), dtype=object)
+
+    # Accents: nearest system color by circular hue distance
+    chromatic = (chroma > CHROMA_MIN) & ~tint
+    if chromatic.any():
+        accents = list(palette.ACCENTS)
+        accent_lab = srgb_to_oklab(hex_to_rgb([h.lower() for h in accents]))
+        accent_hue = np.arctan2(accent_lab[:, 2], accent_lab[:, 1])
+        diff = np.abs(hue[chromatic, None] - accent_hue[None, :])
+        diff = np.minimum(diff, 2 * np.pi - diff)
+        result[chromatic] = np.array(accents, dtype=object)[diff.argmin(axis=1)]
+
+    # Colors already on the palette stay exactly as they are: accents,
+    # the role's neutrals and, for surfaces, the other surface neutrals
+    # (a #38383A border color used as a background)
+    surfaces = [h for role in TINTED_ROLES for h in palette.NEUTRALS[role]]
+    keep = {
+        role: {h.lower(): h for h in (*palette.ACCENTS, *palette.NEUTRALS[role],
+                                      *(surfaces if role in TINTED_ROLES else ()))}
+        for role in palette.ROLES
+    }
+    for i, (h, role) in enumerate(zip(hexes, roles)):
+        same = keep[role].get(h)
+        if same is not None:
+            result[i] = same
+    return list(result)
+
+
+def build_table(colors):
+    """Return the color_table.json structure for collected colors"""
+    pairs = sorted(colors)
+    converted = convert([h for _, h in pairs], [role for role, _ in pairs])
+    table = {'colors': {role: {} for role in palette.ROLES}}
+    for (role, color), dark in zip(pairs, converted):
+        table['colors'][role][color] = dark
+    return table
+
+
+def write_table(table, path=palette.TABLE_PATH):
+    write_json(path, table, indent=1, sort_keys=True)
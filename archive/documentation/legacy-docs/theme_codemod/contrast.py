@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+WCAG contrast check for the converted JSX
+
+For every element that sets its own text or background color, the
+effective colors are resolved the way the browser would see them after
+the scripts ran: inline style={{ ... }} first, then Tailwind color
+classes, then whatever the nearest ancestor set, down to the body colors
+from index.css. Translucent colors (rgba, bg-black/50) are composited
+over the resolved background.
+
+Resolution is per file and cheap; the contrast ratios for all pairs of
+the tree are then computed in one NumPy batch.
+"""
+
+import re
+from functools import lru_cache
+
+from . import colors, palette
+from .jsx_scan import scan
+
+# body in index.css: --nk-base / --nk-text-primary
+ROOT_BACKGROUND = (0x05, 0x06, 0x0a)
+ROOT_TEXT = (0xf4, 0xf5, 0xf7)
+
+AA_NORMAL = 4.5
+AA_LARGE = 3.0
+
+STYLE_COLOR = re.compile(r'\b(color|backgroundColor|background)\s*:\s*([\'"])([^\'"]*)\2')
+RGBA = re.compile(r'rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*([\d.]+)\s*)?\)')
+FONT_SIZE = re.compile(r'\bfontSize\s*:\s*[\'"]?(\d+(?:\.\d+)?)(px|rem)?')
+CLOSE_TAG = re.compile(r'</([A-Za-z][\w.:-]*)\s*>')
+CLASS_COLOR = re.compile(r'(bg|text)-(white|black|[a-z]+-\d{2,3}|\[#[0-9a-fA-F]{3,6}\])(?:/(\d{1,3}))?')
+CLASS_OPACITY = re.compile(r'(bg|text)-opacity-(\d{1,3})')  # Tailwind v2 style
+
+LARGE_TAGS = {'h1', 'h2', 'h3'}
+LARGE_CLASSES = {'text-2xl', 'text-3xl', 'text-4xl', 'text-5xl', 'text-6xl'}
+NAMED = {'white': (255, 255, 255, 1.0), 'black': (0, 0, 0, 1.0), 'transparent': None}
+
+
+class Finding:
+    """One element whose text fails the contrast threshold"""
+
+    def __init__(self, path, line, column, tag, text, background, ratio, required):
+        self.path = path
+        self.line = line
+        self.column = column
+        self.tag = tag
+        self.text = text
+        self.background = background
+        self.ratio = ratio
+        self.required = required
+
+    def __str__(self):
+        return (f"{self.path}:{self.line}:{self.column}: <{self.tag}> "
+                f"{to_hex(self.text)} on {to_hex(self.background)} "
+                f"is {self.ratio:.2f}:1, needs {self.required:g}:1")
+
+
+def to_hex(rgb):
+    return '#' + ''.join(f'{int(v):02X}' for v in rgb)
+
+
+def parse_color(value):
+    """'#fff' / 'rgba(0,0,0,.5)' / 'white' -> (r, g, b, alpha), else None"""
+    value = value.strip().lower()
+    if value in NAMED:
+        return NAMED[value]
+    match = colors.HEX.fullmatch(value)
+    if match:
+        hex_value = colors.normalize_hex(value)
+        return (int(hex_value[1:3], 16), int(hex_value[3:5], 16), int(hex_value[5:7], 16), 1.0)
+    match = RGBA.fullmatch(value)
+    if match:
+        r, g, b = (int(v) for v in match.group(1, 2, 3))
+        alpha = float(match.group(4)) if match.group(4) else 1.0
+        if max(r, g, b) <= 255 and 0.0 <= alpha <= 1.0:
+            return (r, g, b, alpha)
+    return None
+
+
+def composite(color, under):
+    """Blend an (r, g, b, alpha) color over an opaque (r, g, b)"""
+    r, g, b, alpha = color
+    if alpha >= 1.0:
+        return (r, g, b)
+    return tuple(round(c * alpha + u * (1 - alpha)) for c, u in zip((r, g, b), under))
+
+
+@lru_cache(maxsize=None)
+def class_color(token):
+    """Return ('bg' | 'text', (r, g, b, alpha)) for a Tailwind color class"""
+    match = CLASS_COLOR.fullmatch(token)
+    if match is None:
+        return None
+    kind, name, opacity = match.groups()
+    if name.startswith('['):
+        color = parse_color(name[1:-1])
+    else:
+        hex_value = palette.TAILWIND.get(name)
+        color = parse_color(hex_value) if hex_value else None
+    if color is None:
+        return None
+    if opacity is not None:
+        color = color[:3] + (min(int(opacity), 100) / 100,)
+    return kind, color
+
+
+def element_styles(result):
+    """
+    Return {tag_index: [text, background, large]} for the tags of a scan.
+
+    Colors are (r, g, b, alpha) or None when the element does not set one.
+    Classes are applied first so inline styles override them, as in the
+    browser.
+    """
+    content = result.content
+    styles = {}
+    opacities = {}
+    for attr_index, start, end in result.iter_class_tokens():
+        token = content[start:end]
+        if ':' in token:
+            continue  # hover:, dark:, md: only apply in some states
+        tag_index = result.attrs[attr_index * 5]
+        entry = styles.setdefault(tag_index, [None, None, False])
+        if token in LARGE_CLASSES:
+            entry[2] = True
+            continue
+        found = class_color(token)
+        if found is not None:
+            kind, color = found
+            entry[0 if kind == 'text' else 1] = color
+            continue
+        opacity = CLASS_OPACITY.fullmatch(token)
+        if opacity is not None:
+            slot = 0 if opacity.group(1) == 'text' else 1
+            opacities[tag_index, slot] = min(int(opacity.group(2)), 100) / 100
+    for (tag_index, slot), alpha in opacities.items():
+        color = styles[tag_index][slot]
+        if color is not None:
+            styles[tag_index][slot] = color[:3] + (alpha,)
+
+    for _, tag_index, name, start, end in result.iter_attrs():
+        if name != 'style' or end <= start:
+            continue
+        value = content[start:end]
+        entry = styles.setdefault(tag_index, [None, None, False])
+        for prop, _, literal in STYLE_COLOR.findall(value):
+            color = parse_color(literal)
+            if color is not None:
+                entry[0 if prop == 'color' else 1] = color
+        size = FONT_SIZE.search(value)
+        if size:
+            pixels = float(size.group(1)) * (16 if size.group(2) == 'rem' else 1)
+            entry[2] = pixels >= 24
+    return styles
+
+
+def resolve_pairs(result):
+    """
+    Yield (start, name, text, background, large) for every element that sets
+    its own text or background color, with colors resolved to opaque RGB.
+    """
+    content = result.content
+    styles = element_styles(result)
+    events = []
+    for index, start, end, name in result.iter_tags():
+        events.append((start, 0, index, end, name))
+    for match in CLOSE_TAG.finditer(content):
+        events.append((match.start(), 1, None, None, match.group(1)))
+    events.sort(key=lambda event: event[0])
+
+    # Stack of (name, text, background, large) for the open elements
+    stack = [(None, ROOT_TEXT, ROOT_BACKGROUND, False)]
+    for start, closing, index, end, name in events:
+        if closing:
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth][0] == name:
+                    del stack[depth:]
+                    break
+            continue
+        _, parent_text, parent_background, parent_large = stack[-1]
+        own = styles.get(index)
+        if own is None or (own[0] is None and own[1] is None):
+            text, background = parent_text, parent_background
+            large = parent_large or bool(own and own[2]) or name in LARGE_TAGS
+        else:
+            background = parent_background
+            if own[1] is not None:
+                background = composite(own[1], parent_background)
+            text = composite(own[0], background) if own[0] is not None else parent_text
+            large = parent_large or own[2] or name in LARGE_TAGS
+            yield start, name, text, background, large
+        if not content.startswith('/>', end - 2):
+            stack.append((name, text, background, large))
+
+
+def contrast_ratios(text, background):
+    """WCAG contrast ratio for (N, 3) uint8 text and background arrays"""
+    np = colors.np
+
+    def luminance(rgb):
+        srgb = rgb / 255.0
+        linear = np.where(srgb <= 0.03928, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+        return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+    a = luminance(text)
+    b = luminance(background)
+    return (np.maximum(a, b) + 0.05) / (np.minimum(a, b) + 0.05)
+
+
+def check(sources, minimum=AA_NORMAL, large_minimum=AA_LARGE, cache=None):
+    """
+    Check (path, content) pairs, return (findings, pairs checked).
+
+    Findings are sorted by path and position.
+    """
+    colors.require_numpy()
+    np = colors.np
+    locations = []
+    text_rows = []
+    background_rows = []
+    large_rows = []
+    for path, content in sources:
+        result = cache.scan(content) if cache else scan(content)
+        for start, name, text, background, large in resolve_pairs(result):
+            line = content.count('\n', 0, start) + 1
+            column = start - content.rfind('\n', 0, start)
+            locations.append((path, line, column, name))
+            text_rows.append(text)
+            background_rows.append(background)
+            large_rows.append(large)
+    if not locations:
+        return [], 0
+
+    text = np.array(text_rows, dtype=np.uint8)
+    background = np.array(background_rows, dtype=np.uint8)
+    ratios = contrast_ratios(text, background)
+    required = np.where(np.array(large_rows), large_minimum, minimum)
+    failing = np.flatnonzero(ratios < required)
+
+    findings = [
+        Finding(*locations[i], text_rows[i], background_rows[i], float(ratios[i]), float(required[i]))
+        for i in failing
+    ]
+    return findings, len(locations)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+CSS tokenizer and color declaration rewriter
+
+The tokenizer takes the text as chunks and never holds more than a
+chunk plus one unfinished token; rules pass a whole file as one chunk
+(the stylesheets are at most a few tens of KB). The rewriter buffers
+one declaration value at a time (`background: ... ;`), rewrites the
+colors in it for the property's group and writes everything else
+through untouched, so the output is byte-identical outside the replaced
+colors.
+"""
+
+import io
+import re
+
+# Alternatives that can run to the end of the buffer (unterminated
+# comments and strings) are tried before the complete forms fail over to
+# single-character delims, so a chunk boundary never splits them
+TOKEN = re.compile(r'''
+    (?P<comment>/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<string>"(?:[^"\\\n]|\\[\s\S])*(?:"|(?=\n)|\Z)|'(?:[^'\\\n]|\\[\s\S])*(?:'|(?=\n)|\Z))
+  | (?P<ws>\s+)
+  | (?P<url>url\((?:[^)"'\\]|\\[\s\S])*(?:\)|\Z))
+  | (?P<function>-?[_a-zA-Z][\w-]*\()
+  | (?P<hash>\#[\w-]+)
+  | (?P<at>@-?[_a-zA-Z][\w-]*)
+  | (?P<number>[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?(?:%|[a-zA-Z]+)?)
+  | (?P<ident>--[\w-]*|-?[_a-zA-Z][\w-]*)
+  | (?P<delim>[\s\S])
+''', re.VERBOSE)
+
+HEX_COLOR = re.compile(r'#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})')
+RGB_ARGS = re.compile(r'\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*(1|1\.0+)\s*)?$')
+
+NAMED_COLORS = {
+    'white': '#ffffff',
+    'black': '#000000',
+}
+
+
+def tokenize(chunks):
+    """Yield (kind, text) from an iterable of str chunks"""
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        pos = 0
+        end = len(buffer)
+        while pos < end:
+            match = TOKEN.match(buffer, pos)
+            if match.end() == end:
+                # The token may continue in the next chunk
+                break
+            yield match.lastgroup, match.group()
+            pos = match.end()
+        buffer = buffer[pos:]
+    pos = 0
+    while pos < len(buffer):
+        match = TOKEN.match(buffer, pos)
+        yield match.lastgroup, match.group()
+        pos = match.end()
+
+
+def normalize_color(kind, text):
+    """Return '#rrggbb' for an opaque color token, else None"""
+    if kind == 'hash' and HEX_COLOR.fullmatch(text):
+        text = text.lower()
+        if len(text) == 4:
+            text = '#' + ''.join(c * 2 for c in text[1:])
+        return text
+    if kind == 'ident':
+        return NAMED_COLORS.get(text.lower())
+    return None
+
+
+def normalize_function(text):
+    """'rgb(255, 255, 255)' / 'rgba(0,0,0,1)' -> '#rrggbb', else None"""
+    name, _, args = text.partition('(')
+    if name.lower() not in ('rgb', 'rgba') or not args.endswith(')'):
+        return None
+    match = RGB_ARGS.match(args[:-1])
+    if match is None:
+        return None
+    channels = [int(value) for value in match.group(1, 2, 3)]
+    if any(value > 255 for value in channels):
+        return None
+    return '#' + ''.join(f'{value:02x}' for value in channels)
+
+
+class CssColorRule:
+    """
+    Rewrite colors inside declarations, one mapping per property group.
+
+    `groups` maps a group name to (properties, {'#rrggbb': replacement}).
+    A property matches a group when it equals one of the names or starts
+    with one followed by '-' (border -> border-top-color).
+    """
+
+    pattern = None
+
+    def __init__(self, id, groups, description=None):
+        self.id = id
+        self.description = description
+        self._groups = groups
+        self._property_cache = {}
+
+    def mapping_for(self, prop):
+        prop = prop.lower()
+        mapping = self._property_cache.get(prop, False)
+        if mapping is False:
+            mapping = None
+            for properties, colors in self._groups.values():
+                if any(prop == name or prop.startswith(name + '-') for name in properties):
+                    mapping = colors
+                    break
+            self._property_cache[prop] = mapping
+        return mapping
+
+    def rewrite_value(self, tokens, mapping):
+        """Return (text, replacements) for the tokens of one declaration value"""
+        out = []
+        count = 0
+        i = 0
+        while i < len(tokens):
+            kind, text = tokens[i]
+            if kind == 'function':
+                # Gather the whole call, nested parens included
+                depth, j = 1, i + 1
+                while j < len(tokens) and depth:
+                    if tokens[j][1] == '(' or tokens[j][0] == 'function':
+                        depth += 1
+                    elif tokens[j][1] == ')':
+                        depth -= 1
+                    j += 1
+                call = text + ''.join(t for _, t in tokens[i + 1:j])
+                color = normalize_function(call)
+                if color in mapping:
+                    out.append(mapping[color])
+                    count += 1
+                    i = j
+                    continue
+                out.append(text)
+                i += 1
+                continue
+            color = normalize_color(kind, text)
+            if color in mapping:
+                out.append(mapping[color])
+                count += 1
+            else:
+                out.append(text)
+            i += 1
+        return ''.join(out), count
+
+    def rewrite(self, tokens, write):
+        """Stream tokens to `write`, return the number of colors replaced"""
+        count = 0
+        depth = 0
+        statement_start = True
+        pending = None  # [tokens] of a possible declaration being collected
+        for kind, text in tokens:
+            if pending is not None:
+                if kind == 'delim' and text in ';}{':
+                    count += self._flush(pending, text == '{', write)
+                    pending = None
+                else:
+                    pending.append((kind, text))
+                    continue
+            elif kind == 'ident' and depth > 0 and statement_start:
+                pending = [(kind, text)]
+                statement_start = False
+                continue
+
+            write(text)
+            if kind in ('ws', 'comment'):
+                continue
+            if kind == 'delim' and text == '{':
+                depth += 1
+                statement_start = True
+            elif kind == 'delim' and text == '}':
+                depth = max(depth - 1, 0)
+                statement_start = True
+            elif kind == 'delim' and text == ';':
+                statement_start = True
+            else:
+                statement_start = False
+        if pending is not None:
+            count += self._flush(pending, False, write)
+        return count
+
+    def _flush(self, pending, is_selector, write):
+        # pending is `prop ws* : value`; a `{` at the end means it was a
+        # selector such as `a:hover`, which is written back as is
+        colon = next((i for i, (kind, text) in enumerate(pending) if text == ':'), None)
+        mapping = None
+        if not is_selector and colon is not None and all(k == 'ws' for k, _ in pending[1:colon]):
+            mapping = self.mapping_for(pending[0][1])
+        if not mapping:
+            write(''.join(text for _, text in pending))
+            return 0
+        write(''.join(text for _, text in pending[:colon + 1]))
+        value, count = self.rewrite_value(pending[colon + 1:], mapping)
+        write(value)
+        return count
+
+    def apply(self, content):
+        out = io.StringIO()
+        count = self.rewrite(tokenize([content]), out.write)
+        return out.getvalue(), count
+
+    def __repr__(self):
+        return f'<CssColorRule {self.id}>'
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Resident theme codemod daemon
+
+Keeps loaded rulesets, compiled rules and a per-file result index in
+memory and serves them over a Unix domain socket, so editors and CI do
+not pay interpreter startup and rule compilation for every file.
+
+Protocol: one JSON object per line in, one JSON object per line out.
+
+  {"op": "apply", "ruleset": "fix-react-styles", "path": "/abs/File.js"}
+  {"op": "apply", "ruleset": "fix-react-styles", "content": "<jsx>"}
+  {"op": "apply", "ruleset": "css-dark-theme", "content": "<css>", "filename": "x.css"}
+  {"op": "check", "ruleset": "final-dark-cleanup", "path": "/abs/File.js"}
+  {"op": "query", "ruleset": "fix-inputs-only", "paths": ["/abs/src"]}
+  {"op": "query", "what": "rulesets" | "stats"}
+  {"op": "scan", "path": "/abs/File.js"}  (or "content")
+  {"op": "ping"} / {"op": "shutdown"}
+
+`apply` with a path rewrites the file, with `content` it only returns the
+rewritten text. `check` never writes. `query` lists files under `paths`
+that the ruleset would change. `scan` returns the JSX scan tables (tags
+with attributes, className token spans) through the persistent scan
+cache. Every reply has "ok" and "elapsed_ms".
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+import traceback
+
+from . import memo, rulesets
+from .rules import apply_rules
+from .runner import collect_files, read_source, write_source
+
+
+# Request fields and the JSON type they must have
+FIELD_TYPES = {'op': str, 'ruleset': str, 'path': str, 'content': str, 'filename': str, 'what': str}
+
+
+class RequestError(ValueError):
+    pass
+
+
+def validate(request):
+    if not isinstance(request, dict):
+        raise RequestError("Request must be a JSON object")
+    for name, kind in FIELD_TYPES.items():
+        if name in request and not isinstance(request[name], kind):
+            raise RequestError(f"{name} must be a string")
+    paths = request.get('paths', [])
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        raise RequestError("paths must be a list of strings")
+
+
+def default_socket_path():
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'theme-codemod.sock')
+    # Not directly in /tmp, where anyone could create the name first
+    return f'/tmp/theme-codemod-{os.getuid()}/daemon.sock'
+
+
+def private_dir(path):
+    """Create directory path readable only by us, or check that it is"""
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise OSError(f"{path} is not a directory only this user can access")
+
+
+class FileIndex:
+    """Last check result per (file, ruleset), valid while mtime and size match"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, spec, stat):
+        with self._lock:
+            entry = self._entries.get((path, spec))
+            if entry is not None and entry[0] == (stat.st_mtime_ns, stat.st_size):
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, path, spec, stat, result):
+        with self._lock:
+            self._entries[(path, spec)] = ((stat.st_mtime_ns, stat.st_size), result)
+
+    def discard(self, path, spec):
+        with self._lock:
+            self._entries.pop((path, spec), None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CodemodService:
+    """Request handling, independent of the socket transport"""
+
+    def __init__(self):
+        self._rulesets = {}
+        self._lock = threading.Lock()
+        self.index = FileIndex()
+        self._scan_cache = None
+        self._scan_lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+
+    def ruleset(self, spec):
+        with self._lock:
+            ruleset = self._rulesets.get(spec)
+            if ruleset is None:
+                ruleset = rulesets.load(spec)
+                # Import modules and compile every rule up front, once
+                for rule in ruleset.rules:
+                    if rule.pattern is not None:
+                        rule.compile()
+                self._rulesets[spec] = ruleset
+            return ruleset
+
+    def check_path(self, path, spec):
+        stat = os.stat(path)
+        cached = self.index.get(path, spec, stat)
+        if cached is not None:
+            return cached
+        content = read_source(path)
+        new_content, counts = apply_rules(content, self.ruleset(spec).rules_for(path))
+        result = {
+            'path': path,
+            'changed': new_content != content,
+            'counts': {rule_id: n for rule_id, n in counts.items() if n},
+        }
+        self.index.put(path, spec, stat, result)
+        return result
+
+    def op_ping(self, request):
+        return {}
+
+    def op_apply(self, request):
+        spec = request['ruleset']
+        ruleset = self.ruleset(spec)
+        if 'content' in request:
+            # Inline content is treated as JSX unless a file name says otherwise
+            rules = ruleset.rules_for(request.get('filename', 'inline.js'))
+            new_content, counts = apply_rules(request['content'], rules)
+            return {
+                'changed': new_content != request['content'],
+                'content': new_content,
+                'counts': {rule_id: n for rule_id, n in counts.items() if n},
+            }
+        path = request['path']
+        result = self.check_path(path, spec)
+        if result['changed']:
+            content = read_source(path)
+            new_content, _ = apply_rules(content, ruleset.rules_for(path))
+            write_source(path, new_content)
+            # Rulesets are not all idempotent, so the next check recomputes
+            self.index.discard(path, spec)
+        return dict(result)
+
+    def op_check(self, request):
+        return dict(self.check_path(request['path'], request['ruleset']))
+
+    def scan(self, content):
+        # ScanCache shares one file handle, so requests take turns
+        with self._scan_lock:
+            if self._scan_cache is None:
+                from .scancache import ScanCache
+                self._scan_cache = ScanCache()
+            return self._scan_cache.scan(content)
+
+    def op_scan(self, request):
+        content = request['content'] if 'content' in request else read_source(request['path'])
+        result = self.scan(content)
+        attrs = {}
+        for index, tag, name, value_start, value_end in result.iter_attrs():
+            attrs.setdefault(tag, []).append([name, value_start, value_end])
+        return {
+            'tags': [
+                {'name': name, 'start': start, 'end': end, 'attrs': attrs.get(index, [])}
+                for index, start, end, name in result.iter_tags()
+            ],
+            'class_tokens': [[start, end] for _, start, end in result.iter_class_tokens()],
+        }
+
+    def op_query(self, request):
+        what = request.get('what')
+        if what == 'rulesets':
+            return {'rulesets': list(rulesets.RULESETS)}
+        if what == 'stats':
+            return {
+                'uptime_s': round(time.time() - self.started, 1),
+                'requests': self.requests,
+                'loaded_rulesets': sorted(self._rulesets),
+                'indexed_files': len(self.index),
+                'index_hits': self.index.hits,
+                'index_misses': self.index.misses,
+                'scan_cache_hit_rate': self._scan_cache.hit_rate if self._scan_cache else None,
+                'replacement_memo': memo.SHARED.stats(),
+            }
+        spec = request['ruleset']
+        ruleset = self.ruleset(spec)
+        files = [
+            self.check_path(path, spec)
+            for path in collect_files(request.get('paths', []), ruleset.extensions)
+        ]
+        return {'files': [f for f in files if f['changed']], 'scanned': len(files)}
+
+    def handle(self, request):
+        start = time.perf_counter()
+        self.requests += 1
+        try:
+            validate(request)
+            op = request.get('op')
+            handler = getattr(self, f'op_{op}', None) if op else None
+            if handler is None:
+                reply = {'ok': False, 'error': f"Unknown op: {op}"}
+            else:
+                reply = {'ok': True, **handler(request)}
+        except KeyError as e:
+            reply = {'ok': False, 'error': f"Missing or unknown value: {e.args[0]}"}
+        except (RequestError, OSError, UnicodeDecodeError) as e:
+            reply = {'ok': False, 'error': str(e)}
+        except Exception as e:
+            # A bug in a rule must not cost the client its reply
+            traceback.print_exc()
+            reply = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        reply['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        return reply
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                reply = {'ok': False, 'error': f"Invalid JSON: {e}"}
+            else:
+                if isinstance(request, dict) and request.get('op') == 'shutdown':
+                    self.wfile.write(b'{"ok": true}\n')
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                reply = self.server.service.handle(request)
+            self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+
+
+class CodemodServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # Editors and CI fan out many connections at once; the default of 5
+    # makes connect() fail with EAGAIN
+    request_queue_size = 128
+
+    def __init__(self, socket_path, service=None):
+        self.service = service or CodemodService()
+        super().__init__(socket_path, RequestHandler)
+
+
+def serve(socket_path=None, preload=()):
+    if not socket_path:
+        socket_path = default_socket_path()
+        private_dir(os.path.dirname(socket_path))
+    try:
+        st = os.lstat(socket_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+            raise OSError(f"{socket_path} exists and is not a socket of ours, not replacing it")
+        # A live daemon answers, a stale socket file refuses the connection
+        try:
+            request(socket_path, {'op': 'ping'})
+        except OSError:
+            os.unlink(socket_path)
+        else:
+            raise OSError(f"Daemon already running on {socket_path}")
+
+    service = CodemodService()
+    for spec in preload:
+        service.ruleset(spec)
+
+    # The socket is created 0600, there is no moment another user can connect
+    umask = os.umask(0o177)
+    try:
+        server = CodemodServer(socket_path, service)
+    finally:
+        os.umask(umask)
+    with server:
+        print(f"🚀 theme-codemod daemon listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+    print("👋 theme-codemod daemon stopped", file=sys.stderr)
+
+
+def request(socket_path, payload, timeout=30):
+    """Send one request to a running daemon and return the decoded reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as reply:
+            line = reply.readline()
+    if not line:
+        raise OSError("Daemon closed the connection without replying")
+    return json.loads(line)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Files changed according to git, with their blob ids
+
+`run --staged` (pre-commit) takes the files staged for commit and
+`run --since REF` (CI) the files changed since the merge base of REF and
+HEAD, so a typical PR touches a few dozen files instead of the tree.
+
+The blob id of each file comes from .git/index, which is read directly:
+an entry whose size and mtime still match the file on disk has the
+file's current content, so its blob id names that content and can key
+caches without reading or hashing the file. Entries git itself would
+consider racy (modified in the same second the index was written), or
+that do not match, get no id. For those the staged content can differ
+from the file on disk; read_staged() fetches it from git.
+"""
+
+import os
+import struct
+import subprocess
+
+ENTRY = struct.Struct('>10I')  # ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size
+EXTENDED = 0x4000
+STAGE = 0x3000
+NAME_MASK = 0x0fff
+
+
+class GitError(Exception):
+    pass
+
+
+def git(cwd, *args, input=None):
+    try:
+        completed = subprocess.run(['git', *args], cwd=cwd, input=input, capture_output=True)
+    except OSError as e:
+        raise GitError(f"git not available: {e}")
+    if completed.returncode:
+        message = completed.stderr.decode('utf-8', 'replace').strip()
+        raise GitError(message or f"git {args[0]} failed")
+    return completed.stdout
+
+
+def repo_root(path):
+    return os.fsdecode(git(path, 'rev-parse', '--show-toplevel').strip())
+
+
+def git_dir(root):
+    return os.path.join(root, os.fsdecode(git(root, 'rev-parse', '--git-dir').strip()))
+
+
+def _varint(data, pos):
+    """git's offset varint (index v4 path compression)"""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7f
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7f)
+    return value, pos
+
+
+def read_index(path, hash_size=20):
+    """
+    Parse a git index (versions 2 to 4), return {path: (blob id, size,
+    mtime seconds, mtime nanoseconds)} for stage 0 entries, or None when
+    it cannot be used on its own (split index, unknown version).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'DIRC':
+        return None
+    version, count = struct.unpack_from('>II', data, 4)
+    if version not in (2, 3, 4):
+        return None
+    entries = {}
+    pos = 12
+    previous = b''
+    for _ in range(count):
+        start = pos
+        fields = ENTRY.unpack_from(data, pos)
+        pos += ENTRY.size
+        blob = data[pos:pos + hash_size].hex()
+        pos += hash_size
+        flags, = struct.unpack_from('>H', data, pos)
+        pos += 2
+        if flags & EXTENDED:
+            pos += 2
+        if version == 4:
+            strip, pos = _varint(data, pos)
+            end = data.index(b'\0', pos)
+            name = previous[:len(previous) - strip] + data[pos:end]
+            pos = end + 1
+        else:
+            end = data.index(b'\0', pos)
+            name = data[pos:end]
+            # Entries are NUL padded to a multiple of 8 bytes
+            pos = start + ((end - start + 8) & ~7)
+        previous = name
+        if flags & STAGE or (fields[6] >> 12) not in (0o10, 0o12):
+            continue  # conflicts, gitlinks, sparse directories
+        entries[os.fsdecode(name)] = (blob, fields[9], fields[2], fields[3])
+    # Extensions follow the entries; a split index keeps most of them elsewhere
+    while pos + 8 <= len(data) - hash_size:
+        signature = data[pos:pos + 4]
+        size, = struct.unpack_from('>I', data, pos + 4)
+        if signature == b'link':
+            return None
+        pos += 8 + size
+    return entries
+
+
+def current_blob(entry, path, index_mtime_ns):
+    """The entry's blob id if the file on disk still has that content, else None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    blob, size, seconds, nanoseconds = entry
+    if (stat.st_size & 0xffffffff != size
+            or stat.st_mtime_ns // 1_000_000_000 & 0xffffffff != seconds
+            or stat.st_mtime_ns % 1_000_000_000 != nanoseconds):
+        return None
+    if stat.st_mtime_ns >= index_mtime_ns:
+        return None  # racily clean: same size and mtime, maybe other content
+    return blob
+
+
+def changed_files(path, staged=False, since=None):
+    """
+    Files changed in the repository containing `path`, as a list of
+    (absolute path, blob id or None). Either the files staged for
+    commit, or the files in the working tree that differ from the merge
+    base of `since` and HEAD. Deleted files are left out.
+    """
+    root = repo_root(path)
+    if staged:
+        output = git(root, 'diff', '--cached', '--name-only', '-z', '--no-renames',
+                     '--diff-filter=ACMRT')
+    else:
+        base = git(root, 'merge-base', since, 'HEAD').decode().strip()
+        output = git(root, 'diff', '--name-only', '-z', '--no-renames', '--diff-filter=ACMRT', base)
+    names = [os.fsdecode(name) for name in output.split(b'\0') if name]
+    if not names:
+        return []
+
+    index_path = os.path.join(git_dir(root), 'index')
+    try:
+        hash_size = 32 if git(root, 'rev-parse', '--show-object-format').strip() == b'sha256' else 20
+        index = read_index(index_path, hash_size)
+        index_mtime_ns = os.stat(index_path).st_mtime_ns
+    except (OSError, ValueError, IndexError, struct.error, GitError):
+        index = None
+    files = []
+    for name in names:
+        full = os.path.join(root, name)
+        if not os.path.isfile(full):
+            continue
+        entry = index.get(name) if index else None
+        files.append((full, current_blob(entry, full, index_mtime_ns) if entry else None))
+    return files
+
+
+def read_staged(paths):
+    """
+    Staged content of files in one repository, as {path: bytes}, read
+    with a single `git cat-file --batch`. Files not in the index are left
+    out.
+    """
+    if not paths:
+        return {}
+    root = repo_root(os.path.dirname(paths[0]))
+    names = [os.path.relpath(os.path.realpath(path), root) for path in paths]
+    output = git(root, 'cat-file', '--batch',
+                 input=b''.join(b':' + os.fsencode(name) + b'\n' for name in names))
+    contents = {}
+    pos = 0
+    for path in paths:
+        end = output.index(b'\n', pos)
+        header = output[pos:end].split()
+        pos = end + 1
+        if header[-1] == b'missing':
+            continue
+        size = int(header[2])
+        contents[path] = output[pos:pos + size]
+        pos += size + 1  # content is followed by a newline
+    return contents
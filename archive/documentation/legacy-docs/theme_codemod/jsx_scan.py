@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Lightweight JSX scanner
+
+Finds opening tags, their attributes and the individual className tokens
+without a full JS parser. All positions are str offsets into the scanned
+content. Anything that does not parse as a tag (`a < b`, generics) is
+skipped, so the scan is best effort but never raises.
+
+Results are flat integer tables so they can be cached compactly:
+
+  tags     (start, end, name_start, name_end)         end is after > or />
+  attrs    (tag, name_start, name_end, value_start, value_end)
+  classes  (attr, start, end)                         one row per token
+"""
+
+import re
+from array import array
+
+# Bump when the table layout or the scanning rules change
+SCANNER_VERSION = 1
+
+TAG_OPEN = re.compile(r'<([A-Za-z][\w.:-]*)')
+WHITESPACE = re.compile(r'\s*')
+ATTR_NAME = re.compile(r'[A-Za-z_$][\w$:.-]*')
+EQUALS = re.compile(r'\s*=\s*')
+DOUBLE_QUOTED = re.compile(r'"[^"]*"')
+SINGLE_QUOTED = re.compile(r"'[^']*'")
+JS_STRING = re.compile(r'"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'')
+BRACE_STOP = re.compile(r'[{}"\'`]|/\*')
+TEMPLATE_STOP = re.compile(r'`|\$\{|\\.', re.DOTALL)
+CLASS_TOKEN = re.compile(r'[^\s`]+')
+
+CLASS_ATTRS = ('className', 'class')
+
+
+def skip_braces(content, pos):
+    """Return the offset after the `}` closing the `{` at pos, or -1"""
+    depth = 0
+    n = len(content)
+    while pos < n:
+        match = BRACE_STOP.search(content, pos)
+        if match is None:
+            return -1
+        token = match.group(0)
+        pos = match.start()
+        if token == '{':
+            depth += 1
+            pos += 1
+        elif token == '}':
+            depth -= 1
+            pos += 1
+            if depth == 0:
+                return pos
+        elif token == '`':
+            pos = skip_template(content, pos)
+        elif token == '/*':
+            end = content.find('*/', pos + 2)
+            pos = -1 if end < 0 else end + 2
+        else:
+            string = JS_STRING.match(content, pos)
+            pos = string.end() if string else pos + 1
+        if pos < 0:
+            return -1
+    return -1
+
+
+def skip_template(content, pos):
+    """Return the offset after the template literal starting at pos, or -1"""
+    pos += 1
+    while True:
+        match = TEMPLATE_STOP.search(content, pos)
+        if match is None:
+            return -1
+        token = match.group(0)
+        if token == '`':
+            return match.end()
+        if token == '${':
+            pos = skip_braces(content, match.start() + 1)
+            if pos < 0:
+                return -1
+        else:
+            pos = match.end()
+
+
+def template_static_parts(content, start, end):
+    """Yield (start, end) of the literal text segments of a template literal"""
+    pos = start + 1
+    segment_start = pos
+    while pos < end - 1:
+        match = TEMPLATE_STOP.search(content, pos, end - 1)
+        if match is None:
+            break
+        if match.group(0) == '${':
+            yield segment_start, match.start()
+            pos = skip_braces(content, match.start() + 1)
+            if pos < 0:
+                return
+            segment_start = pos
+        else:
+            pos = match.end()
+    yield segment_start, end - 1
+
+
+class ScanResult:
+    """Scan tables for one piece of content"""
+
+    def __init__(self, content, tags, attrs, classes):
+        self.content = content
+        self.tags = tags
+        self.attrs = attrs
+        self.classes = classes
+
+    def iter_tags(self):
+        """Yield (index, start, end, name)"""
+        tags = self.tags
+        for i in range(0, len(tags), 4):
+            yield i // 4, tags[i], tags[i + 1], self.content[tags[i + 2]:tags[i + 3]]
+
+    def iter_attrs(self):
+        """Yield (index, tag_index, name, value_start, value_end)"""
+        attrs = self.attrs
+        for i in range(0, len(attrs), 5):
+            yield (i // 5, attrs[i], self.content[attrs[i + 1]:attrs[i + 2]],
+                   attrs[i + 3], attrs[i + 4])
+
+    def iter_class_tokens(self):
+        """Yield (attr_index, start, end)"""
+        classes = self.classes
+        for i in range(0, len(classes), 3):
+            yield classes[i], classes[i + 1], classes[i + 2]
+
+
+def _scan_class_tokens(content, attr_index, value_start, value_end, classes):
+    first = content[value_start] if value_start < value_end else ''
+    if first in '"\'':
+        parts = [(value_start + 1, value_end - 1)]
+    elif first == '{':
+        inner = WHITESPACE.match(content, value_start + 1).end()
+        if content.startswith('`', inner):
+            end = skip_template(content, inner)
+            if end < 0:
+                return
+            parts = template_static_parts(content, inner, end)
+        else:
+            string = JS_STRING.match(content, inner)
+            if string is None:
+                return
+            parts = [(string.start() + 1, string.end() - 1)]
+    else:
+        return
+    for start, end in parts:
+        for token in CLASS_TOKEN.finditer(content, start, end):
+            classes.extend((attr_index, token.start(), token.end()))
+
+
+def _scan_tag(content, match, tags, attrs, classes):
+    """Parse one opening tag into the tables, return its end or -1 if it is not one"""
+    pos = match.end()
+    n = len(content)
+    tag_index = len(tags) // 4
+    tag_attrs = array('I')
+    tag_classes = array('I')
+    attr_base = len(attrs) // 5
+    while True:
+        pos = WHITESPACE.match(content, pos).end()
+        if pos >= n:
+            return -1
+        if content.startswith('/>', pos):
+            end = pos + 2
+            break
+        char = content[pos]
+        if char == '>':
+            end = pos + 1
+            break
+        if char == '{':
+            # Spread props or a comment: skip, not an attribute
+            pos = skip_braces(content, pos)
+            if pos < 0:
+                return -1
+            continue
+        name = ATTR_NAME.match(content, pos)
+        if name is None:
+            return -1
+        pos = name.end()
+        value_start = value_end = pos
+        equals = EQUALS.match(content, pos)
+        if equals is not None:
+            value_start = equals.end()
+            if value_start >= n:
+                return -1
+            char = content[value_start]
+            if char == '"':
+                value = DOUBLE_QUOTED.match(content, value_start)
+                value_end = value.end() if value else -1
+            elif char == "'":
+                value = SINGLE_QUOTED.match(content, value_start)
+                value_end = value.end() if value else -1
+            elif char == '{':
+                value_end = skip_braces(content, value_start)
+            else:
+                return -1
+            if value_end < 0:
+                return -1
+            pos = value_end
+        attr_index = attr_base + len(tag_attrs) // 5
+        tag_attrs.extend((tag_index, name.start(), name.end(), value_start, value_end))
+        if name.group(0) in CLASS_ATTRS and value_end > value_start:
+            _scan_class_tokens(content, attr_index, value_start, value_end, tag_classes)
+    tags.extend((match.start(), end, match.start(1), match.end(1)))
+    attrs.extend(tag_attrs)
+    classes.extend(tag_classes)
+    return end
+
+
+def scan(content):
+    """Scan content and return a ScanResult"""
+    tags, attrs, classes = array('I'), array('I'), array('I')
+    pos = 0
+    while True:
+        match = TAG_OPEN.search(content, pos)
+        if match is None:
+            break
+        _scan_tag(content, match, tags, attrs, classes)
+        # Continue inside the tag too, props can hold elements: icon={<X />}
+        pos = match.end()
+    return ScanResult(content, tags, attrs, classes)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Memo for callable replacements
+
+The same form field tags appear hundreds of times across the tree, and
+rules like add_input_style rebuild the same replacement for each of
+them. Rules created with memoize=True look the output up here first,
+keyed by (rule id, matched text).
+
+The memo is a bounded LRU shared by every rule and file in the process:
+one `run`, or the daemon for its whole lifetime. Only use it for
+replacements that depend on nothing but the matched text, and patterns
+without lookarounds or anchors, whose groups could differ with context.
+
+No lock: the daemon's threads may race on recency order or the
+counters, which only costs an extra miss or an off-by-one stat.
+"""
+
+import os
+from collections import OrderedDict
+
+# THEME_CODEMOD_MEMO_SIZE=0 turns the memo off
+DEFAULT_MAX_ENTRIES = int(os.environ.get('THEME_CODEMOD_MEMO_SIZE', 4096))
+# Longer matches rarely repeat and would only push useful entries out
+DEFAULT_MAX_TEXT = 4096
+
+
+class ReplacementMemo:
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_text=DEFAULT_MAX_TEXT):
+        self.max_entries = max_entries
+        self.max_text = max_text
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def wrap(self, rule_id, func):
+        """Return a match -> str callable that serves func's results from the memo"""
+        if self.max_entries <= 0:
+            return func
+        entries = self._entries
+
+        def memoized(match):
+            text = match.group(0)
+            if len(text) > self.max_text:
+                self.misses += 1
+                return func(match)
+            key = (rule_id, text)
+            value = entries.get(key)
+            if value is not None:
+                self.hits += 1
+                try:
+                    entries.move_to_end(key)
+                except KeyError:
+                    pass  # evicted by another thread meanwhile
+                return value
+            self.misses += 1
+            value = func(match)
+            entries[key] = value
+            if len(entries) > self.max_entries:
+                try:
+                    entries.popitem(last=False)
+                    self.evictions += 1
+                except KeyError:
+                    pass
+            return value
+
+        return memoized
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hit_rate, 4),
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+SHARED = ReplacementMemo()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Structured metrics for codemod runs
+
+One RunMetrics per run, fed with the FileResults as they come in, then
+exported as
+
+- Prometheus text exposition (a textfile collector or CI artifact); the
+  file holds one run and is replaced atomically so a scraper never sees
+  half of it; THEME_CODEMOD_METRICS_DIR gives each ruleset its own file
+- one JSON object appended per run to a .jsonl log, for trend dashboards,
+  which runs of every ruleset share
+
+Metric names are prefixed `theme_codemod_` and labelled with the command
+and ruleset, so the samples of different files do not collide. Every
+value describes the last run only, so all of them are gauges: a counter
+that drops when a smaller run follows would read as a reset.
+"""
+
+import os
+import time
+
+from .cachedir import temp_path
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + '}'
+
+
+def format_value(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class RunMetrics:
+    """Counters for one run of a command over a set of files"""
+
+    def __init__(self, command, ruleset=None, workers=1):
+        self.command = command
+        self.ruleset = ruleset
+        self.workers = workers
+        self.timestamp = time.time()
+        self.wall_seconds = 0.0
+        self.busy_seconds = 0.0
+        self.files_scanned = 0
+        self.files_changed = 0
+        self.files_failed = 0
+        self.files_quarantined = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.rule_seconds = {}
+        self.rule_replacements = {}
+        self.caches = {}
+        self._start = time.perf_counter()
+
+    def add_result(self, result):
+        """Account one runner.FileResult"""
+        self.files_scanned += 1
+        self.files_changed += bool(result.changed)
+        self.files_failed += bool(result.error)
+        self.files_quarantined += bool(result.quarantined)
+        self.bytes_read += result.bytes_read
+        self.bytes_written += result.bytes_written
+        self.busy_seconds += result.seconds
+        for rule_id, seconds in result.timings.items():
+            self.rule_seconds[rule_id] = self.rule_seconds.get(rule_id, 0.0) + seconds
+        for rule_id, count in result.counts.items():
+            self.rule_replacements[rule_id] = self.rule_replacements.get(rule_id, 0) + count
+
+    def add_cache(self, name, hits, misses):
+        self.caches[name] = (hits, misses)
+
+    def finish(self):
+        self.wall_seconds = time.perf_counter() - self._start
+        return self
+
+    @property
+    def worker_utilization(self):
+        capacity = self.wall_seconds * self.workers
+        return min(self.busy_seconds / capacity, 1.0) if capacity else 0.0
+
+    def labels(self, **extra):
+        labels = {'command': self.command}
+        if self.ruleset:
+            labels['ruleset'] = self.ruleset
+        labels.update(extra)
+        return labels
+
+    def samples(self):
+        """Yield (name, type, help, labels, value) for every exported sample"""
+        base = self.labels()
+        yield 'files_scanned', 'gauge', "Files the run looked at", base, self.files_scanned
+        yield 'files_changed', 'gauge', "Files that changed (or would in --check)", base, self.files_changed
+        yield 'files_failed', 'gauge', "Files that could not be read or written", base, self.files_failed
+        yield 'files_quarantined', 'gauge', "Files skipped for running over a time budget", base, \
+            self.files_quarantined
+        yield 'bytes_read', 'gauge', "UTF-8 bytes read", base, self.bytes_read
+        yield 'bytes_written', 'gauge', "UTF-8 bytes written", base, self.bytes_written
+        yield 'run_seconds', 'gauge', "Wall time of the run", base, self.wall_seconds
+        yield 'workers', 'gauge', "Worker processes used", base, self.workers
+        yield 'worker_utilization_ratio', 'gauge', "Busy time over wall time times workers", base, \
+            self.worker_utilization
+        for rule_id in sorted(self.rule_seconds):
+            yield 'rule_seconds', 'gauge', "Time spent in each rule", \
+                self.labels(rule=rule_id), self.rule_seconds[rule_id]
+        for rule_id in sorted(self.rule_replacements):
+            yield 'rule_replacements', 'gauge', "Replacements made by each rule", \
+                self.labels(rule=rule_id), self.rule_replacements[rule_id]
+        for name in sorted(self.caches):
+            hits, misses = self.caches[name]
+            total = hits + misses
+            yield 'cache_hits', 'gauge', "Cache hits", self.labels(cache=name), hits
+            yield 'cache_misses', 'gauge', "Cache misses", self.labels(cache=name), misses
+            yield 'cache_hit_ratio', 'gauge', "Cache hits over lookups", self.labels(cache=name), \
+                hits / total if total else 0.0
+        yield 'last_run_timestamp_seconds', 'gauge', "Unix time the run started", base, self.timestamp
+
+    def to_prometheus(self):
+        lines = []
+        described = set()
+        for name, kind, help_text, labels, value in self.samples():
+            name = 'theme_codemod_' + name
+            if name not in described:
+                described.add(name)
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+            lines.append(f'{name}{format_labels(labels)} {format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+    def to_json(self):
+        return {
+            'timestamp': round(self.timestamp, 3),
+            'command': self.command,
+            'ruleset': self.ruleset,
+            'files_scanned': self.files_scanned,
+            'files_changed': self.files_changed,
+            'files_failed': self.files_failed,
+            'files_quarantined': self.files_quarantined,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'wall_seconds': round(self.wall_seconds, 6),
+            'workers': self.workers,
+            'worker_utilization': round(self.worker_utilization, 4),
+            'rule_seconds': {k: round(v, 6) for k, v in sorted(self.rule_seconds.items())},
+            'rule_replacements': dict(sorted(self.rule_replacements.items())),
+            'caches': {
+                name: {'hits': hits, 'misses': misses,
+                       'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0}
+                for name, (hits, misses) in sorted(self.caches.items())
+            },
+        }
+
+
+def write_prometheus(metrics, path):
+    """Replace `path` with the metrics in text exposition format"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = temp_path(path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(metrics.to_prometheus())
+    os.replace(tmp_path, path)
+
+
+def append_jsonl(metrics, path):
+    """Append the metrics as one JSON line to `path`"""
+    import json
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    line = json.dumps(metrics.to_json(), sort_keys=True) + '\n'
+    # One write call so concurrent CI jobs appending to the same log do not interleave
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(line)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Apple HIG dark palette and the generated color replacement table
+
+color_table.json is produced by `theme-codemod.py colors --write` (see
+colors.py) and read here with json only, so rules that use it never
+import NumPy.
+"""
+
+import json
+import math
+import os
+from functools import lru_cache
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'color_table.json')
+
+ROLES = ('background', 'text', 'border')
+
+# Neutrals each role may land on (STYLE_GUIDE.md, APPLE_HIG_COLOR_QUICK_REFERENCE.md)
+NEUTRALS = {
+    'background': ('#1C1C1E', '#2C2C2E', '#3A3A3C', '#48484A'),
+    'text': ('#FFFFFF', '#98989D', '#8E8E93', '#636366', '#48484A'),
+    'border': ('#38383A', '#48484A', '#636366'),
+}
+
+# System colors, dark variants
+ACCENTS = (
+    '#0A84FF',  # blue
+    '#30D158',  # green
+    '#5E5CE6',  # indigo
+    '#FF9F0A',  # orange
+    '#FF375F',  # pink
+    '#BF5AF2',  # purple
+    '#FF453A',  # red
+    '#40CBE0',  # teal
+    '#FFD60A',  # yellow
+    '#64D2FF',  # cyan
+    '#63E6E2',  # mint
+)
+
+# OKLab chroma above which a color counts as an accent, not a tinted gray
+CHROMA_MIN = 0.06
+# Light colors read as tinted at far lower chroma: red-100 #fee2e2 has
+# 0.031, the light grays stay under 0.02 (slate-300 #cbd5e1)
+TINT_CHROMA = 0.02
+TINT_LIGHTNESS = 0.8
+
+# sRGB (linear) -> LMS and LMS^(1/3) -> OKLab, from Björn Ottosson's OKLab
+LMS_FROM_LINEAR = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+LAB_FROM_LMS = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+
+# Tailwind v3 default palette for the families used in frontend/src
+TAILWIND = {
+    'white': '#ffffff',
+    'black': '#000000',
+}
+_SHADES = (50, 100, 200, 300, 400, 500, 600, 700, 800, 900)
+_FAMILIES = {
+    'slate': '#f8fafc #f1f5f9 #e2e8f0 #cbd5e1 #94a3b8 #64748b #475569 #334155 #1e293b #0f172a',
+    'gray': '#f9fafb #f3f4f6 #e5e7eb #d1d5db #9ca3af #6b7280 #4b5563 #374151 #1f2937 #111827',
+    'red': '#fef2f2 #fee2e2 #fecaca #fca5a5 #f87171 #ef4444 #dc2626 #b91c1c #991b1b #7f1d1d',
+    'orange': '#fff7ed #ffedd5 #fed7aa #fdba74 #fb923c #f97316 #ea580c #c2410c #9a3412 #7c2d12',
+    'amber': '#fffbeb #fef3c7 #fde68a #fcd34d #fbbf24 #f59e0b #d97706 #b45309 #92400e #78350f',
+    'yellow': '#fefce8 #fef9c3 #fef08a #fde047 #facc15 #eab308 #ca8a04 #a16207 #854d0e #713f12',
+    'green': '#f0fdf4 #dcfce7 #bbf7d0 #86efac #4ade80 #22c55e #16a34a #15803d #166534 #14532d',
+    'emerald': '#ecfdf5 #d1fae5 #a7f3d0 #6ee7b7 #34d399 #10b981 #059669 #047857 #065f46 #064e3b',
+    'cyan': '#ecfeff #cffafe #a5f3fc #67e8f9 #22d3ee #06b6d4 #0891b2 #0e7490 #155e75 #164e63',
+    'blue': '#eff6ff #dbeafe #bfdbfe #93c5fd #60a5fa #3b82f6 #2563eb #1d4ed8 #1e40af #1e3a8a',
+    'indigo': '#eef2ff #e0e7ff #c7d2fe #a5b4fc #818cf8 #6366f1 #4f46e5 #4338ca #3730a3 #312e81',
+    'purple': '#faf5ff #f3e8ff #e9d5ff #d8b4fe #c084fc #a855f7 #9333ea #7e22ce #6b21a8 #581c87',
+    'pink': '#fdf2f8 #fce7f3 #fbcfe8 #f9a8d4 #f472b6 #ec4899 #db2777 #be185d #9d174d #831843',
+}
+for _family, _values in _FAMILIES.items():
+    for _shade, _value in zip(_SHADES, _values.split()):
+        TAILWIND[f'{_family}-{_shade}'] = _value
+
+# Tailwind utility prefix -> role
+TAILWIND_ROLES = {
+    'bg': 'background',
+    'from': 'background',
+    'via': 'background',
+    'to': 'background',
+    'text': 'text',
+    'placeholder': 'text',
+    'border': 'border',
+    'divide': 'border',
+    'ring': 'border',
+    'outline': 'border',
+}
+
+
+
+def oklab(value):
+    """OKLab (L, a, b) of one '#rrggbb' color; colors.py does it in bulk"""
+    rgb = [int(value[i:i + 2], 16) / 255 for i in (1, 3, 5)]
+    linear = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in rgb]
+    lms = [sum(m * c for m, c in zip(row, linear)) ** (1 / 3) for row in LMS_FROM_LINEAR]
+    return tuple(sum(m * c for m, c in zip(row, lms)) for row in LAB_FROM_LMS)
+
+
+@lru_cache(maxsize=None)
+def is_neutral(value):
+    """True for grays, False for accents and light tints like #f8d7da"""
+    lightness, a, b = oklab(value)
+    limit = TINT_CHROMA if lightness >= TINT_LIGHTNESS else CHROMA_MIN
+    return math.hypot(a, b) <= limit
+
+
+_table = None
+
+
+def load_table():
+    """Return the generated table, or empty mappings if it was never built"""
+    global _table
+    if _table is None:
+        try:
+            with open(TABLE_PATH, 'r', encoding='utf-8') as f:
+                _table = json.load(f)
+        except (OSError, ValueError):
+            _table = {'colors': {role: {} for role in ROLES}}
+    return _table
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Worker pool with per-file and per-rule time budgets
+
+A regex that backtracks catastrophically cannot be interrupted from
+inside the process: `re` does not look at signals until the match
+returns. So every file runs in a worker process, and the parent is the
+watchdog. Each worker publishes when its current file and rule started
+in a small shared array. A worker over budget is killed and replaced,
+and its file comes back as quarantined with a diagnostic naming the
+rule. A run therefore takes at most about files * file budget / jobs.
+
+Workers never write: the parent reads each file into shared memory and
+workers return edits that the parent applies (see transport.py), so
+killing a worker cannot leave a half-written file behind.
+
+Files of split.SPLIT_SIZE bytes or more are cut into segments that
+go to different workers (see split.py); they are queued first, so the
+largest files no longer finish last. Rules that cannot run on segments
+then run on the joined file as one more task.
+
+Each worker has its own replacement memo. Replies carry the memo hits
+and misses of the task, which the parent adds to its memo's counters,
+so the run's memo stats cover the workers.
+"""
+
+import multiprocessing
+import os
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+from . import split
+from .memo import SHARED as MEMO
+from .rules import apply_rules
+from .runner import FileResult
+from .transport import (
+    SharedFile, edited, edited_size, line_edits, read_shared, start_tracker, write_edits,
+)
+
+# How often the watchdog looks at the workers when budgets are set
+TICK = 0.01
+
+# Shared progress slots: file start, rule index, rule start (time.monotonic)
+FILE_START, RULE_INDEX, RULE_START = range(3)
+
+
+def default_jobs():
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, 8))
+
+
+def transform_range(path, rules, name, start, end, on_rule=None):
+    """
+    Worker side: apply rules to bytes start:end of a shared file.
+
+    Returns (edits, counts, timings, seconds, error), edits with offsets
+    into the whole file.
+    """
+    begin = time.perf_counter()
+    timings = {}
+    try:
+        old = read_shared(name, start, end)
+        content = old.decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        return [], {}, timings, time.perf_counter() - begin, str(e)
+    new_content, counts = apply_rules(content, rules, timings, on_rule)
+    edits = line_edits(old, new_content.encode('utf-8'), start) if new_content != content else []
+    return edits, counts, timings, time.perf_counter() - begin, None
+
+
+def _worker_main(conn, progress, spec):
+    from . import rulesets
+
+    ruleset = rulesets.load(spec)
+
+    def on_rule(index, rule):
+        progress[RULE_INDEX] = index
+        progress[RULE_START] = time.monotonic()
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if task is None:
+            return
+        path, name, start, end, first, last = task
+        progress[FILE_START] = time.monotonic()
+        hits, misses = MEMO.hits, MEMO.misses
+        rules = ruleset.rules_for(path)
+        reply = transform_range(path, rules[first:last], name, start, end,
+                                lambda index, rule: on_rule(first + index, rule))
+        progress[RULE_INDEX] = -1
+        conn.send((*reply, MEMO.hits - hits, MEMO.misses - misses))
+
+
+class Worker:
+
+    def __init__(self, context, spec):
+        self.progress = context.RawArray('d', 3)
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, self.progress, spec), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task = None  # (order, path, SplitFile or None, range index or None) being processed
+        self.sent_at = 0.0
+
+    def send(self, task, name, start, end, first=0, last=None):
+        """Have the worker apply rules[first:last] to bytes start:end of shared memory `name`"""
+        self.task = task
+        # Reset here, not in the worker, so a stale rule from the last file
+        # is never charged to this one
+        self.progress[FILE_START] = 0.0
+        self.progress[RULE_INDEX] = -1
+        self.sent_at = time.monotonic()
+        self.conn.send((task[1], name, start, end, first, last))
+
+    def overrun(self, now, file_budget, rule_budget, rules):
+        """Return a diagnostic if the current file is over budget, else None"""
+        started = self.progress[FILE_START] or self.sent_at
+        index = int(self.progress[RULE_INDEX])
+        rule = rules[index].id if 0 <= index < len(rules) else None
+        if rule_budget and rule is not None and now - self.progress[RULE_START] > rule_budget:
+            return f"rule {rule} ran over its {rule_budget:g}s budget"
+        if file_budget and now - started > file_budget:
+            where = f" (in rule {rule})" if rule else ""
+            return f"file ran over its {file_budget:g}s budget{where}"
+        return None
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+
+
+def plan_split(ruleset, path, jobs, local, source=None):
+    """SplitFile for path if it is worth splitting, else None"""
+    if jobs < 2 or not split.SPLIT_SIZE:
+        return None
+    try:
+        size = os.path.getsize(path) if source is None else len(source)
+    except OSError:
+        return None
+    if size < split.SPLIT_SIZE:
+        return None
+    ext = os.path.splitext(path)[1]
+    if ext not in local:
+        local[ext] = split.local_prefix(ruleset.rules_for(path))
+    if not local[ext]:
+        return None
+    try:
+        shared = SharedFile(path, source)
+    except OSError:
+        return None  # the whole-file task reports it
+    data = shared.read()
+    points = split.split_points(data, jobs)
+    if not points:
+        shared.close()
+        return None
+    return split.SplitFile(FileResult(path), shared, data, points, local[ext])
+
+
+def run_pool(ruleset, paths, check=False, on_result=None, jobs=None,
+             file_budget=None, rule_budget=None, sources=None):
+    """
+    Process `paths` in worker processes, return FileResults in path order.
+    `sources` is as for runner.run.
+    """
+    jobs = jobs or default_jobs()
+    sources = sources or {}
+    results = [None] * len(paths)
+    if not paths:
+        return []
+    # Tasks are (order, path, SplitFile or None, range index). Ranges of
+    # split files go first, then whole files in order. A split file's
+    # remaining rules are the task (order, path, SplitFile, None).
+    pending = deque()
+    whole = []
+    local = {}  # extension -> split.local_prefix of its rules
+    shared_files = {}  # order -> SharedFile of a file in progress
+    tails = {}  # order -> SharedFile of a split file's stitched content
+    for order, path in enumerate(paths):
+        parts = plan_split(ruleset, path, jobs, local, sources.get(path))
+        if parts is None:
+            whole.append((order, path, None, None))
+        else:
+            shared_files[order] = parts.shared
+            pending.extend((order, path, parts, index) for index in range(len(parts.ranges)))
+    pending.extend(whole)
+    # Compile (and calibrate) once here so forked workers inherit it
+    for rule in ruleset.rules:
+        if rule.pattern is not None:
+            rule.compile()
+    context = multiprocessing.get_context('fork' if hasattr(os, 'fork') else 'spawn')
+    start_tracker()
+    workers = [Worker(context, ruleset.spec) for _ in range(min(jobs, len(pending)))]
+    budgets = bool(file_budget or rule_budget)
+
+    def complete(order, result):
+        for files in (shared_files, tails):
+            shared = files.pop(order, None)
+            if shared is not None:
+                shared.close()
+        results[order] = result
+        if on_result is not None:
+            on_result(result)
+
+    def dispatch(worker):
+        while pending:
+            task = order, path, parts, index = pending.popleft()
+            if parts is not None:
+                if index is None:
+                    worker.send(task, parts.tail.name, 0, parts.tail.size, parts.local)
+                else:
+                    worker.send(task, parts.shared.name, *parts.ranges[index], 0, parts.local)
+                return
+            # A split file redone whole still has its segment
+            shared = shared_files.get(order)
+            if shared is None:
+                try:
+                    shared = shared_files[order] = SharedFile(path, sources.get(path))
+                except OSError as e:
+                    result = FileResult(path)
+                    result.error = str(e)
+                    complete(order, result)
+                    continue
+            worker.send(task, shared.name, 0, shared.size)
+            return
+
+    def fail(worker, result):
+        """Finish the worker's file with result, dropping its other ranges"""
+        order, _, parts, index = worker.task
+        worker.task = None
+        if parts is not None and index is not None:
+            if parts.done:
+                return
+            parts.done = True
+            for task in [task for task in pending if task[2] is parts]:
+                pending.remove(task)
+        complete(order, result)
+
+    def finish(order, result, edits):
+        shared = shared_files[order]
+        result.bytes_read = shared.size
+        result.changed = bool(edits)
+        if edits and not check:
+            try:
+                write_edits(result.path, shared.buf, shared.size, edits)
+                result.bytes_written = edited_size(shared.size, edits)
+            except OSError as e:
+                result.error = str(e)
+        complete(order, result)
+
+    def receive(worker, reply):
+        order, path, parts, index = worker.task
+        edits, counts, timings, seconds, error, memo_hits, memo_misses = reply
+        MEMO.hits += memo_hits
+        MEMO.misses += memo_misses
+        if error is not None:
+            result = FileResult(path)
+            result.error = error
+            fail(worker, result)
+            return
+        worker.task = None
+        if parts is None:
+            result = FileResult(path)
+            result.counts = counts
+            result.timings = timings
+            result.seconds = seconds
+            finish(order, result, edits)
+            return
+        if index is None:
+            finish(order, parts.result, parts.add_tail(edits, counts, timings, seconds))
+            return
+        if parts.done or not parts.add(index, edits, counts, timings, seconds):
+            return
+        parts.done = True
+        edits = parts.stitch()
+        if edits is None:
+            # A rule looked across a cut: redo the file whole, next
+            pending.appendleft((order, path, None, None))
+            return
+        if parts.local < len(ruleset.rules_for(path)):
+            try:
+                parts.tail = tails[order] = SharedFile(
+                    path, edited(parts.shared.buf, 0, parts.shared.size, edits))
+            except OSError as e:
+                result = FileResult(path)
+                result.error = str(e)
+                complete(order, result)
+                return
+            pending.appendleft((order, path, parts, None))
+            return
+        finish(order, parts.result, edits)
+
+    try:
+        while True:
+            for worker in workers:
+                if worker.task is None:
+                    dispatch(worker)
+            busy = {worker.conn: worker for worker in workers if worker.task is not None}
+            if not busy:
+                break
+
+            for conn in wait(list(busy), TICK if budgets else None):
+                worker = busy[conn]
+                try:
+                    reply = conn.recv()
+                except (EOFError, OSError):
+                    result = FileResult(worker.task[1])
+                    result.error = f"worker died (exit code {worker.process.exitcode})"
+                    workers[workers.index(worker)] = Worker(context, ruleset.spec)
+                    worker.kill()
+                    fail(worker, result)
+                    continue
+                receive(worker, reply)
+
+            if budgets:
+                now = time.monotonic()
+                for index, worker in enumerate(workers):
+                    if worker.task is None:
+                        continue
+                    path = worker.task[1]
+                    diagnostic = worker.overrun(now, file_budget, rule_budget, ruleset.rules_for(path))
+                    if diagnostic is None:
+                        continue
+                    worker.kill()
+                    workers[index] = Worker(context, ruleset.spec)
+                    result = FileResult(path)
+                    result.quarantined = diagnostic
+                    result.seconds = now - worker.sent_at
+                    fail(worker, result)
+    finally:
+        for worker in workers:
+            if worker.task is None:
+                worker.stop()
+            else:
+                worker.kill()
+        for shared in shared_files.values():
+            shared.close()
+        for shared in tails.values():
+            shared.close()
+    return results
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Files skipped for running over their time budget
+
+An entry holds the file's size and mtime when it was quarantined, per
+ruleset, so the next run skips it only until the file is edited. The
+list lives next to the other caches as quarantine.json.
+"""
+
+import json
+import os
+import time
+
+from .cachedir import cache_path, write_json
+
+DEFAULT_PATH = cache_path('quarantine.json')
+
+
+def file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class Quarantine:
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def reason(self, path, spec):
+        """Diagnostic for path under spec if it is quarantined and unchanged"""
+        entry = self.entries.get(os.path.abspath(path), {}).get(spec)
+        if entry is None:
+            return None
+        if entry['stamp'] != file_stamp(path):
+            del self.entries[os.path.abspath(path)][spec]
+            self.dirty = True
+            return None
+        return entry['reason']
+
+    def add(self, path, spec, reason):
+        self.entries.setdefault(os.path.abspath(path), {})[spec] = {
+            'stamp': file_stamp(path),
+            'reason': reason,
+            'time': int(time.time()),
+        }
+        self.dirty = True
+
+    def items(self):
+        """Yield (path, spec, reason)"""
+        for path, specs in sorted(self.entries.items()):
+            for spec, entry in sorted(specs.items()):
+                yield path, spec, entry['reason']
+
+    def clear(self):
+        self.entries = {}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.entries = {path: specs for path, specs in self.entries.items() if specs}
+        write_json(self.path, self.entries, indent=1, sort_keys=True)
+        self.dirty = False
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Rule types used by the rulesets
+
+- Rule: regex substitution, runs on the backend picked by `backends`;
+  memoize=True serves a callable repl from the shared memo (memo.py)
+- Literal: plain str.replace for fixed multi-line blocks
+- Transform: any function content -> content (line based fixes)
+- SelectorRule (selectors.py): edits the JSX elements a selector matches
+"""
+
+import os
+import time
+
+# Force a regex backend for every rule, e.g. THEME_CODEMOD_BACKEND=re2
+PREFERRED_BACKEND = os.environ.get('THEME_CODEMOD_BACKEND')
+
+
+class Rule:
+    """Regex substitution rule"""
+
+    def __init__(self, id, pattern, repl, flags=0, description=None, memoize=False):
+        self.id = id
+        self.pattern = pattern
+        self.repl = repl
+        self.flags = flags
+        self.description = description
+        self.memoize = memoize and callable(repl)
+        self._compiled = None
+        self._repl = None
+        self.backend = None
+
+    def compile(self):
+        if self._compiled is None:
+            # Imported here so Literal/Transform-only rulesets never load it
+            from . import backends
+
+            self.backend = backends.select_backend(self.pattern, self.flags, PREFERRED_BACKEND)
+            self._compiled = self.backend.compile(self.pattern, self.flags)
+        return self._compiled
+
+    def apply(self, content):
+        """Return (new_content, number_of_replacements)"""
+        if self._repl is None:
+            self._repl = self.repl
+            if self.memoize:
+                from .memo import SHARED
+                self._repl = SHARED.wrap(self.id, self.repl)
+        return self.compile().subn(self._repl, content)
+
+    def __repr__(self):
+        return f'<Rule {self.id}>'
+
+
+class Literal:
+    """Exact text replacement, no regex involved"""
+
+    pattern = None
+
+    def __init__(self, id, old, new, description=None):
+        self.id = id
+        self.old = old
+        self.new = new
+        self.description = description
+
+    def apply(self, content):
+        count = content.count(self.old)
+        if not count:
+            return content, 0
+        return content.replace(self.old, self.new), count
+
+    def __repr__(self):
+        return f'<Literal {self.id}>'
+
+
+class Transform:
+    """Arbitrary content transform; counts one change when output differs"""
+
+    pattern = None
+
+    def __init__(self, id, func, description=None):
+        self.id = id
+        self.func = func
+        self.description = description
+
+    def apply(self, content):
+        new_content = self.func(content)
+        return new_content, int(new_content != content)
+
+    def __repr__(self):
+        return f'<Transform {self.id}>'
+
+
+def apply_rules(content, rules, timings=None, on_rule=None):
+    """
+    Run rules in order, return (content, {rule_id: replacements}).
+
+    When `timings` is a dict, the seconds spent in each rule are added to
+    it under the rule id. `on_rule(index, rule)` is called before each
+    rule runs (the pool's watchdog uses it to see which rule is running).
+    """
+    counts = {}
+    if timings is None and on_rule is None:
+        for rule in rules:
+            content, counts[rule.id] = rule.apply(content)
+        return content, counts
+    clock = time.perf_counter
+    for index, rule in enumerate(rules):
+        if on_rule is not None:
+            on_rule(index, rule)
+        start = clock()
+        content, counts[rule.id] = rule.apply(content)
+        if timings is not None:
+            timings[rule.id] = timings.get(rule.id, 0.0) + clock() - start
+    return content, counts
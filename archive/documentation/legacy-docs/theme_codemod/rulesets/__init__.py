@@ -0,0 +1,105 @@
+"""
+Rulesets ported from the legacy fix scripts
+
+One module per script (`final-dark-cleanup.py` -> `final_dark_cleanup`).
+Each module defines RULES and TARGETS, the files under frontend/src the
+script used to rewrite by default, and may set EXTENSIONS for the file
+types it applies to when given a directory.
+
+Modules are only imported when a ruleset is requested, so the CLI does
+not pay for rules it is not going to run.
+"""
+
+import importlib
+import os
+
+RULESETS = {
+    'add-input-styles': 'add_input_styles',
+    'batch-update-finance-dark': 'batch_update_finance_dark',
+    'canonicalize-classnames': 'canonicalize_classnames',
+    'comprehensive-dark-theme-fix': 'comprehensive_dark_theme_fix',
+    'comprehensive-fix-subsidiary-edit': 'comprehensive_fix_subsidiary_edit',
+    'css-dark-theme': 'css_dark_theme',
+    'dark-form-fields': 'dark_form_fields',
+    'final-dark-cleanup': 'final_dark_cleanup',
+    'fix-headings': 'fix_headings',
+    'fix-inputs-carefully': 'fix_inputs_carefully',
+    'fix-inputs-only': 'fix_inputs_only',
+    'fix-react-styles': 'fix_react_styles',
+    'fix-remaining-styles': 'fix_remaining_styles',
+    'fix-subsidiary-comprehensive': 'fix_subsidiary_comprehensive',
+    'fix-subsidiary-create': 'fix_subsidiary_create',
+    'fix-subsidiary-detail': 'fix_subsidiary_detail',
+    'fix-subsidiary-edit': 'fix_subsidiary_edit',
+    'fix-subsidiary-edit-inputs': 'fix_subsidiary_edit_inputs',
+    'fix-triple-braces': 'fix_triple_braces',
+    'safe-fix-labels-inputs': 'safe_fix_labels_inputs',
+}
+
+DEFAULT_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx')
+
+
+class Ruleset:
+    """One or more ruleset modules run in order, e.g. `fix-headings,fix-triple-braces`"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.names = [name.strip() for name in spec.split(',') if name.strip()]
+        for name in self.names:
+            if name not in RULESETS:
+                raise KeyError(name)
+        self._modules = None
+        self._rules_by_extension = {}
+
+    @property
+    def modules(self):
+        if self._modules is None:
+            self._modules = [
+                importlib.import_module(f'{__name__}.{RULESETS[name]}')
+                for name in self.names
+            ]
+        return self._modules
+
+    @property
+    def rules(self):
+        return [rule for module in self.modules for rule in module.RULES]
+
+    def rules_for(self, path):
+        """Rules of the modules whose EXTENSIONS match path, in order"""
+        ext = os.path.splitext(path)[1]
+        rules = self._rules_by_extension.get(ext)
+        if rules is None:
+            rules = [
+                rule
+                for module in self.modules
+                if ext in getattr(module, 'EXTENSIONS', DEFAULT_EXTENSIONS)
+                for rule in module.RULES
+            ]
+            self._rules_by_extension[ext] = rules
+        return rules
+
+    @property
+    def targets(self):
+        targets = []
+        for module in self.modules:
+            for target in module.TARGETS:
+                if target not in targets:
+                    targets.append(target)
+        return targets
+
+    @property
+    def extensions(self):
+        extensions = []
+        for module in self.modules:
+            for ext in getattr(module, 'EXTENSIONS', DEFAULT_EXTENSIONS):
+                if ext not in extensions:
+                    extensions.append(ext)
+        return tuple(extensions)
+
+
+def load(spec):
+    return Ruleset(spec)
+
+
+def all_rules():
+    return load(','.join(RULESETS)).rules
@@ -0,0 +1,29 @@
+"""Add dark style lines under form fields without style (add-input-styles.py)"""
+
+from ..rules import Transform
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+STYLE = 'style={{ backgroundColor: "#1C1C1E", color: "#FFFFFF" }}'
+
+
+def add_dark_style_lines(content):
+    # Line based: a style line goes right after the className line unless
+    # one of the next two lines already carries a style attribute
+    lines = content.split('\n')
+    new_lines = []
+    for i, line in enumerate(lines):
+        new_lines.append(line)
+        if ('className="w-full px-3 py-2' not in line and
+                'className={`w-full px-3 py-2' not in line):
+            continue
+        if any('style={{' in lines[j] for j in range(i, min(i + 3, len(lines)))):
+            continue
+        indent = len(line) - len(line.lstrip())
+        new_lines.append(' ' * indent + STYLE)
+    return '\n'.join(new_lines)
+
+
+RULES = [
+    Transform('add-input-styles/style-line', add_dark_style_lines),
+]
@@ -0,0 +1,37 @@
+"""Finance components dark theme batch update (batch-update-finance-dark.py)"""
+
+from ..rules import Rule
+
+TARGETS = [
+    'components/workspace/FinancialWorkspaceDashboard.js',
+    'pages/finance/components/TransactionModals.js',
+    'pages/finance/components/FinancialReportsView.js',
+    'pages/finance/components/TaxManagement.js',
+    'pages/finance/components/ProjectFinanceView.js',
+    'pages/finance/components/ChartOfAccountsView.js',
+]
+
+CARD_STYLE = 'style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A"'
+
+RULES = [
+    Rule(
+        'batch-update-finance-dark/card-xl-border',
+        r'className="bg-white rounded-xl border border-gray-200',
+        'className="rounded-xl" ' + CARD_STYLE,
+    ),
+    Rule(
+        'batch-update-finance-dark/card-lg-border',
+        r'className="bg-white rounded-lg border border-gray-200',
+        'className="rounded-lg" ' + CARD_STYLE,
+    ),
+    Rule(
+        'batch-update-finance-dark/card-lg-shadow',
+        r'className="bg-white rounded-lg shadow',
+        'className="rounded-lg shadow-lg" ' + CARD_STYLE,
+    ),
+    Rule(
+        'batch-update-finance-dark/card-xl',
+        r'className="bg-white rounded-xl',
+        'className="rounded-xl" ' + CARD_STYLE,
+    ),
+]
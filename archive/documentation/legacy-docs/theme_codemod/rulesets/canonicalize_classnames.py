@@ -0,0 +1,15 @@
+"""Canonical className strings: no duplicates, no empty attributes, stable order
+
+Meant to run after the scripts that delete classes, e.g.
+`run final-dark-cleanup,canonicalize-classnames`. See classnames.py.
+"""
+
+from ..classnames import canonicalize
+from ..rules import Transform
+
+# Only ever run on explicit paths
+TARGETS = []
+
+RULES = [
+    Transform('canonicalize-classnames/classnames', canonicalize),
+]
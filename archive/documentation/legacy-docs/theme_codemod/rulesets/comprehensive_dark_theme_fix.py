@@ -0,0 +1,178 @@
+"""Comprehensive dark theme fix for SubsidiaryEdit.js (comprehensive-dark-theme-fix.py)"""
+
+from ..rules import Literal, Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+LOADING_OLD = '''  if (loading) {
+    return (
+      <div className="min-h-screen flex items-center justify-center">
+        <div className="text-center">
+          <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600 mx-auto mb-4"></div>
+          <p className="text-gray-600">Memuat data...</p>
+        </div>
+      </div>
+    );
+  }'''
+
+LOADING_NEW = '''  if (loading) {
+    return (
+      <div className="min-h-screen flex items-center justify-center" style={{ backgroundColor: "#1C1C1E" }}>
+        <div className="text-center">
+          <div className="animate-spin rounded-full h-12 w-12 border-b-2 mx-auto mb-4" style={{ borderColor: "#0A84FF" }}></div>
+          <p style={{ color: "#98989D" }}>Memuat data...</p>
+        </div>
+      </div>
+    );
+  }'''
+
+BACK_BUTTON_OLD = '''          <button
+            onClick={() => navigate('/admin/subsidiaries')}
+            className="flex items-center text-gray-600 hover:text-gray-900 mb-4 transition-colors"
+          >
+            <ArrowLeft className="h-4 w-4 mr-2" />
+            Kembali ke Daftar
+          </button>'''
+
+BACK_BUTTON_NEW = '''          <button
+            onClick={() => navigate('/admin/subsidiaries')}
+            className="flex items-center mb-4 transition-colors"
+            style={{ color: "#98989D" }}
+            onMouseEnter={(e) => e.currentTarget.style.color = "#FFFFFF"}
+            onMouseLeave={(e) => e.currentTarget.style.color = "#98989D"}
+          >
+            <ArrowLeft className="h-4 w-4 mr-2" />
+            Kembali ke Daftar
+          </button>'''
+
+HEADER_OLD = '''              <div className="p-3 bg-blue-50 rounded-lg">
+                <Building className="h-8 w-8 text-blue-600" />
+              </div>
+              <div>
+                <h1 className="text-3xl font-bold text-gray-900">
+                  {isEditing ? 'Edit Anak Usaha' : 'Tambah Anak Usaha'}
+                </h1>
+                <p className="text-gray-600">
+                  {isEditing ? 'Perbarui informasi lengkap anak usaha' : 'Tambahkan anak usaha baru dengan informasi lengkap'}
+                </p>
+              </div>'''
+
+HEADER_NEW = '''              <div className="p-3 rounded-lg" style={{ backgroundColor: "rgba(10, 132, 255, 0.1)" }}>
+                <Building className="h-8 w-8" style={{ color: "#0A84FF" }} />
+              </div>
+              <div>
+                <h1 className="text-3xl font-bold" style={{ color: "#FFFFFF" }}>
+                  {isEditing ? 'Edit Anak Usaha' : 'Tambah Anak Usaha'}
+                </h1>
+                <p style={{ color: "#98989D" }}>
+                  {isEditing ? 'Perbarui informasi lengkap anak usaha' : 'Tambahkan anak usaha baru dengan informasi lengkap'}
+                </p>
+              </div>'''
+
+TAB_BUTTON_OLD = '''                    <button
+                      key={tab.id}
+                      type="button"
+                      onClick={() => setActiveTab(tab.id)}
+                      className={`flex items-center py-4 px-1 border-b-2 font-medium text-sm transition-colors ${
+                        activeTab === tab.id
+                          ? 'border-blue-500 text-blue-600'
+                          : 'border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
+                      }`}
+                    >
+                      <Icon className="h-4 w-4 mr-2" />
+                      {tab.label}
+                    </button>'''
+
+TAB_BUTTON_NEW = '''                    <button
+                      key={tab.id}
+                      type="button"
+                      onClick={() => setActiveTab(tab.id)}
+                      className={`flex items-center py-4 px-1 border-b-2 font-medium text-sm transition-colors ${
+                        activeTab === tab.id
+                          ? 'border-blue-500'
+                          : 'border-transparent'
+                      }`}
+                      style={{ 
+                        color: activeTab === tab.id ? '#0A84FF' : '#98989D'
+                      }}
+                      onMouseEnter={(e) => {
+                        if (activeTab !== tab.id) e.currentTarget.style.color = '#FFFFFF';
+                      }}
+                      onMouseLeave={(e) => {
+                        if (activeTab !== tab.id) e.currentTarget.style.color = '#98989D';
+                      }}
+                    >
+                      <Icon className="h-4 w-4 mr-2" />
+                      {tab.label}
+                    </button>'''
+
+SUBMIT_BUTTON_OLD = '''              <button
+                type="submit"
+                disabled={loading}
+                className="px-6 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:bg-gray-400 disabled:cursor-not-allowed transition-colors"
+              >'''
+
+SUBMIT_BUTTON_NEW = '''              <button
+                type="submit"
+                disabled={loading}
+                className="px-6 py-2 text-white rounded-lg disabled:cursor-not-allowed transition-all"
+                style={{
+                  background: loading ? '#38383A' : 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
+                  opacity: loading ? 0.5 : 1
+                }}
+              >'''
+
+INPUT_STYLE = ''' style={{
+                          backgroundColor: "#1C1C1E",
+                          border: "1px solid #38383A",
+                          color: "#FFFFFF"
+                        }}'''
+
+
+def add_input_style(match):
+    full = match.group(0)
+    if 'style={{' in full:
+        return full
+    if full.endswith('/>'):
+        return full[:-2] + INPUT_STYLE + ' />'
+    return full[:-1] + INPUT_STYLE + '>'
+
+
+RULES = [
+    Literal('comprehensive-dark-theme-fix/loading-state', LOADING_OLD, LOADING_NEW),
+    Literal(
+        'comprehensive-dark-theme-fix/page-background',
+        '<div className="min-h-screen bg-gray-50 py-8">',
+        '<div className="min-h-screen py-8" style={{ backgroundColor: "#1C1C1E" }}>',
+    ),
+    Literal('comprehensive-dark-theme-fix/back-button', BACK_BUTTON_OLD, BACK_BUTTON_NEW),
+    Literal('comprehensive-dark-theme-fix/header', HEADER_OLD, HEADER_NEW),
+    Literal(
+        'comprehensive-dark-theme-fix/tab-container',
+        '<div className="bg-white rounded-lg shadow-sm border border-gray-200 mb-8">',
+        '<div className="rounded-lg shadow-sm mb-8" style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A" }}>',
+    ),
+    Literal(
+        'comprehensive-dark-theme-fix/tab-border',
+        '<div className="border-b border-gray-200">',
+        '<div style={{ borderBottom: "1px solid #38383A" }}>',
+    ),
+    Literal('comprehensive-dark-theme-fix/tab-button', TAB_BUTTON_OLD, TAB_BUTTON_NEW),
+    Rule(
+        'comprehensive-dark-theme-fix/labels',
+        r'<label className="([^"]*) text-gray-700([^"]*)"',
+        r'<label className="\1\2" style={{ color: "#98989D" }}"',
+    ),
+    Rule('comprehensive-dark-theme-fix/input', r'<input\s+[^>]*className="w-full[^>]*/?>', add_input_style,
+         memoize=True),
+    Rule('comprehensive-dark-theme-fix/textarea', r'<textarea\s+[^>]*className="w-full[^>]*/?>', add_input_style,
+         memoize=True),
+    Rule('comprehensive-dark-theme-fix/select', r'<select\s+[^>]*className="w-full[^>]*>', add_input_style,
+         memoize=True),
+    Rule(
+        'comprehensive-dark-theme-fix/cancel-button',
+        r'<button\s+type="button"\s+onClick=\{[^}]+navigate\([^)]+\)\}\s+className="px-6 py-2 border border-gray-300 rounded-lg text-gray-700 hover:bg-gray-50[^"]*"',
+        '<button type="button" onClick={() => navigate(\'/admin/subsidiaries\')} className="px-6 py-2 rounded-lg transition-colors" style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A", color: "#FFFFFF" }}',
+    ),
+    Literal('comprehensive-dark-theme-fix/submit-button', SUBMIT_BUTTON_OLD, SUBMIT_BUTTON_NEW),
+]
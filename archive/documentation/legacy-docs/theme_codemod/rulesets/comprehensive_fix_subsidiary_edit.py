@@ -0,0 +1,52 @@
+"""Dark theme fixes for SubsidiaryEdit.js (comprehensive-fix-subsidiary-edit.py)"""
+
+import re
+
+from ..rules import Literal, Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+STYLE = 'style={{ backgroundColor: "#1C1C1E", color: "#FFFFFF" }}'
+
+
+def add_style_to_input(match):
+    full_tag = match.group(0)
+    if 'style={{' in full_tag:
+        return full_tag
+    if '/>' in full_tag:
+        return full_tag.replace('/>', STYLE + ' />')
+    if '>' in full_tag:
+        parts = full_tag.rsplit('>', 1)
+        return parts[0] + ' ' + STYLE + '>' + parts[1]
+    return full_tag
+
+
+RULES = [
+    Literal(
+        'comprehensive-fix-subsidiary-edit/loading-background',
+        'className="min-h-screen flex items-center justify-center"',
+        'className="min-h-screen flex items-center justify-center" style={{ backgroundColor: "#1C1C1E" }}',
+    ),
+    Literal(
+        'comprehensive-fix-subsidiary-edit/spinner-border',
+        'border-b-2 border-blue-600',
+        'border-b-2" style={{ borderColor: "#0A84FF" }}',
+    ),
+    Literal(
+        'comprehensive-fix-subsidiary-edit/page-background',
+        'className="min-h-screen bg-gray-800 py-8"',
+        'className="min-h-screen py-8" style={{ backgroundColor: "#1C1C1E" }}',
+    ),
+    Rule(
+        'comprehensive-fix-subsidiary-edit/bg-gray-800',
+        r'className="([^"]*?)bg-gray-800([^"]*?)"',
+        r'className="\1\2" style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A" }}',
+    ),
+    Rule(
+        'comprehensive-fix-subsidiary-edit/form-fields',
+        r'<(input|select|textarea)([^>]*className=[^>]*w-full[^>]*)(/?>)',
+        add_style_to_input,
+        re.DOTALL,
+        memoize=True,
+    ),
+]
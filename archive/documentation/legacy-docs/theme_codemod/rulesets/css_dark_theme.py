@@ -0,0 +1,89 @@
+"""Apple HIG dark colors for the per-page stylesheets
+
+Same mapping the JSX scripts inline as style={{ ... }}: light surfaces
+become #2C2C2E / #1C1C1E, dark gray text becomes white or #98989D and
+light borders become #38383A. The older hand-picked dark grays
+(#1a1a1a, #2d2d2d, #404040) are snapped to the HIG values as well.
+
+Colors without a hand-picked entry come from the generated table
+(`theme-codemod.py colors --write`); only entries for gray input colors
+are used (palette.is_neutral), so accents and status tints like the
+#f8d7da error background are left alone.
+"""
+
+from ..css import CssColorRule
+from ..palette import is_neutral, load_table
+
+EXTENSIONS = ('.css',)
+
+TARGETS = [
+    'pages/AttendanceDashboard.css',
+    'pages/AttendanceHistory.css',
+    'pages/AttendanceSettings.css',
+    'pages/AttendanceSuccess.css',
+    'pages/CameraGPSTest.css',
+    'pages/ClockInPage.css',
+    'pages/ClockOutPage.css',
+    'pages/LeaveRequestPage.css',
+    'pages/MonthlySummary.css',
+    'pages/NotificationPage.css',
+]
+
+BACKGROUND = {
+    '#ffffff': '#2C2C2E',  # bg-white cards
+    '#f9fafb': '#1C1C1E',  # bg-gray-50 page
+    '#f8f9fa': '#1C1C1E',
+    '#f3f4f6': '#1C1C1E',  # bg-gray-100
+    '#f5f5f5': '#1C1C1E',
+    '#1a1a1a': '#1C1C1E',
+    '#2d2d2d': '#2C2C2E',
+    '#404040': '#3A3A3C',
+    '#4a4a4a': '#48484A',
+    '#505050': '#48484A',
+}
+
+TEXT = {
+    '#000000': '#FFFFFF',
+    '#111827': '#FFFFFF',  # text-gray-900
+    '#1f2937': '#FFFFFF',  # text-gray-800
+    '#1a202c': '#FFFFFF',
+    '#2d3748': '#FFFFFF',
+    '#333333': '#FFFFFF',
+    '#374151': '#98989D',  # text-gray-700
+    '#4a5568': '#98989D',
+    '#4b5563': '#98989D',  # text-gray-600
+    '#666666': '#98989D',
+    '#6b7280': '#98989D',  # text-gray-500
+    '#9ca3af': '#636366',  # text-gray-400
+    '#999999': '#636366',
+    '#a0a0a0': '#98989D',
+}
+
+BORDER = {
+    '#e5e7eb': '#38383A',  # border-gray-200
+    '#e2e8f0': '#38383A',
+    '#d1d5db': '#38383A',  # border-gray-300
+    '#cbd5e0': '#38383A',
+    '#dddddd': '#38383A',
+    '#dee2e6': '#38383A',
+    '#404040': '#38383A',
+    '#505050': '#48484A',
+    '#555555': '#48484A',
+}
+
+
+def with_table(role, hand_picked):
+    generated = load_table()['colors'].get(role, {})
+    mapping = {color: dark for color, dark in generated.items()
+               if is_neutral(color) and color != dark.lower()}
+    mapping.update(hand_picked)
+    return mapping
+
+
+RULES = [
+    CssColorRule('css-dark-theme/colors', {
+        'background': (('background',), with_table('background', BACKGROUND)),
+        'text': (('color', 'fill', 'caret-color'), with_table('text', TEXT)),
+        'border': (('border', 'outline', 'stroke'), with_table('border', BORDER)),
+    }),
+]
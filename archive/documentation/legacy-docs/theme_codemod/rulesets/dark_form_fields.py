@@ -0,0 +1,23 @@
+"""Dark style on form fields that have none, written as a selector
+
+Does what fix-inputs-only does with `<(input|select|textarea)([^>]*?)(/>|>)`,
+but on real tags: a `>` inside an attribute no longer ends the match, and
+hidden inputs, checkboxes and radios are left alone.
+"""
+
+from functools import partial
+
+from ..selectors import SelectorRule, add_attribute
+
+# Only ever run on explicit paths
+TARGETS = []
+
+STYLE = 'style={{ backgroundColor: "#1C1C1E", color: "#FFFFFF" }}'
+
+SKIP = ':not([style]):not([type=hidden]):not([type=checkbox]):not([type=radio])'
+
+RULES = [
+    SelectorRule('dark-form-fields/form-fields',
+                 f'input{SKIP}, select{SKIP}, textarea{SKIP}',
+                 partial(add_attribute, text=STYLE)),
+]
@@ -0,0 +1,38 @@
+"""Final cleanup for remaining dark theme elements (final-dark-cleanup.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+WHITE_TEXT = 'style={{ color: "#FFFFFF" }}'
+
+RULES = [
+    Rule('final-dark-cleanup/drop-text-gray-900', r'text-gray-900', ''),
+    Rule(
+        'final-dark-cleanup/heading-white',
+        r'<(h3|h4) className="([^"]*)"',
+        r'<\1 className="\2" ' + WHITE_TEXT,
+    ),
+    # The lookaheads keep these rules off RE2, they fall back to re/regex
+    Rule(
+        'final-dark-cleanup/p-white',
+        r'<p className="([^"]*)"(?!.*style)',
+        r'<p className="\1" ' + WHITE_TEXT,
+    ),
+    Rule(
+        'final-dark-cleanup/span-white',
+        r'<span className="([^"]*)"(?!.*style)',
+        r'<span className="\1" ' + WHITE_TEXT,
+    ),
+    Rule('final-dark-cleanup/drop-bg-gray-50', r'bg-gray-50', ''),
+    Rule(
+        'final-dark-cleanup/rounded-dark-card',
+        r'className="([^"]*)\s*rounded-lg"',
+        r'className="\1rounded-lg" style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A" }}',
+    ),
+    Rule(
+        'final-dark-cleanup/modal-background',
+        r'<div className="bg-white rounded-lg p-6',
+        r'<div className="rounded-lg p-6" style={{ backgroundColor: "#2C2C2E"',
+    ),
+]
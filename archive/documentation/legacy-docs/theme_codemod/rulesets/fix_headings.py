@@ -0,0 +1,18 @@
+"""Fix split heading classes in SubsidiaryDetail.js (fix-headings.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryDetail.js']
+
+RULES = [
+    Rule(
+        'fix-headings/split-margin',
+        r'mb"\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}-(\d+)',
+        r'mb-\2" style={{ color: "\1" }}',
+    ),
+    Rule(
+        'fix-headings/style-before-flex',
+        r'(className="[^"]*?)"?\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s+flex\s+items-center">',
+        r'\1 flex items-center" style={{ color: "\2" }}>',
+    ),
+]
@@ -0,0 +1,47 @@
+"""Style input/select/textarea fields in SubsidiaryEdit.js (fix-inputs-carefully.py)"""
+
+import re
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+INPUT_STYLE = '''style={{
+                          backgroundColor: "#1C1C1E",
+                          border: "1px solid #38383A",
+                          color: "#FFFFFF"
+                        }}
+                        '''
+
+
+def fix_input(match):
+    full_match = match.group(0)
+    if 'style={{' in full_match:
+        return full_match
+    return full_match.replace('/>', INPUT_STYLE + '/>')
+
+
+def fix_textarea(match):
+    full_match = match.group(0)
+    if 'style={{' in full_match:
+        return full_match
+    if full_match.endswith('/>'):
+        return full_match.replace('/>', INPUT_STYLE + '/>')
+    return full_match.replace('>', INPUT_STYLE + '>')
+
+
+def fix_select(match):
+    full_match = match.group(0)
+    if 'style={{' in full_match:
+        return full_match
+    return full_match.replace('>', INPUT_STYLE + '>')
+
+
+RULES = [
+    Rule('fix-inputs-carefully/input', r'<input\s+[^>]*className="w-full[^>]*/>',
+         fix_input, re.MULTILINE, memoize=True),
+    Rule('fix-inputs-carefully/textarea', r'<textarea\s+[^>]*className="w-full[^>]*/?>',
+         fix_textarea, re.MULTILINE, memoize=True),
+    Rule('fix-inputs-carefully/select', r'<select\s+[^>]*className="w-full[^>]*>',
+         fix_select, re.MULTILINE, memoize=True),
+]
@@ -0,0 +1,22 @@
+"""Add dark style to input/select/textarea fields only (fix-inputs-only.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+STYLE = 'style={{ backgroundColor: "#1C1C1E", color: "#FFFFFF" }}'
+
+
+def add_input_style(match):
+    tag_name, tag_content, closing = match.group(1), match.group(2), match.group(3)
+    if 'style={{' in tag_content:
+        return match.group(0)
+    if closing == '/>':
+        return f'<{tag_name}{tag_content} {STYLE} />'
+    return f'<{tag_name}{tag_content} {STYLE}>'
+
+
+RULES = [
+    Rule('fix-inputs-only/form-fields', r'<(input|select|textarea)([^>]*?)(/>|>)', add_input_style,
+         memoize=True),
+]
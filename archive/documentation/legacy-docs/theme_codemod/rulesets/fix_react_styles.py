@@ -0,0 +1,24 @@
+"""Fix style={{ ... }} className patterns broken by sed (fix-react-styles.py)"""
+
+from ..rules import Rule
+
+# The legacy script took the file on the command line
+TARGETS = []
+
+RULES = [
+    Rule(
+        'fix-react-styles/style-then-padding',
+        r'style=\{\{([^}]+)\}\}\s+p-(\d+)">',
+        r'style={{\1}} className="p-\2">',
+    ),
+    Rule(
+        'fix-react-styles/border-then-padding',
+        r'border:\s*"([^"]+)"\s+p-(\d+)>',
+        r'border: "\1" }} className="p-\2">',
+    ),
+    Rule(
+        'fix-react-styles/unterminated-style',
+        r'style=\{\{\s*backgroundColor:\s*"([^"]+)",\s*border:\s*"([^"]+)"\s+p-(\d+)>',
+        r'style={{ backgroundColor: "\1", border: "\2" }} className="p-\3">',
+    ),
+]
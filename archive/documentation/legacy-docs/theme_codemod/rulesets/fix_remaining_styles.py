@@ -0,0 +1,30 @@
+"""Fix remaining bg-gray-800 and other styling issues (fix-remaining-styles.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+RULES = [
+    Rule(
+        'fix-remaining-styles/bg-gray-800',
+        r'className="([^"]*?)bg-gray-800([^"]*?)"',
+        r'className="\1\2" style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A" }}',
+    ),
+    Rule('fix-remaining-styles/drop-text-blue-600', r'text-blue-600', ''),
+    Rule(
+        'fix-remaining-styles/award-icon',
+        r'<Award className="h-4 w-4 mr-2"',
+        r'<Award className="h-4 w-4 mr-2" style={{ color: "#0A84FF" }}',
+    ),
+    Rule(
+        'fix-remaining-styles/file-icon',
+        r'<FileText className="h-4 w-4"',
+        r'<FileText className="h-4 w-4" style={{ color: "#0A84FF" }}',
+    ),
+    Rule(
+        'fix-remaining-styles/danger-hover',
+        r'className="text-red-600 hover:text-red-800"',
+        r'className="transition-colors" style={{ color: "#EF4444" }} onMouseEnter={(e) => e.currentTarget.style.color = "#DC2626"} onMouseLeave={(e) => e.currentTarget.style.color = "#EF4444"}',
+    ),
+    Rule('fix-remaining-styles/border-gray-300', r'border-gray-300', 'border-gray-700'),
+]
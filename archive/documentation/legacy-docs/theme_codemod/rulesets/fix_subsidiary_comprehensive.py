@@ -0,0 +1,28 @@
+"""Comprehensive className/style repair for SubsidiaryDetail.js (fix-subsidiary-comprehensive.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryDetail.js']
+
+RULES = [
+    Rule(
+        'fix-subsidiary-comprehensive/background-inside-classname',
+        r'className="([^"]*?)\s+style=\{\{\s*backgroundColor:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
+        r'className="\1 \3" style={{ backgroundColor: "\2" }}',
+    ),
+    Rule(
+        'fix-subsidiary-comprehensive/mouse-enter-position',
+        r'className="([^"]*?)"\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}=\{([^}]+)\}',
+        r'className="\1" style={{ color: "\2" }} onMouseEnter={\3}',
+    ),
+    Rule(
+        'fix-subsidiary-comprehensive/split-margin',
+        r'(\s+className="[^"]*?)mb"\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}-(\d+)\s+',
+        r'\1mb-\3" style={{ color: "\2" }} ',
+    ),
+    Rule(
+        'fix-subsidiary-comprehensive/rounded-background',
+        r'(rounded-lg)\s+style=\{\{\s*backgroundColor:\s*"([^"]+)"\s*\}\}">',
+        r'\1" style={{ backgroundColor: "\2" }}>',
+    ),
+]
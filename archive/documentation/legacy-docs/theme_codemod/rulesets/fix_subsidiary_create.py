@@ -0,0 +1,29 @@
+"""Fix styles embedded in className in SubsidiaryCreate.js (fix-subsidiary-create.py)"""
+
+from ..rules import Literal, Rule
+
+TARGETS = ['pages/SubsidiaryCreate.js']
+
+RULES = [
+    Rule(
+        'fix-subsidiary-create/color-inside-classname',
+        r'className="([^"]*?)\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
+        r'className="\1 \3" style={{ color: "\2" }}',
+    ),
+    Rule(
+        'fix-subsidiary-create/style-as-classname',
+        r'className="style=\{\{\s*backgroundColor:\s*"([^"]+)",\s*border:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
+        r'className="\3" style={{ backgroundColor: "\1", border: "\2" }}',
+    ),
+    Literal(
+        'fix-subsidiary-create/triple-brace-white',
+        'style={{ color: "#FFFFFF" }}}',
+        'style={{ color: "#FFFFFF" }}',
+    ),
+    Literal(
+        'fix-subsidiary-create/triple-brace-secondary',
+        'style={{ color: "#98989D" }}}',
+        'style={{ color: "#98989D" }}',
+    ),
+    Literal('fix-subsidiary-create/stray-quote', '}}">', '}}>'),
+]
@@ -0,0 +1,23 @@
+"""Fix styles embedded in className in SubsidiaryDetail.js (fix-subsidiary-detail.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryDetail.js']
+
+RULES = [
+    Rule(
+        'fix-subsidiary-detail/style-inside-classname',
+        r'className="([^"]*?)\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
+        r'className="\1 \3" style={{ color: "\2" }}',
+    ),
+    Rule(
+        'fix-subsidiary-detail/style-as-classname',
+        r'className="style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
+        r'className="\2" style={{ color: "\1" }}',
+    ),
+    Rule(
+        'fix-subsidiary-detail/class-after-style',
+        r'className="([^"]*?)"\s*style=\{\{\s*color:\s*"([^"]+)"\s*\}\}\s+(\w+)',
+        r'className="\1 \3" style={{ color: "\2" }}',
+    ),
+]
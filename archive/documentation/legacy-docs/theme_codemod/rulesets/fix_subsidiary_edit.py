@@ -0,0 +1,18 @@
+"""Move styles embedded in className out of it (fix-subsidiary-edit.py)"""
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+RULES = [
+    Rule(
+        'fix-subsidiary-edit/style-as-classname',
+        r'className="style=\{\{\s*backgroundColor:\s*"([^"]+)",\s*border:\s*"([^"]+)"\s*\}\}\s*([^"]*?)"',
+        r'className="\3" style={{ backgroundColor: "\1", border: "\2" }}',
+    ),
+    Rule(
+        'fix-subsidiary-edit/style-inside-classname',
+        r'className="([^"]*?)\s*style=\{\{([^}]+)\}\}\s*([^"]*?)"',
+        r'className="\1 \3" style={{\2}}',
+    ),
+]
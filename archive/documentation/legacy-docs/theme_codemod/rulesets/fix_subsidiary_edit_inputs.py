@@ -0,0 +1,27 @@
+"""Add dark style before trailing field attributes (fix-subsidiary-edit-inputs.py)"""
+
+import re
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+PATTERN = (
+    r'(<(?:input|select|textarea)[^>]*className="[^"]*w-full[^"]*"[^>]*)'
+    r'(\s*(?:placeholder|rows|maxLength|disabled|type|value|onChange|onBlur|id|name)[^>]*)>'
+)
+REPLACEMENT = r'\1 style={{ backgroundColor: "#1C1C1E", color: "#FFFFFF", borderColor: "#38383A" }}\2>'
+
+_pattern = re.compile(PATTERN)
+
+
+def replace_if_no_style(match):
+    full_match = match.group(0)
+    if 'style={{' in full_match:
+        return full_match
+    return _pattern.sub(REPLACEMENT, full_match)
+
+
+RULES = [
+    Rule('fix-subsidiary-edit-inputs/form-fields', PATTERN, replace_if_no_style, memoize=True),
+]
@@ -0,0 +1,17 @@
+"""Fix triple closing braces in SubsidiaryDetail.js (fix-triple-braces.py)"""
+
+from ..rules import Literal
+
+TARGETS = ['pages/SubsidiaryDetail.js']
+
+STYLES = [
+    ('white', 'style={{ color: "#FFFFFF" }}'),
+    ('secondary', 'style={{ color: "#98989D" }}'),
+    ('page-background', 'style={{ backgroundColor: "#1C1C1E" }}'),
+    ('card', 'style={{ backgroundColor: "#2C2C2E", border: "1px solid #38383A" }}'),
+]
+
+RULES = [
+    Literal(f'fix-triple-braces/{name}', style + '}', style)
+    for name, style in STYLES
+]
@@ -0,0 +1,40 @@
+"""Safe fix for labels and inputs (safe-fix-labels-inputs.py)"""
+
+import re
+
+from ..rules import Rule
+
+TARGETS = ['pages/SubsidiaryEdit.js']
+
+INPUT_STYLE = ' style={{ backgroundColor: "#1C1C1E", border: "1px solid #38383A", color: "#FFFFFF" }}'
+
+
+def fix_label(match):
+    return ('className="' + (match.group(1) or '') + (match.group(2) or '') +
+            '" style={{ color: "#98989D" }}>')
+
+
+def add_style_to_input(match):
+    tag = match.group(0)
+    if 'style={{' in tag:
+        return tag
+    if tag.endswith('/>'):
+        return tag[:-2] + INPUT_STYLE + ' />'
+    if tag.endswith('>'):
+        return tag[:-1] + INPUT_STYLE + '>'
+    return tag
+
+
+RULES = [
+    Rule('safe-fix-labels-inputs/label', r'className="([^"]*\s)?text-gray-700(\s[^"]*)?">', fix_label,
+         memoize=True),
+    Rule('safe-fix-labels-inputs/input',
+         r'<input\s+(?:[^>]*\s)?className="[^"]*w-full[^"]*"[^>]*/?>',
+         add_style_to_input, re.DOTALL, memoize=True),
+    Rule('safe-fix-labels-inputs/textarea',
+         r'<textarea\s+(?:[^>]*\s)?className="[^"]*w-full[^"]*"[^>]*/?>',
+         add_style_to_input, re.DOTALL, memoize=True),
+    Rule('safe-fix-labels-inputs/select',
+         r'<select\s+(?:[^>]*\s)?className="[^"]*w-full[^"]*"[^>]*>',
+         add_style_to_input, re.DOTALL, memoize=True),
+]
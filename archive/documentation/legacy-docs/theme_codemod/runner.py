@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Apply a ruleset to files on disk
+"""
+
+import os
+import time
+
+from .rules import apply_rules
+
+SKIP_DIRS = {'node_modules', 'build', 'dist', '.git', '__pycache__'}
+
+
+class FileResult:
+    """Outcome of running a ruleset over one file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.changed = False
+        self.counts = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.error = None
+        self.seconds = 0.0
+        self.timings = {}
+        # Diagnostic when the file was skipped for running over its budget
+        self.quarantined = None
+
+    @property
+    def replacements(self):
+        return sum(self.counts.values())
+
+
+def collect_files(paths, extensions):
+    """Expand directories into files with one of `extensions`, in a stable order"""
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+                for filename in sorted(filenames):
+                    if filename.endswith(extensions):
+                        full = os.path.join(dirpath, filename)
+                        if full not in seen:
+                            seen.add(full)
+                            yield full
+        elif path.endswith(extensions) and path not in seen:
+            seen.add(path)
+            yield path
+
+
+def read_source(path):
+    # newline='' keeps CRLF files byte-for-byte intact on write
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def write_source(path, content):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+
+
+def transform_file(path, rules, on_rule=None, source=None):
+    """
+    Apply rules to one file without writing it, return (FileResult, new
+    content or None). `source` is the file's bytes if not those on disk.
+    """
+    result = FileResult(path)
+    start = time.perf_counter()
+    new_content = None
+    try:
+        content = read_source(path) if source is None else source.decode('utf-8')
+        result.bytes_read = len(content.encode('utf-8'))
+        new_content, result.counts = apply_rules(content, rules, result.timings, on_rule)
+        result.changed = new_content != content
+    except (OSError, UnicodeDecodeError) as e:
+        result.error = str(e)
+    result.seconds = time.perf_counter() - start
+    return result, new_content if result.changed else None
+
+
+def finish_file(result, new_content, check=False):
+    """Write what transform_file produced, unless checking"""
+    if new_content is not None and not check:
+        try:
+            write_source(result.path, new_content)
+            result.bytes_written = len(new_content.encode('utf-8'))
+        except OSError as e:
+            result.error = str(e)
+    return result
+
+
+def process_file(path, rules, check=False, source=None):
+    result, new_content = transform_file(path, rules, source=source)
+    return finish_file(result, new_content, check)
+
+
+def run(ruleset, paths, check=False, on_result=None, jobs=1,
+        file_budget=None, rule_budget=None, quarantine=None, sources=None):
+    """
+    Run `ruleset` over `paths`, return the list of FileResult.
+
+    With more than one job or a time budget the files go through the
+    worker pool (pool.py), which enforces the budgets. Files listed in
+    `quarantine` are skipped with their earlier diagnostic. `sources`
+    maps paths to the bytes to use instead of the file on disk (the
+    staged content in `run --staged --check`); only pass it with check,
+    or the file is overwritten with a rewrite of that content.
+    """
+    sources = sources or {}
+    files = list(collect_files(paths, ruleset.extensions))
+    skipped = {}
+    if quarantine is not None:
+        for path in files:
+            reason = quarantine.reason(path, ruleset.spec)
+            if reason is not None:
+                result = FileResult(path)
+                result.quarantined = f"still quarantined: {reason}"
+                skipped[path] = result
+    todo = [path for path in files if path not in skipped]
+    for result in skipped.values():
+        if on_result is not None:
+            on_result(result)
+
+    if jobs > 1 or file_budget or rule_budget:
+        from .pool import run_pool
+
+        done = run_pool(ruleset, todo, check, on_result, jobs, file_budget, rule_budget, sources)
+        if quarantine is not None:
+            for result in done:
+                if result.quarantined:
+                    quarantine.add(result.path, ruleset.spec, result.quarantined)
+    else:
+        done = []
+        for path in todo:
+            result = process_file(path, ruleset.rules_for(path), check, sources.get(path))
+            done.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    by_path = {result.path: result for result in done}
+    by_path.update(skipped)
+    return [by_path[path] for path in files]
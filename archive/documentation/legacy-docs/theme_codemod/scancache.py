@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of jsx_scan results keyed by content hash
+
+Layout of the pack file (append-only):
+
+  header   b'TCSCAN' + scanner version, pack version and byte order bytes
+  record   16-byte blake2b key, uint32 payload length, uint32 CRC-32 of
+           the payload, payload
+  touch    16-byte key, uint32 TOUCH, uint32 0, no payload: the key was hit
+  payload  uint32 table lengths (tags, attrs, classes) + the three tables
+
+The in-memory index is ordered by recency: pack order on open, with
+touches moving their key to the end, then moved to the end on every hit.
+Hits are appended as touch records in batches (and on close), so the
+order survives short CLI runs. When the pack grows past `max_bytes` it
+is rewritten with the most recently used records only, in recency order
+and without touches. A record whose key or checksum does not match on
+read (pack compacted by another process, a torn write) counts as a
+miss, never as wrong data. A record cut short by a crash is truncated
+away on open, so later appends do not land behind it.
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections import OrderedDict
+
+from .cachedir import cache_path, temp_path
+from .jsx_scan import SCANNER_VERSION, ScanResult, scan
+
+DEFAULT_PATH = cache_path('scan.pack')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+PACK_VERSION = 3
+HEADER = (b'TCSCAN' + bytes([SCANNER_VERSION, PACK_VERSION]) +
+          (b'L' if sys.byteorder == 'little' else b'B'))
+RECORD = struct.Struct('<16sII')  # key, payload length, payload CRC-32
+TOUCH = 0xffffffff
+# Hits buffered before their touch records are written
+TOUCH_BATCH = 256
+TABLES = struct.Struct('<III')
+# Compaction keeps this share of max_bytes so it does not run on every put
+COMPACT_TO = 0.75
+
+
+def content_key(content):
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+
+def encode(result):
+    return (TABLES.pack(len(result.tags), len(result.attrs), len(result.classes)) +
+            result.tags.tobytes() + result.attrs.tobytes() + result.classes.tobytes())
+
+
+def decode(content, payload):
+    sizes = TABLES.unpack_from(payload)
+    tables = []
+    offset = TABLES.size
+    for size in sizes:
+        table = array('I')
+        table.frombytes(payload[offset:offset + size * table.itemsize])
+        offset += size * table.itemsize
+        tables.append(table)
+    return ScanResult(content, *tables)
+
+
+class ScanCache:
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.index = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._file = None
+        self._size = 0
+        self._touched = {}
+        self._open()
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._file = open(self.path, 'a+b')
+        self._file.seek(0)
+        if self._file.read(len(HEADER)) != HEADER:
+            # New file, other scanner version or byte order: start over
+            self._file.truncate(0)
+            self._file.write(HEADER)
+            self._file.flush()
+        self._load_index()
+
+    def _load_index(self):
+        f = self._file
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        offset = len(HEADER)
+        while offset + RECORD.size <= end:
+            f.seek(offset)
+            key, length, _ = RECORD.unpack(f.read(RECORD.size))
+            if length == TOUCH:
+                if key in self.index:
+                    self.index.move_to_end(key)
+                offset += RECORD.size
+                continue
+            if offset + RECORD.size + length > end:
+                break  # torn write at the tail
+            self.index[key] = (offset, length)
+            self.index.move_to_end(key)
+            offset += RECORD.size + length
+        if offset < end:
+            # Drop the torn record, or its length would swallow the
+            # records appended after it
+            f.truncate(offset)
+        self._size = offset
+
+    def get(self, content, key=None):
+        key = key or content_key(content)
+        location = self.index.get(key)
+        if location is not None:
+            offset, length = location
+            self._file.seek(offset)
+            record = self._file.read(RECORD.size + length)
+            if (len(record) == RECORD.size + length and record[:16] == key
+                    and RECORD.unpack_from(record)[2] == zlib.crc32(record[RECORD.size:])):
+                self.index.move_to_end(key)
+                self._touched.pop(key, None)
+                self._touched[key] = None
+                if len(self._touched) >= TOUCH_BATCH:
+                    self._write_touches()
+                self.hits += 1
+                return decode(content, record[RECORD.size:])
+            del self.index[key]
+        self.misses += 1
+        return None
+
+    def put(self, content, result, key=None):
+        key = key or content_key(content)
+        if key in self.index:
+            return
+        payload = encode(result)
+        record = RECORD.pack(key, len(payload), zlib.crc32(payload)) + payload
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        # One write per record so concurrent appenders do not interleave
+        self._file.write(record)
+        self._file.flush()
+        self.index[key] = (offset, len(payload))
+        self._size = offset + len(record)
+        if self._size > self.max_bytes:
+            self.compact()
+
+    def _write_touches(self):
+        if not self._touched:
+            return
+        self._file.seek(0, os.SEEK_END)
+        # One write, like records, so concurrent appenders do not interleave
+        self._file.write(b''.join(RECORD.pack(key, TOUCH, 0) for key in self._touched))
+        self._file.flush()
+        self._size = self._file.tell()
+        self._touched = {}
+
+    def scan(self, content):
+        """Return the cached scan of content, scanning and storing it on a miss"""
+        key = content_key(content)
+        result = self.get(content, key)
+        if result is None:
+            result = scan(content)
+            self.put(content, result, key)
+        return result
+
+    def compact(self):
+        """Rewrite the pack with the most recently used records that fit"""
+        budget = int(self.max_bytes * COMPACT_TO) - len(HEADER)
+        keep = []
+        for key in reversed(self.index):
+            offset, length = self.index[key]
+            budget -= RECORD.size + length
+            if budget < 0:
+                break
+            keep.append(key)
+
+        tmp_path = temp_path(self.path)
+        new_index = OrderedDict()
+        with open(tmp_path, 'wb') as out:
+            out.write(HEADER)
+            for key in reversed(keep):
+                offset, length = self.index[key]
+                self._file.seek(offset)
+                record = self._file.read(RECORD.size + length)
+                new_index[key] = (out.tell(), length)
+                out.write(record)
+            size = out.tell()
+        os.replace(tmp_path, self.path)
+        self._file.close()
+        self._file = open(self.path, 'a+b')
+        self.index = new_index
+        self._size = size
+        # The rewritten pack is in recency order already
+        self._touched = {}
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._write_touches()
+            except OSError:
+                pass  # losing recency is harmless
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+CSS-like selectors over JSX elements
+
+Instead of one more hand-written regex per fix, describe the elements:
+
+  input.w-full:not([style])              inputs with w-full and no style
+  select.bg-white:not([style])
+  form label > span.text-gray-700        descendant and child combinators
+  [type=password], textarea[rows]        lists, attribute presence
+  button[onClick*=handleSave]            = exact, ~= token, ^= $= *= text
+
+`.cls` matches a className token (static parts of template literals
+included), `[attr=value]` compares the attribute's value with quotes or
+a single string literal in braces removed, and anything else in braces
+as the raw expression text. `#id` is `[id=...]`.
+
+A compiled selector carries a prefilter: the literal text every match
+needs (`<input`, `w-full`, ...). Files that lack it are never scanned,
+and the scan itself comes from the scan cache when one is passed in.
+
+SelectorRule runs the same matchers as a rule in a ruleset, with an
+edit action (add_attribute, or any element -> edits function).
+"""
+
+import re
+
+from .jsx_scan import JS_STRING, scan
+
+CLOSE_TAG = re.compile(r'</([A-Za-z][\w.:-]*)\s*>')
+UNESCAPE = re.compile(r'\\(.)')
+SELECTOR_TOKEN = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comma>,)
+  | (?P<child>>)
+  | (?P<star>\*)
+  | (?P<tag>[A-Za-z][\w-]*)
+  | \.(?P<cls>(?:\\.|[^\s.#\[\]():,>\\])+)
+  | \#(?P<id>[\w-]+)
+  | \[\s*(?P<attr>[A-Za-z_$][\w$:.-]*)\s*
+       (?:(?P<op>[~^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+  | (?P<not>:not\()
+  | (?P<close>\))
+''', re.VERBOSE)
+
+
+class SelectorError(ValueError):
+    pass
+
+
+class Compound:
+    """One element test: tag, classes, attribute tests and :not(...)"""
+
+    def __init__(self):
+        self.tag = None
+        self.classes = []
+        self.attrs = []  # (name, op, value)
+        self.negated = []  # Compound
+
+    def needles(self):
+        """Literal text a file must contain for this compound to match"""
+        needles = []
+        if self.tag:
+            needles.append('<' + self.tag)
+        needles.extend(self.classes)
+        for name, op, value in self.attrs:
+            needles.append(name)
+            if op in ('=', '~=', '*=', '^=', '$=') and value:
+                needles.append(value)
+        return needles
+
+    def matches(self, element):
+        if self.tag is not None and element.name != self.tag:
+            return False
+        if self.classes:
+            tokens = element.classes
+            if any(cls not in tokens for cls in self.classes):
+                return False
+        for name, op, value in self.attrs:
+            if not element.has(name):
+                return False
+            if op is not None and not compare(element.value(name), op, value):
+                return False
+        return not any(negated.matches(element) for negated in self.negated)
+
+
+def compare(actual, op, expected):
+    if actual is None:
+        return False
+    if op == '=':
+        return actual == expected
+    if op == '~=':
+        return expected in actual.split()
+    if op == '^=':
+        return actual.startswith(expected)
+    if op == '$=':
+        return actual.endswith(expected)
+    return expected in actual  # *=
+
+
+class Selector:
+    """A compiled selector list"""
+
+    def __init__(self, source, alternatives):
+        self.source = source
+        # Each alternative: [(combinator, Compound)] left to right, the
+        # first combinator is None
+        self.alternatives = alternatives
+        self.needs_tree = any(
+            len(steps) > 1 for steps in alternatives
+        )
+        self.prefilters = [
+            sorted({needle for _, compound in steps for needle in compound.needles()}, key=len, reverse=True)
+            for steps in alternatives
+        ]
+
+    def may_match(self, content):
+        """Cheap substring test: False means no element can match"""
+        return any(all(needle in content for needle in needles) for needles in self.prefilters)
+
+    def select(self, content, result=None):
+        """Return the matching Elements of content in document order"""
+        if not self.may_match(content):
+            return []
+        elements = build_elements(content, result or scan(content), self.needs_tree)
+        return [element for element in elements if self.matches(element)]
+
+    def matches(self, element):
+        return any(_match_steps(steps, len(steps) - 1, element) for steps in self.alternatives)
+
+    def __repr__(self):
+        return f'<Selector {self.source!r}>'
+
+
+def _match_steps(steps, index, element):
+    combinator, compound = steps[index]
+    if not compound.matches(element):
+        return False
+    if index == 0:
+        return True
+    # combinator joins steps[index - 1] and this one
+    if combinator == '>':
+        parent = element.parent
+        return parent is not None and _match_steps(steps, index - 1, parent)
+    ancestor = element.parent
+    while ancestor is not None:
+        if _match_steps(steps, index - 1, ancestor):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def compile_selector(source):
+    """Parse a selector list into a Selector, raise SelectorError on bad syntax"""
+    pos = 0
+    alternatives = [[]]
+    compound = None
+    combinator = None
+    stack = []  # outer compounds while inside :not(
+    spaced = False  # whitespace after a simple selector inside :not(
+
+    def start_compound():
+        nonlocal compound, combinator
+        if compound is None:
+            compound = Compound()
+            if not stack:
+                steps = alternatives[-1]
+                joiner = None if not steps else (combinator or ' ')
+                steps.append((joiner, compound))
+            combinator = None
+        return compound
+
+    while pos < len(source):
+        match = SELECTOR_TOKEN.match(source, pos)
+        if match is None:
+            raise SelectorError(f"Unexpected {source[pos:pos + 10]!r} at {pos} in {source!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind in ('dq', 'sq', 'bare', 'op'):
+            kind = 'attr'
+        if kind == 'ws':
+            if stack:
+                spaced = compound is not None
+            else:
+                compound = None
+            continue
+        if spaced and kind != 'close':
+            raise SelectorError(f":not() takes one compound selector, no combinators, in {source!r}")
+        spaced = False
+        if kind == 'comma':
+            if stack or not alternatives[-1]:
+                raise SelectorError(f"Misplaced ',' in {source!r}")
+            alternatives.append([])
+            compound = combinator = None
+            continue
+        if kind == 'child':
+            if stack or not alternatives[-1] or combinator == '>':
+                raise SelectorError(f"Misplaced '>' in {source!r}")
+            compound = None
+            combinator = '>'
+            continue
+        if kind == 'close':
+            if not stack:
+                raise SelectorError(f"Unbalanced ')' in {source!r}")
+            inner = compound
+            compound = stack.pop()
+            if inner is None:
+                raise SelectorError(f"Empty :not() in {source!r}")
+            compound.negated.append(inner)
+            continue
+
+        if stack and compound is None:
+            compound = Compound()
+        current = start_compound() if not stack else compound
+        if kind == 'star':
+            continue
+        if kind == 'tag':
+            if current.tag is not None or current.classes or current.attrs:
+                raise SelectorError(f"Tag name must come first in {source!r}")
+            current.tag = match.group('tag')
+        elif kind == 'cls':
+            current.classes.append(UNESCAPE.sub(r'\1', match.group('cls')))
+        elif kind == 'id':
+            current.attrs.append(('id', '=', match.group('id')))
+        elif kind == 'attr':
+            value = match.group('dq')
+            if value is None:
+                value = match.group('sq')
+            if value is None:
+                value = match.group('bare')
+            current.attrs.append((match.group('attr'), match.group('op'), value))
+        elif kind == 'not':
+            stack.append(current)
+            compound = None
+    if stack:
+        raise SelectorError(f"Unclosed :not( in {source!r}")
+    if combinator is not None or not all(alternatives):
+        raise SelectorError(f"Incomplete selector {source!r}")
+    return Selector(source, alternatives)
+
+
+_compiled = {}
+
+
+def compile_cached(source):
+    selector = _compiled.get(source)
+    if selector is None:
+        selector = _compiled[source] = compile_selector(source)
+    return selector
+
+
+class Element:
+    """An opening tag from the scan, with its attributes and className tokens"""
+
+    __slots__ = ('content', 'index', 'start', 'end', 'name', 'attrs', 'classes', 'parent',
+                 'class_spans')
+
+    def __init__(self, content, index, start, end, name):
+        self.content = content
+        self.index = index
+        self.start = start
+        self.end = end
+        self.name = name
+        self.attrs = {}  # name -> (name_start, value_start, value_end)
+        self.classes = set()
+        self.class_spans = []  # (token, start, end)
+        self.parent = None
+
+    def has(self, name):
+        return name in self.attrs
+
+    def raw_value(self, name):
+        _, start, end = self.attrs[name]
+        return self.content[start:end]
+
+    def value(self, name):
+        """Attribute value without quotes, or the expression inside {...}"""
+        raw = self.raw_value(name)
+        if not raw:
+            return ''
+        if raw[0] in '"\'':
+            return raw[1:-1]
+        inner = raw[1:-1].strip()
+        if JS_STRING.fullmatch(inner):
+            return inner[1:-1]
+        return inner
+
+    @property
+    def self_closing(self):
+        return self.content.startswith('/>', self.end - 2)
+
+    @property
+    def text(self):
+        return self.content[self.start:self.end]
+
+    def position(self):
+        """1-based (line, column) of the tag"""
+        line = self.content.count('\n', 0, self.start) + 1
+        return line, self.start - self.content.rfind('\n', 0, self.start)
+
+
+def build_elements(content, result, with_parents=True):
+    elements = [Element(content, index, start, end, name)
+                for index, start, end, name in result.iter_tags()]
+    attrs = result.attrs
+    for index, tag_index, name, value_start, value_end in result.iter_attrs():
+        elements[tag_index].attrs[name] = (attrs[index * 5 + 1], value_start, value_end)
+    for attr_index, start, end in result.iter_class_tokens():
+        element = elements[attrs[attr_index * 5]]
+        token = content[start:end]
+        element.classes.add(token)
+        element.class_spans.append((token, start, end))
+    if with_parents:
+        _link_parents(content, elements)
+    return elements
+
+
+def _link_parents(content, elements):
+    events = [(element.start, 0, element) for element in elements]
+    events.extend((match.start(), 1, match.group(1)) for match in CLOSE_TAG.finditer(content))
+    events.sort(key=lambda event: (event[0], event[1]))
+    stack = []
+    for _, closing, item in events:
+        if closing:
+            for depth in range(len(stack) - 1, -1, -1):
+                if stack[depth].name == item:
+                    del stack[depth:]
+                    break
+            continue
+        item.parent = stack[-1] if stack else None
+        if not item.self_closing:
+            stack.append(item)
+
+
+# Edit action for SelectorRule, returns [(start, end, replacement)]
+
+def add_attribute(element, text):
+    """Insert `text` as the last attribute"""
+    content = element.content
+    pos = element.end - (2 if element.self_closing else 1)
+    while pos > element.start and content[pos - 1].isspace():
+        pos -= 1
+    return [(pos, pos, ' ' + text)]
+
+
+class SelectorRule:
+    """Rule that edits the elements a selector matches"""
+
+    pattern = None
+
+    def __init__(self, id, selector, action, description=None):
+        self.id = id
+        self.selector = compile_cached(selector)
+        self.action = action  # element -> [(start, end, replacement)]
+        self.description = description
+
+    def apply(self, content):
+        from .classnames import apply_edits
+
+        edits = []
+        count = 0
+        for element in self.selector.select(content):
+            element_edits = self.action(element)
+            if element_edits:
+                edits.extend(element_edits)
+                count += 1
+        if not edits:
+            return content, 0
+        return apply_edits(content, edits), count
+
+    def __repr__(self):
+        return f'<SelectorRule {self.id} {self.selector.source!r}>'
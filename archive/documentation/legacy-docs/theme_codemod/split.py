@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Splitting large files so their segments run in parallel
+
+A few page components are 40-50 KB and take longer than everything
+else a worker gets, so a pooled run ends with one busy worker. The pool
+cuts such files at top-level declarations (a line starting with
+`function`, `class`, `const`, ... optionally exported) into one segment
+per worker, runs the segments as separate tasks and joins the results.
+
+That is only the same as a whole-file run if no rule looks across a
+cut, so only rules that stay within a few lines run on segments:
+patterns that cannot match a newline (no `\s`, `\n`, negated classes
+like `[^>]`, or `.` under DOTALL), literals shorter than WINDOW_LINES
+lines and selectors without combinators. Transform rules (arbitrary
+functions, often stateful over lines), patterns anchored to the start
+or end of the file and selectors that need the element tree are not.
+Rules run in order, so the segments get the leading run of local rules
+(local_prefix) and the rest run on the joined result as one task; a
+ruleset that starts with a non-local rule is not split at all.
+
+Each cut is still checked: the WINDOW_LINES lines on either side are
+run together and separately, and the file is redone whole if the two
+differ anywhere, which catches a multi-line tag or literal that a cut
+runs through.
+"""
+
+import os
+import re
+
+from .rules import Literal, Rule, Transform
+from .selectors import SelectorRule
+from .transport import edited, line_edits
+
+# Files of at least this many bytes are split; 0 turns it off
+SPLIT_SIZE = int(os.environ.get('THEME_CODEMOD_SPLIT_SIZE') or 32768)
+
+WINDOW_LINES = 30
+
+BOUNDARY = re.compile(
+    rb'\n(?=(?:export\s+(?:default\s+)?)?(?:async\s+)?(?:function|class|const|let|var)\b)'
+)
+ESCAPE = re.compile(r'\\.')
+CHAR_CLASS = re.compile(r'\[\^?\]?[^\]]*\]')
+FILE_ANCHOR = re.compile(r'\\[AZz]')
+LINE_ANCHOR = re.compile(r'[\^$]')
+# An escape, a character class or any other character of a pattern
+PATTERN_ATOM = re.compile(r'\\.|\[\^?\]?(?:\\.|[^\]])*\]|.', re.DOTALL)
+INLINE_FLAGS = re.compile(r'\(\?([aiLmsux]+)[:)]')
+# Escapes that match a newline, in a class or on their own
+NEWLINE_ESCAPES = frozenset('nsWD')
+
+
+def matches_newline(pattern, flags=0):
+    """True when some match of pattern could contain a newline"""
+    inline = ''.join(INLINE_FLAGS.findall(pattern))
+    dotall = flags & re.DOTALL or 's' in inline
+    verbose = flags & re.VERBOSE or 'x' in inline
+    for match in PATTERN_ATOM.finditer(pattern):
+        atom = match.group(0)
+        if atom[0] == '\\':
+            if atom[1] in NEWLINE_ESCAPES:
+                return True
+        elif atom[0] == '[' and len(atom) > 1:
+            escapes = {escape[1] for escape in ESCAPE.findall(atom)}
+            names_newline = '\n' in atom or 'n' in escapes or 's' in escapes
+            if atom.startswith('[^'):
+                if not names_newline:
+                    return True
+            elif names_newline or escapes & NEWLINE_ESCAPES:
+                return True
+        elif atom == '.' and dotall or atom == '\n' and not verbose:
+            return True
+    return False
+
+
+def local_rule(rule):
+    """True when rule gives the same result on a segment as inside the file"""
+    if isinstance(rule, Literal):
+        return rule.old.count('\n') < WINDOW_LINES
+    if isinstance(rule, SelectorRule):
+        # Elements are local, their ancestors are not
+        return not rule.selector.needs_tree
+    if not isinstance(rule, Rule) or isinstance(rule, Transform):
+        return False  # Transform, CssColorRule: state carried across lines
+    pattern = rule.pattern if isinstance(rule.pattern, str) else rule.pattern.pattern
+    if FILE_ANCHOR.search(pattern) or matches_newline(pattern, rule.flags):
+        return False
+    if rule.flags & re.MULTILINE or '(?m' in pattern:
+        return True
+    # ^ and $ without MULTILINE anchor to the ends of the input
+    return not LINE_ANCHOR.search(CHAR_CLASS.sub('', ESCAPE.sub('x', pattern)))
+
+
+def local_prefix(rules):
+    """How many of the rules, from the first, can run on segments"""
+    for count, rule in enumerate(rules):
+        if not local_rule(rule):
+            return count
+    return len(rules)
+
+
+def split_points(data, parts):
+    """Byte offsets of up to parts - 1 cuts at top-level declarations, evenly spread"""
+    target = len(data) / parts
+    points = []
+    for match in BOUNDARY.finditer(data):
+        cut = match.start() + 1
+        if cut - (points[-1] if points else 0) >= target and len(data) - cut >= target / 2:
+            points.append(cut)
+            if len(points) == parts - 1:
+                break
+    return points
+
+
+def line_start_before(data, offset, lines):
+    pos = offset
+    for _ in range(lines):
+        pos = data.rfind(b'\n', 0, pos - 1) + 1
+        if pos == 0:
+            break
+    return pos
+
+
+def line_end_after(data, offset, lines):
+    pos = offset
+    for _ in range(lines):
+        pos = data.find(b'\n', pos) + 1
+        if pos == 0:
+            return len(data)
+    return pos
+
+
+class SplitFile:
+    """
+    One file cut into segments, plus the ranges that verify each cut.
+
+    `ranges` holds the byte ranges of the segments, then for every cut
+    its window, left and right half. The pool runs the first `local`
+    rules on each range as a task and hands the edits back through
+    add(); stitch() then returns the edits for the whole file, or None
+    when a cut changed the result. If there are rules after those, the
+    pool runs them on the stitched content, held in `tail`.
+    """
+
+    def __init__(self, result, shared, data, points, local, window_lines=WINDOW_LINES):
+        self.result = result  # runner.FileResult being filled in
+        self.shared = shared  # transport.SharedFile holding data
+        self.local = local
+        self.tail = None  # transport.SharedFile of the stitched content, owned by the pool
+        bounds = [0] + points + [len(data)]
+        self.ranges = list(zip(bounds, bounds[1:]))
+        self.segments = len(self.ranges)
+        for cut in points:
+            start = line_start_before(data, cut, window_lines)
+            end = line_end_after(data, cut, window_lines)
+            self.ranges.extend([(start, end), (start, cut), (cut, end)])
+        self.outputs = [None] * len(self.ranges)
+        self.remaining = len(self.ranges)
+        self.done = False
+
+    def add(self, index, edits, counts, timings, seconds):
+        """Store the edits of one range, return True when all are in"""
+        self.outputs[index] = edits
+        self.remaining -= 1
+        self.result.seconds += seconds
+        if index < self.segments:
+            self._count(counts, timings)
+        return self.remaining == 0
+
+    def add_tail(self, edits, counts, timings, seconds):
+        """Edits for the whole file, given the tail's edits of the stitched content"""
+        self.result.seconds += seconds
+        self._count(counts, timings)
+        new = edited(self.tail.buf, 0, self.tail.size, edits)
+        return line_edits(self.shared.read(), new)
+
+    def _count(self, counts, timings):
+        result = self.result
+        for rule_id, count in counts.items():
+            result.counts[rule_id] = result.counts.get(rule_id, 0) + count
+        for rule_id, spent in timings.items():
+            result.timings[rule_id] = result.timings.get(rule_id, 0.0) + spent
+
+    def stitch(self):
+        buf = self.shared.buf
+        outputs = self.outputs
+        for check in range(self.segments, len(outputs), 3):
+            (start, end), (_, cut), _ = self.ranges[check:check + 3]
+            window, left, right = outputs[check:check + 3]
+            if edited(buf, start, end, window) != edited(buf, start, cut, left) + edited(buf, cut, end, right):
+                return None
+        return [edit for edits in outputs[:self.segments] for edit in edits]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Shared-memory transport between the pool and its workers
+
+Pickling contents to a worker and the rewritten file back copies every
+file through two pipes. Instead the parent reads each file once, straight
+into a multiprocessing.shared_memory segment, and sends the worker its
+name and a byte range. The worker sends back edits, (offset, length,
+replacement) in bytes of the original, and the parent writes the file
+in one pass: slices of the segment between the replacements.
+
+Edits are found per line: same line count (the common case, most rules
+rewrite within a line) compares lines pairwise, otherwise difflib pairs
+them up. Each changed line is trimmed to the part that differs.
+"""
+
+import difflib
+import itertools
+import os
+from multiprocessing import shared_memory
+
+
+class SharedFile:
+    """A file's bytes in a shared memory segment, owned by the parent"""
+
+    def __init__(self, path, data=None):
+        self.path = path
+        if data is not None:
+            # Content given by the caller, e.g. the staged version of path
+            self.shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            self.shm.buf[:len(data)] = data
+            self.size = len(data)
+            return
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Size 0 is not a valid segment
+            self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            try:
+                view = self.shm.buf[:size]
+                try:
+                    self.size = f.readinto(view)
+                finally:
+                    view.release()
+            except BaseException:
+                self.close()
+                raise
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def buf(self):
+        return self.shm.buf
+
+    def read(self):
+        return bytes(self.shm.buf[:self.size])
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def start_tracker():
+    """
+    Start the resource tracker before workers are created, so they share
+    the parent's. Otherwise each worker attaching a segment starts its own,
+    which unlinks the segments it saw when the worker exits.
+    """
+    if os.name == 'posix':
+        from multiprocessing import resource_tracker
+
+        resource_tracker.ensure_running()
+
+
+def read_shared(name, start, end):
+    """Worker side: bytes start:end of the segment called name"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[start:end])
+    finally:
+        shm.close()
+
+
+def trimmed(offset, old, new):
+    """Edit turning old into new at offset, without their common ends"""
+    head = len(os.path.commonprefix([old, new]))
+    tail = len(os.path.commonprefix([old[head:][::-1], new[head:][::-1]]))
+    return offset + head, len(old) - head - tail, new[head:len(new) - tail]
+
+
+def line_edits(old, new, base=0):
+    """Edits turning bytes old into new, offsets shifted by base"""
+    if old == new:
+        return []
+    a = old.splitlines(keepends=True)
+    b = new.splitlines(keepends=True)
+    offsets = [0, *itertools.accumulate(map(len, a))]
+    if len(a) == len(b):
+        return [trimmed(base + offsets[i], x, y) for i, (x, y) in enumerate(zip(a, b)) if x != y]
+    edits = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            continue
+        if i2 - i1 == j2 - j1:
+            edits.extend(trimmed(base + offsets[i], a[i], b[j])
+                         for i, j in zip(range(i1, i2), range(j1, j2)) if a[i] != b[j])
+        else:
+            edits.append(trimmed(base + offsets[i1], b''.join(a[i1:i2]), b''.join(b[j1:j2])))
+    return edits
+
+
+def edited(buf, start, end, edits):
+    """Bytes start:end of buf with edits (inside that range) applied"""
+    parts = []
+    pos = start
+    for offset, length, replacement in edits:
+        parts.append(buf[pos:offset])
+        parts.append(replacement)
+        pos = offset + length
+    parts.append(buf[pos:end])
+    return b''.join(parts)
+
+
+def edited_size(size, edits):
+    return size + sum(len(replacement) - length for _, length, replacement in edits)
+
+
+def write_edits(path, buf, size, edits):
+    """Write buf[:size] with edits applied to path in one streaming pass"""
+    with open(path, 'wb') as f:
+        pos = 0
+        for offset, length, replacement in edits:
+            f.write(buf[pos:offset])
+            f.write(replacement)
+            pos = offset + length
+        f.write(buf[pos:size])